@@ -21,25 +21,179 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from .graph import \
+    Graph
+
+from .search import \
+    CliqueSearch
+
+from .instrumentation import \
+    SearchStats
+
 from .node import \
     Node, \
+    NodeView, \
+    NodeGraph, \
     expected_maximal_cliques_in_random_graph, \
+    log_expected_maximal_cliques_in_random_graph, \
     print_statistics, \
     get_degeneracy_ordering, \
+    get_core_numbers, \
+    get_k_core, \
     get_components
 
+from .summary import \
+    GraphStatistics, \
+    graph_statistics
+
 from .bron_kerbosch import \
     get_cliques_bron_kerbosch, \
     worst_case_running_time_bron_kerbosch
 
+from .bron_kerbosch_bitset import \
+    get_cliques_bron_kerbosch_bitset
+
+from .local_cliques import \
+    get_cliques_containing_node, \
+    get_cliques_containing_edge, \
+    get_cliques_containing_nodes
+
 from .kellerman import \
     get_cliques_kellerman, \
     worst_case_running_time_kellerman
 
+from .kellerman_bitset import \
+    get_cliques_kellerman_bitset
+
+from .maximum_clique import \
+    get_maximum_clique
+
+from .clique_file import \
+    CliqueFile, \
+    CliqueFileWriter, \
+    write_cliques
+
+from .clique_set import \
+    CliqueSet
+
+from .edge_list import \
+    load_edge_list, \
+    save_edge_list
+
+from .incremental import \
+    CliqueIndex
+
+from .shared_graph import \
+    SharedGraph
+
+from .parallel import \
+    get_cliques_parallel
+
+from .engines import \
+    ENGINES, \
+    BOUNDED_ENGINES, \
+    INSTRUMENTED_ENGINES
 
-def get_cliques(nodes):
+from .planner import \
+    CliquePlanner
+
+from .reduction import \
+    Reduction, \
+    get_cliques_reduced
+
+from .async_cliques import \
+    aget_cliques
+
+
+def get_cliques(nodes, engine: str = None, workers: int = None, min_size: int = 1, max_size: int = None,
+                max_cliques: int = None, deadline: float = None, planner: CliquePlanner = None,
+                stats: SearchStats = None, reduction: Reduction = None, into: CliqueSet = None):
+    """
+    Find the cliques of the graph. engine is one of the keys of ENGINES; by default the engine with the smallest
+    worst case running time is used, or with a planner, the engine the planner chooses for every component.
+    With workers > 1 the search runs on a process pool, see get_cliques_parallel.
+
+    min_size, max_size, max_cliques and deadline bound the search as described in CliqueSearch. They require one of
+    the Bron-Kerbosch engines, which then return a CliqueSearch.
+
+    stats collects the counters of SearchStats while the search runs. It requires one of INSTRUMENTED_ENGINES and
+    runs in this process.
+
+    reduction, if given, enables the reduction stage of get_cliques_reduced, which peels off the vertices whose
+    cliques are known without a search and only runs the engine on the rest, and is filled in with what was
+    eliminated. It supports neither bounds, a planner nor workers.
+
+    into, if given, is a CliqueSet of nodes that the cliques are added to as they are found; it is returned
+    instead of the cliques.
+
+    nodes can be a SharedGraph, whose block the workers then attach to without exporting the graph again.
+    """
+    if into is not None:
+        return into.extend(get_cliques(nodes, engine, workers, min_size, max_size, max_cliques, deadline, planner,
+                                       stats, reduction))
+    shared = None
+    if isinstance(nodes, SharedGraph):
+        shared = nodes
+        nodes = shared.graph
+    if engine is not None and engine not in ENGINES:
+        raise ValueError('Unknown engine {}. Expected one of {}'.format(engine, ', '.join(ENGINES)))
+    bounded = min_size > 1 or max_size is not None or max_cliques is not None or deadline is not None
+    if bounded and engine is not None and engine not in BOUNDED_ENGINES:
+        raise ValueError('Engine {} does not support bounds. Expected one of {}'.format(
+            engine, ', '.join(BOUNDED_ENGINES)))
+    if bounded and workers is not None and workers > 1:
+        raise ValueError('Bounds are not supported with workers')
+    if stats is not None:
+        if engine is not None and engine not in INSTRUMENTED_ENGINES:
+            raise ValueError('Engine {} is not instrumented. Expected one of {}'.format(
+                engine, ', '.join(INSTRUMENTED_ENGINES)))
+        if planner is not None or (workers is not None and workers > 1):
+            raise ValueError('stats is supported neither with a planner nor with workers')
+    if reduction is not None:
+        if bounded or planner is not None or (workers is not None and workers > 1):
+            raise ValueError('reduction supports neither bounds, a planner nor workers')
+        return get_cliques_reduced(nodes, engine, reduction, stats)
+    if planner is not None:
+        if engine is not None or bounded or (workers is not None and workers > 1):
+            raise ValueError('A planner chooses the engines itself and supports neither bounds nor workers')
+        return planner.get_cliques(nodes)
+    d, nodes_ordered = get_degeneracy_ordering(nodes, stats)
+    ordered_nodes = True
+    if isinstance(nodes, Graph):
+        # A graph caches its degeneracy ordering, so the engines are given the graph itself
+        nodes_ordered = nodes
+    elif isinstance(nodes, NodeGraph):
+        # So does a NodeGraph, and its components too, which the engines take from it
+        nodes_ordered = nodes
+        ordered_nodes = False
+    if engine is None:
+        engine = 'bron_kerbosch' if bounded else _get_default_engine(nodes_ordered, d)
+    if workers is not None and workers > 1:
+        return get_cliques_parallel(nodes if shared is None else shared, workers, engine)
+    if stats is not None:
+        if bounded:
+            return ENGINES[engine](nodes_ordered, ordered_nodes, min_size, max_size, max_cliques, deadline,
+                                   stats=stats)
+        return ENGINES[engine](nodes_ordered, ordered_nodes, stats=stats)
+    if bounded:
+        return ENGINES[engine](nodes_ordered, ordered_nodes, min_size, max_size, max_cliques, deadline)
+    return ENGINES[engine](nodes_ordered, ordered_nodes)
+
+
+def get_default_engine(nodes) -> str:
+    """
+    The engine get_cliques uses for an unbounded search without an engine or a planner: the one with the smallest
+    worst case running time.
+    """
+    if isinstance(nodes, SharedGraph):
+        nodes = nodes.graph
     d, nodes_ordered = get_degeneracy_ordering(nodes)
+    if isinstance(nodes, (Graph, NodeGraph)):
+        nodes_ordered = nodes
+    return _get_default_engine(nodes_ordered, d)
+
+
+def _get_default_engine(nodes_ordered, d: int) -> str:
     if worst_case_running_time_bron_kerbosch(nodes_ordered, d) < worst_case_running_time_kellerman(nodes_ordered):
-        return get_cliques_bron_kerbosch(nodes_ordered, True)
-    else:
-        return get_cliques_kellerman(nodes_ordered, True)
+        return 'bron_kerbosch'
+    return 'kellerman'
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from math import inf
+from time import monotonic
+from .engines import BOUNDED_ENGINES
+from .search import CliqueSearch
+from .instrumentation import SearchStats
+
+# The number of cliques the worker may run ahead of the consumer by default
+MAX_QUEUED = 1024
+# The cliques are handed to the loop in batches of up to BATCH_SIZE, or whatever was found in BATCH_SECONDS,
+# since waking the loop for every clique costs more than finding it
+BATCH_SIZE = 64
+BATCH_SECONDS = 0.01
+
+_END = object()
+
+
+class _Failure:
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+async def aget_cliques(nodes, engine: str = None, workers: int = None, min_size: int = 1, max_size: int = None,
+                       max_cliques: int = None, deadline: float = None, planner=None, stats: SearchStats = None,
+                       max_queued: int = MAX_QUEUED, executor=None):
+    """
+    Async iterator over the cliques of get_cliques, for event loop services. The search runs on executor, a
+    ThreadPoolExecutor, or the default executor of the loop if None, and never on the loop itself. It hands the
+    cliques to the loop within the process, so pass workers > 1 rather than a process pool to search on several
+    processes. It pauses whenever about max_queued cliques wait for the consumer, so a slow consumer holds back the
+    search instead of the memory growing.
+
+    The other arguments are those of get_cliques. When the iteration ends early, by aclose (contextlib.aclosing
+    calls it after a break) or by cancelling the task, the search is cancelled too. The engine is chosen as
+    get_cliques chooses it. The Bron-Kerbosch engines stop at their next branch; the other engines, a planner and
+    workers > 1 stop at the next clique they produce. Either way the iterator only returns once the search has
+    stopped, so the executor thread is free again.
+
+    The cliques reach the loop in batches of up to BATCH_SIZE, so a clique can wait until a batch is full or
+    BATCH_SECONDS have passed when the next clique is found.
+    """
+    if max_queued < 1:
+        raise ValueError('max_queued must be at least 1, received {}'.format(max_queued))
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise ValueError('executor must be a ThreadPoolExecutor, received {}. Pass workers > 1 to search on a '
+                         'process pool'.format(type(executor).__name__))
+    from . import get_cliques, get_default_engine
+    bounded = min_size > 1 or max_size is not None or max_cliques is not None or deadline is not None
+    in_process = planner is None and (workers is None or workers <= 1)
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    batch_size = min(BATCH_SIZE, max_queued)
+    slots = threading.Semaphore(max_queued // batch_size)
+    cancelled = threading.Event()
+    searches = []
+
+    def produce():
+        try:
+            (search_engine, search_deadline) = (engine, deadline)
+            if in_process:
+                if search_engine is None:
+                    search_engine = 'bron_kerbosch' if bounded else get_default_engine(nodes)
+                if search_deadline is None and search_engine in BOUNDED_ENGINES:
+                    # Never expires, but has the engine check for cancel
+                    search_deadline = inf
+            cliques = get_cliques(nodes, search_engine, workers, min_size, max_size, max_cliques, search_deadline,
+                                  planner, stats)
+            if isinstance(cliques, CliqueSearch):
+                searches.append(cliques)
+            cliques = iter(cliques)
+            batch = []
+            try:
+                while not cancelled.is_set():
+                    clique = next(cliques, _END)
+                    if clique is _END:
+                        break
+                    if len(batch) == 0:
+                        batch_end = monotonic() + BATCH_SECONDS
+                    batch.append(clique)
+                    if len(batch) == batch_size or monotonic() >= batch_end:
+                        slots.acquire()
+                        loop.call_soon_threadsafe(queue.put_nowait, batch)
+                        batch = []
+                if len(batch) > 0 and not cancelled.is_set():
+                    loop.call_soon_threadsafe(queue.put_nowait, batch)
+            finally:
+                close = getattr(cliques, 'close', None)
+                if close is not None:
+                    close()
+            loop.call_soon_threadsafe(queue.put_nowait, _END)
+        except BaseException as exception:
+            loop.call_soon_threadsafe(queue.put_nowait, _Failure(exception))
+
+    future = loop.run_in_executor(executor, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            if isinstance(item, _Failure):
+                raise item.exception
+            slots.release()
+            for clique in item:
+                yield clique
+    finally:
+        cancelled.set()
+        for search in searches:
+            search.cancel()
+        # Wake the worker if it waits for a slot, so it sees that the search was cancelled
+        slots.release()
+        await asyncio.shield(future)
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from time import perf_counter
+from . import Graph, expected_maximal_cliques_in_random_graph, get_cliques, get_components, get_degeneracy_ordering
+from .engines import ENGINES
+from .bron_kerbosch import PIVOT_RULES, get_cliques_bron_kerbosch
+from .generators import get_random_graph, get_power_law_graph, get_moon_moser_graph, get_moon_moser_cliques, \
+    get_disjoint_union, load_dimacs
+from .summary import get_density
+
+# name -> (function creating the graph, known number of maximal cliques or None)
+DEFAULT_SUITE = {
+    'gnp-2000-0.005': (lambda: get_random_graph(2000, 0.005, seed=1), None),
+    'gnp-300-0.1': (lambda: get_random_graph(300, 0.1, seed=2), None),
+    'gnp-120-0.5': (lambda: get_random_graph(120, 0.5, seed=3), None),
+    'power-law-3000-4': (lambda: get_power_law_graph(3000, 4, seed=4), None),
+    'moon-moser-27': (lambda: get_moon_moser_graph(27), get_moon_moser_cliques(27)),
+    'union-200x10-0.4': (lambda: get_disjoint_union(*(get_random_graph(10, 0.4, seed=i) for i in range(200))), None)
+}
+SMALL_SUITE = {
+    'gnp-60-0.2': (lambda: get_random_graph(60, 0.2, seed=1), None),
+    'moon-moser-9': (lambda: get_moon_moser_graph(9), get_moon_moser_cliques(9)),
+    'union-10x6-0.5': (lambda: get_disjoint_union(*(get_random_graph(6, 0.5, seed=i) for i in range(10))), None)
+}
+
+
+def _count(iterable) -> int:
+    count = 0
+    for _ in iterable:
+        count += 1
+    return count
+
+
+def _uncached(nodes):
+    # A Graph caches its degeneracy ordering, so every timed run gets a fresh one
+    if isinstance(nodes, Graph):
+        return Graph(nodes.offsets, nodes.neighbours, nodes.names)
+    return nodes
+
+
+def measure(function, repeat: int = 1, memory: bool = True) -> {str: float}:
+    """
+    Best wall time of repeat runs of function, and the peak memory traced by tracemalloc in a separate run, so
+    tracing does not slow down the timed runs. function returns the number of cliques found, or None.
+    """
+    seconds = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function()
+        seconds = min(seconds, perf_counter() - start)
+    measurement = {'seconds': seconds}
+    if result is not None:
+        measurement['cliques'] = result
+    if memory:
+        tracemalloc.start()
+        try:
+            function()
+            measurement['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return measurement
+
+
+def run_benchmark(nodes, engines=None, repeat: int = 1, memory: bool = True, expected_cliques: int = None,
+                  pivots=None) -> dict:
+    """
+    Benchmark degeneracy ordering, components, the clique engines and get_cliques on a graph, on both the Node list
+    and its Graph. Bron-Kerbosch is also run with every pivot rule in pivots, as bron_kerbosch:<rule>; by default
+    all the rules but tomita, which the bron_kerbosch engine uses.
+    """
+    engines = tuple(ENGINES) if engines is None else tuple(engines)
+    pivots = tuple(pivot for pivot in PIVOT_RULES if pivot != 'tomita') if pivots is None else tuple(pivots)
+    graph = Graph.from_nodes(nodes)
+    size = len(graph)
+    edges = graph.number_of_edges
+    density = get_density(size, edges)
+    d, _ = get_degeneracy_ordering(nodes)
+    result = {
+        'nodes': size,
+        'edges': edges,
+        'density': density,
+        'degeneracy': d,
+        'components': len(get_components(nodes)),
+        'expected_maximal_cliques': expected_maximal_cliques_in_random_graph(size, density),
+        'steps': {}
+    }
+    if expected_cliques is not None:
+        result['known_maximal_cliques'] = expected_cliques
+    steps = result['steps']
+    for (name, target) in (('nodes', nodes), ('graph', graph)):
+        steps['degeneracy_ordering/' + name] = measure(
+            lambda: get_degeneracy_ordering(_uncached(target))[0] and None, repeat, memory)
+        steps['components/' + name] = measure(lambda: get_components(target) and None, repeat, memory)
+        for engine in engines:
+            steps[engine + '/' + name] = measure(lambda: _count(ENGINES[engine](_uncached(target))), repeat, memory)
+        for pivot in pivots:
+            steps['bron_kerbosch:' + pivot + '/' + name] = measure(
+                lambda: _count(get_cliques_bron_kerbosch(_uncached(target), pivot=pivot)), repeat, memory)
+        steps['get_cliques/' + name] = measure(lambda: _count(get_cliques(_uncached(target))), repeat, memory)
+    return result
+
+
+def run_benchmarks(suite: dict = None, engines=None, repeat: int = 1, memory: bool = True, log=None,
+                   pivots=None) -> dict:
+    suite = DEFAULT_SUITE if suite is None else suite
+    results = {
+        'host': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'processor': platform.processor()
+        },
+        'graphs': {}
+    }
+    for (name, (create, expected_cliques)) in suite.items():
+        if log is not None:
+            log('Benchmarking {}'.format(name))
+        results['graphs'][name] = run_benchmark(create(), engines, repeat, memory, expected_cliques, pivots)
+    return results
+
+
+def load_graph_suite(paths: [str]) -> dict:
+    """
+    A suite of the DIMACS graphs in paths, named by their path.
+    """
+    return {path: ((lambda p: lambda: load_dimacs(p))(path), None) for path in paths}
+
+
+def save_results(results: dict, path: str):
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare_results(baseline: dict, results: dict) -> [(str, str, float, float)]:
+    """
+    (graph, step, baseline seconds, seconds) for every step measured in both runs.
+    """
+    comparison = []
+    for (name, graph) in sorted(results['graphs'].items()):
+        baseline_graph = baseline['graphs'].get(name)
+        if baseline_graph is None:
+            continue
+        for (step, measurement) in sorted(graph['steps'].items()):
+            baseline_measurement = baseline_graph['steps'].get(step)
+            if baseline_measurement is not None:
+                comparison.append((name, step, baseline_measurement['seconds'], measurement['seconds']))
+    return comparison
+
+
+def format_results(results: dict) -> str:
+    lines = []
+    for (name, graph) in sorted(results['graphs'].items()):
+        lines.append('{}: {} nodes, {} edges, density {:.4f}, degeneracy {}, {} components'.format(
+            name, graph['nodes'], graph['edges'], graph['density'], graph['degeneracy'], graph['components']))
+        lines.append('  Expected maximal cliques in random graph: {:.4g}'.format(graph['expected_maximal_cliques']))
+        if 'known_maximal_cliques' in graph:
+            lines.append('  Known maximal cliques: {}'.format(graph['known_maximal_cliques']))
+        for (step, measurement) in sorted(graph['steps'].items()):
+            lines.append('  {:36} {:10.4f} s {:>12} {:>14}'.format(
+                step, measurement['seconds'],
+                '{} cliques'.format(measurement['cliques']) if 'cliques' in measurement else '',
+                '{:.1f} KiB'.format(measurement['peak_bytes'] / 2 ** 10) if 'peak_bytes' in measurement else ''))
+    return '\n'.join(lines)
+
+
+def format_comparison(comparison: [(str, str, float, float)]) -> str:
+    return '\n'.join('{:24} {:36} {:10.4f} s -> {:10.4f} s  x{:.2f}'.format(
+        name, step, before, after, after / before if before > 0 else float('inf'))
+        for (name, step, before, after) in comparison)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='Benchmark the clique algorithms of graph_algorithms')
+    parser.add_argument('dimacs', nargs='*', help='DIMACS graphs to benchmark instead of the generated suite')
+    parser.add_argument('--small', action='store_true', help='run the small generated suite')
+    parser.add_argument('--engine', action='append', choices=sorted(ENGINES), help='engines to benchmark')
+    parser.add_argument('--pivot', action='append', choices=sorted(PIVOT_RULES),
+                        help='pivot rules to benchmark Bron-Kerbosch with')
+    parser.add_argument('--repeat', type=int, default=1, help='timed runs per step, the best is kept')
+    parser.add_argument('--no-memory', action='store_true', help='skip the peak memory runs')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare with')
+    arguments = parser.parse_args(arguments)
+    if len(arguments.dimacs) > 0:
+        suite = load_graph_suite(arguments.dimacs)
+    else:
+        suite = SMALL_SUITE if arguments.small else DEFAULT_SUITE
+    results = run_benchmarks(suite, arguments.engine, arguments.repeat, not arguments.no_memory,
+                             lambda message: print(message, file=sys.stderr), arguments.pivot)
+    print(format_results(results))
+    if arguments.output:
+        save_results(results, arguments.output)
+    if arguments.compare:
+        print()
+        print(format_comparison(compare_results(load_results(arguments.compare), results)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+if hasattr(int, 'bit_count'):
+    popcount = int.bit_count
+else:
+    def popcount(value: int) -> int:
+        return bin(value).count('1')
+
+
+def iterate_bits(value: int):
+    """
+    The positions of the set bits of value in increasing order.
+    """
+    while value:
+        lowest = value & -value
+        value ^= lowest
+        yield lowest.bit_length() - 1
+
+
+def to_bitset(positions, size: int) -> int:
+    """
+    The bitset with the given positions set, built in O(size / 8 + len(positions)).
+    """
+    bits = bytearray((size + 7) // 8)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def get_local_rows(vertices: list, adjacent_of) -> [int]:
+    """
+    rows[i] is the bitset of the neighbours of vertices[i] among vertices, by their positions in vertices.
+    """
+    local = {u: i for (i, u) in enumerate(vertices)}
+    rows = []
+    for u in vertices:
+        row = 0
+        for w in adjacent_of(u):
+            j = local.get(w)
+            if j is not None:
+                row |= 1 << j
+        rows.append(row)
+    return rows
@@ -23,43 +23,290 @@
 
 
 from typing import Set
+from heapq import nsmallest
 from math import pow
-from . import Node, get_degeneracy_ordering
+from time import perf_counter
+from . import Graph, Node, get_components, get_degeneracy_ordering
+from .graph import get_ranks, order_components
+from .search import CliqueSearch
+from .instrumentation import SearchStats
 
+# The number of vertices of P and X the sampled pivot rule evaluates
+PIVOT_SAMPLE_SIZE = 8
+# The hybrid pivot rule branches on all of P without choosing a pivot up to this size of P
+SMALL_CANDIDATES = 3
 
-def get_cliques_bron_kerbosch(nodes, ordered_nodes=False):
+
+def get_cliques_bron_kerbosch(nodes, ordered_nodes=False, min_size: int = 1, max_size: int = None,
+                              max_cliques: int = None, deadline: float = None,
+                              stats: SearchStats = None, pivot: str = 'tomita') -> CliqueSearch:
+    """
+    The maximal cliques of the graph, with the bounds and the budget of CliqueSearch. stats, if given, counts the
+    work of the search as it runs and times every component. pivot is one of the keys of PIVOT_RULES.
+    """
+    rule = _get_pivot_rule(pivot)
+    search = CliqueSearch(min_size, max_size, max_cliques, deadline)
+    return search.run(_get_cliques_bron_kerbosch(nodes, ordered_nodes, search if search.is_pruning else None, stats,
+                                                 rule))
+
+
+def _get_cliques_bron_kerbosch(nodes, ordered_nodes, search: CliqueSearch = None, stats: SearchStats = None,
+                               rule=None):
+    if isinstance(nodes, Graph):
+        for clique in _get_cliques_bron_kerbosch_graph(nodes, search, stats, rule):
+            yield clique
+        return
     p = set(nodes)
-    r = set()
     x = set()
     if ordered_nodes:
         nodes_ordered = nodes
     else:
-        _, nodes_ordered = get_degeneracy_ordering(nodes)
-    for v in nodes_ordered:
-        for clique in bron_kerbosch(r | {v}, p & v.adjacent, x & v.adjacent):
+        _, nodes_ordered = get_degeneracy_ordering(nodes, stats)
+    rank = {v: i for (i, v) in enumerate(nodes_ordered)}
+    if stats is None:
+        for clique in _bron_kerbosch_nodes(nodes_ordered, p, x, rank, search, stats, rule):
+            yield clique
+        return
+    stats.total += len(nodes_ordered)
+    for component in order_components(get_components(nodes, stats), nodes_ordered):
+        start = perf_counter()
+        for clique in _bron_kerbosch_nodes(component, p, x, rank, search, stats, rule):
             yield clique
+        if search is not None and search.truncated:
+            return
+        stats.components.append((len(component), perf_counter() - start))
+
+
+def _bron_kerbosch_nodes(vertices, p: set, x: set, rank, search: CliqueSearch = None, stats: SearchStats = None,
+                         rule=None):
+    for v in vertices:
+        for clique in _bron_kerbosch_iterative([v], p & v.adjacent, x & v.adjacent, _get_adjacent, rank, search,
+                                               stats, rule):
+            yield clique
+        if search is not None and search.is_expired():
+            return
         p.remove(v)
         x.add(v)
+        if stats is not None:
+            stats.done += 1
+            stats.report()
 
 
-def bron_kerbosch(r: Set[Node], p: Set[Node], x: Set[Node]):
-    if len(p) == len(x) == 0:
-        yield r
-    else:
-        px = p | x
-        u = px.pop()
-        adjacency = len(p & u.adjacent)
-        for node in px:
-            local_adjacency = len(p & node.adjacent)
-            if local_adjacency > adjacency:
-                adjacency = local_adjacency
-                u = node
-        iter_nodes = p - u.adjacent
-        for v in sorted(iter_nodes, key=lambda x: x.name):
-            for clique in bron_kerbosch(r | {v}, p & v.adjacent, x & v.adjacent):
-                yield clique
-            p.remove(v)
-            x.add(v)
+def _get_adjacent(node):
+    return node.adjacent
+
+
+def bron_kerbosch(r: Set[Node], p: Set[Node], x: Set[Node], search: CliqueSearch = None, stats: SearchStats = None,
+                  pivot: str = 'tomita'):
+    """
+    The maximal cliques that contain r and extend it with nodes of p but with none of x. The branches are taken
+    in name order.
+    """
+    rule = _get_pivot_rule(pivot)
+    rank = {v: i for (i, v) in enumerate(sorted(p | x, key=lambda n: n.name))}
+    return _bron_kerbosch_iterative(list(r), set(p), set(x), _get_adjacent, rank, search, stats, rule)
+
+
+def _bron_kerbosch_iterative(r: list, p: set, x: set, adjacent_of, rank, search: CliqueSearch = None,
+                             stats: SearchStats = None, rule=None):
+    """
+    Bron-Kerbosch on an explicit stack, so every clique is emitted in O(|clique|) and the depth of the search is
+    not limited by the recursion limit. adjacent_of(v) is the set of neighbours of v and rule is one of
+    PIVOT_RULES. The branches are taken in increasing rank[v] and the pivot rules break ties by rank, so the
+    cliques come out in the same order on every run.
+    """
+    if rule is None:
+        rule = pivot_tomita
+    # A frame is [P, X, the vertices left to branch on in decreasing rank, the vertex of the current branch]
+    stack = []
+    while True:
+        if stats is not None:
+            stats.enter(len(r))
+        if search is None or not search.prune(len(r), len(p)):
+            if len(p) == 0:
+                if len(x) == 0:
+                    if stats is not None:
+                        stats.cliques += 1
+                    yield set(r)
+            else:
+                branches = rule(p, x, adjacent_of, rank, stats)
+                if branches is not None:
+                    stack.append([p, x, sorted(branches, key=rank.__getitem__, reverse=True), None])
+        # Continue with the next branch of the deepest frame that has one left
+        while len(stack) > 0:
+            frame = stack[-1]
+            (p, x, branches, v) = frame
+            if v is not None:
+                r.pop()
+                p.remove(v)
+                x.add(v)
+                if search is not None and search.prune(len(r), len(p)):
+                    stack.pop()
+                    continue
+            if len(branches) == 0:
+                stack.pop()
+                continue
+            v = branches.pop()
+            frame[3] = v
+            r.append(v)
+            adjacent = adjacent_of(v)
+            p = p & adjacent
+            x = x & adjacent
+            if stats is not None:
+                stats.set_operations += 2
+            break
+        else:
+            return
+
+
+def pivot_tomita(p: set, x: set, adjacent_of, rank, stats: SearchStats = None) -> set:
+    """
+    The pivot rule of Tomita, Tanaka and Takahashi: branch on P minus the neighbours of the vertex of P and X with
+    the most neighbours in P. It evaluates every vertex of P and X.
+    """
+    px = p | x
+    u = None
+    pivot_adjacency = -1
+    for vertex in px:
+        local_adjacency = len(p & adjacent_of(vertex))
+        if local_adjacency > pivot_adjacency or (local_adjacency == pivot_adjacency and rank[vertex] < rank[u]):
+            pivot_adjacency = local_adjacency
+            u = vertex
+    if stats is not None:
+        stats.pivot_evaluations += len(px)
+        stats.set_operations += len(px) + 2
+    return p - adjacent_of(u)
+
+
+def pivot_sampled(p: set, x: set, adjacent_of, rank, stats: SearchStats = None) -> set:
+    """
+    The Tomita rule on a sample of PIVOT_SAMPLE_SIZE vertices of P and X, those of lowest rank. Choosing the pivot
+    costs O(|P| + |X|) instead of O(|P| (|P| + |X|)), at the price of more branches.
+    """
+    if len(p) + len(x) <= PIVOT_SAMPLE_SIZE:
+        return pivot_tomita(p, x, adjacent_of, rank, stats)
+    u = None
+    pivot_adjacency = -1
+    for vertex in nsmallest(PIVOT_SAMPLE_SIZE, p | x, key=rank.__getitem__):
+        local_adjacency = len(p & adjacent_of(vertex))
+        if local_adjacency > pivot_adjacency:
+            pivot_adjacency = local_adjacency
+            u = vertex
+    if stats is not None:
+        stats.pivot_evaluations += PIVOT_SAMPLE_SIZE
+        stats.set_operations += PIVOT_SAMPLE_SIZE + 2
+    return p - adjacent_of(u)
+
+
+def pivot_naude(p: set, x: set, adjacent_of, rank, stats: SearchStats = None) -> set:
+    """
+    The Tomita rule with the early exits of Naude: X is scanned first and a vertex of X adjacent to all of P cuts
+    the branch, because every clique in it could be extended by that vertex. The scan of P stops at a vertex
+    adjacent to all the other vertices of P, which leaves a single branch.
+    """
+    size = len(p)
+    u = None
+    pivot_adjacency = -1
+    evaluations = 0
+    for vertex in x:
+        evaluations += 1
+        local_adjacency = len(p & adjacent_of(vertex))
+        if local_adjacency == size:
+            if stats is not None:
+                stats.pivot_evaluations += evaluations
+                stats.set_operations += evaluations
+            return None
+        if local_adjacency > pivot_adjacency or (local_adjacency == pivot_adjacency and rank[vertex] < rank[u]):
+            pivot_adjacency = local_adjacency
+            u = vertex
+    for vertex in p:
+        evaluations += 1
+        local_adjacency = len(p & adjacent_of(vertex))
+        if local_adjacency == size - 1:
+            # Every maximal clique of the branch contains vertex, whichever such vertex is found first
+            u = vertex
+            break
+        if local_adjacency > pivot_adjacency or (local_adjacency == pivot_adjacency and rank[vertex] < rank[u]):
+            pivot_adjacency = local_adjacency
+            u = vertex
+    if stats is not None:
+        stats.pivot_evaluations += evaluations
+        stats.set_operations += evaluations + 1
+    return p - adjacent_of(u)
+
+
+def pivot_hybrid(p: set, x: set, adjacent_of, rank, stats: SearchStats = None) -> set:
+    """
+    No pivot while P has at most SMALL_CANDIDATES vertices, where choosing one costs more than the branches it
+    saves, and the Tomita rule otherwise.
+    """
+    if len(p) <= SMALL_CANDIDATES:
+        return p
+    return pivot_tomita(p, x, adjacent_of, rank, stats)
+
+
+def pivot_none(p: set, x: set, adjacent_of, rank, stats: SearchStats = None) -> set:
+    """
+    The original Bron-Kerbosch algorithm without a pivot: branch on every vertex of P.
+    """
+    return p
+
+
+PIVOT_RULES = {
+    'tomita': pivot_tomita,
+    'sampled': pivot_sampled,
+    'naude': pivot_naude,
+    'hybrid': pivot_hybrid,
+    'none': pivot_none
+}
+
+
+def _get_pivot_rule(pivot: str):
+    rule = PIVOT_RULES.get(pivot)
+    if rule is None:
+        raise ValueError('Unknown pivot rule {}. Expected one of {}'.format(pivot, ', '.join(PIVOT_RULES)))
+    return rule
+
+
+def _get_cliques_bron_kerbosch_graph(graph: Graph, search: CliqueSearch = None, stats: SearchStats = None,
+                                     rule=None):
+    _, nodes_ordered = get_degeneracy_ordering(graph, stats)
+    rank = get_ranks(nodes_ordered)
+    if stats is None:
+        for clique in _bron_kerbosch_graph_vertices(graph, nodes_ordered, rank, search, stats, rule):
+            yield clique
+        return
+    stats.total += len(nodes_ordered)
+    for component in order_components(get_components(graph, stats), nodes_ordered):
+        start = perf_counter()
+        for clique in _bron_kerbosch_graph_vertices(graph, component, rank, search, stats, rule):
+            yield clique
+        if search is not None and search.truncated:
+            return
+        stats.components.append((len(component), perf_counter() - start))
+
+
+def _bron_kerbosch_graph_vertices(graph: Graph, vertices, rank, search: CliqueSearch = None,
+                                  stats: SearchStats = None, rule=None):
+    for v in vertices:
+        for clique in _bron_kerbosch_graph_vertex(graph, rank, v, search, stats, rule):
+            yield clique
+        if search is not None and search.is_expired():
+            return
+        if stats is not None:
+            stats.done += 1
+            stats.report()
+
+
+def _bron_kerbosch_graph_vertex(graph: Graph, rank, v: int, search: CliqueSearch = None, stats: SearchStats = None,
+                                rule=None):
+    adjacent = graph.adjacent(v)
+    p = {u for u in adjacent if rank[u] > rank[v]}
+    x = {u for u in adjacent if rank[u] < rank[v]}
+    # Only the neighbourhood of v takes part in its subproblem, so that is all that is expanded into sets
+    local = p | x
+    adjacency = {u: local.intersection(graph.adjacent(u)) for u in local}
+    return _bron_kerbosch_iterative([v], p, x, adjacency.__getitem__, rank, search, stats, rule)
 
 
 def worst_case_running_time_bron_kerbosch(nodes, d=None):
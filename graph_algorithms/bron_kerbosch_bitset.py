@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from . import Graph, get_degeneracy_ordering
+from .graph import get_ranks
+from .bitset import get_local_rows, popcount
+from .search import CliqueSearch
+from .bron_kerbosch import _get_adjacent
+
+
+def get_cliques_bron_kerbosch_bitset(nodes, ordered_nodes=False, min_size: int = 1, max_size: int = None,
+                                     max_cliques: int = None, deadline: float = None) -> CliqueSearch:
+    """
+    Bron-Kerbosch with pivoting and a degeneracy ordering on the outer level, like get_cliques_bron_kerbosch,
+    but with P, X and the adjacency rows stored as int bitsets. The neighbourhood of every top-level vertex
+    is relabelled to 0..k-1, so the bitsets never grow beyond the degree of that vertex.
+    """
+    search = CliqueSearch(min_size, max_size, max_cliques, deadline)
+    return search.run(_get_cliques_bron_kerbosch_bitset(nodes, ordered_nodes,
+                                                        search if search.is_pruning else None))
+
+
+def _get_cliques_bron_kerbosch_bitset(nodes, ordered_nodes, search: CliqueSearch = None):
+    if isinstance(nodes, Graph):
+        _, nodes_ordered = get_degeneracy_ordering(nodes)
+        rank = get_ranks(nodes_ordered)
+        for v in nodes_ordered:
+            for clique in _bron_kerbosch_bitset_vertex(v, nodes.adjacent(v), rank, nodes.adjacent, search):
+                yield clique
+            if search is not None and search.is_expired():
+                return
+        return
+    if ordered_nodes:
+        nodes_ordered = nodes
+    else:
+        _, nodes_ordered = get_degeneracy_ordering(nodes)
+    rank = {v: i for (i, v) in enumerate(nodes_ordered)}
+    for v in nodes_ordered:
+        neighbours = [u for u in v.adjacent if u in rank]
+        for clique in _bron_kerbosch_bitset_vertex(v, neighbours, rank, _get_adjacent, search):
+            yield clique
+        if search is not None and search.is_expired():
+            return
+
+
+def _bron_kerbosch_bitset_vertex(v, neighbours, rank, adjacent_of, search: CliqueSearch = None):
+    """
+    The cliques of the subproblem of the top-level vertex v, whose neighbours in the graph are neighbours.
+    """
+    v_rank = rank[v]
+    vertices = sorted(neighbours, key=rank.__getitem__)
+    rows = get_local_rows(vertices, adjacent_of)
+    # The neighbours before v in the ordering come first
+    x = (1 << sum(1 for u in vertices if rank[u] < v_rank)) - 1
+    p = ((1 << len(vertices)) - 1) ^ x
+    return bron_kerbosch_bitset([v], p, x, rows, vertices, search)
+
+
+def bron_kerbosch_bitset(r: list, p: int, x: int, rows: [int], vertices: list, search: CliqueSearch = None):
+    """
+    r is the list of vertices in the current clique, p and x are bitsets over the local labels, rows[i] is the
+    bitset of local neighbours of local vertex i and vertices[i] is the vertex with local label i.
+    """
+    if search is not None and search.prune(len(r), popcount(p)):
+        return
+    if p == 0:
+        if x == 0:
+            yield set(r)
+        return
+    p_size = popcount(p)
+    pivot_adjacency = -1
+    pivot_row = 0
+    px = p | x
+    while px:
+        lowest = px & -px
+        px ^= lowest
+        row = rows[lowest.bit_length() - 1]
+        local_adjacency = popcount(p & row)
+        if local_adjacency > pivot_adjacency:
+            pivot_adjacency = local_adjacency
+            pivot_row = row
+            if local_adjacency == p_size:
+                break
+    iter_nodes = p & ~pivot_row
+    while iter_nodes:
+        lowest = iter_nodes & -iter_nodes
+        iter_nodes ^= lowest
+        v = lowest.bit_length() - 1
+        row = rows[v]
+        r.append(vertices[v])
+        for clique in bron_kerbosch_bitset(r, p & row, x & row, rows, vertices, search):
+            yield clique
+        r.pop()
+        p ^= lowest
+        x |= lowest
+        if search is not None and search.prune(len(r), popcount(p)):
+            return
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import mmap
+import struct
+import sys
+import tempfile
+from array import array
+from shutil import copyfileobj
+
+# Layout, all little-endian:
+#   header      magic, version, number of cliques, number of nodes, position of the offsets, position of the names
+#   ids         uint32 node ids, the members of every clique in increasing order, one clique after the other
+#   offsets     uint64, number of cliques + 1 indices into ids, clique i is ids[offsets[i]:offsets[i + 1]]
+#   names       uint32 length followed by the UTF-8 encoded name, for every node id
+_MAGIC = b'CLQF'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQQQQ')
+_ID_TYPECODE = 'I'
+_OFFSET_TYPECODE = 'Q'
+_LENGTH = struct.Struct('<I')
+_BUFFER_SIZE = 1 << 16
+
+
+def write_cliques(path: str, cliques) -> int:
+    """
+    Write the cliques, e.g. the output of get_cliques, to a clique file and return the number of cliques written.
+    The members of the cliques can be Node or vertex indices of a Graph.
+    """
+    with CliqueFileWriter(path) as writer:
+        for clique in cliques:
+            writer.write(clique)
+        return len(writer)
+
+
+class CliqueFileWriter:
+    """
+    Streams cliques to a clique file. Only the node id table is kept in memory; the clique offsets are spooled
+    to a temporary file until the writer is closed.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'wb')
+        self._file.write(bytes(_HEADER.size))
+        self._offsets = tempfile.TemporaryFile()
+        self._ids = {}
+        self._names = []
+        self._ids_buffer = array(_ID_TYPECODE)
+        self._offsets_buffer = array(_OFFSET_TYPECODE, [0])
+        self._number_of_ids = 0
+        self._number_of_cliques = 0
+
+    def __len__(self):
+        return self._number_of_cliques
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, clique):
+        ids = []
+        for node in clique:
+            node_id = self._ids.get(node)
+            if node_id is None:
+                node_id = len(self._names)
+                if node_id >= 1 << 32:
+                    raise OverflowError('A clique file holds at most 2^32 distinct nodes')
+                self._ids[node] = node_id
+                self._names.append(str(node))
+            ids.append(node_id)
+        ids.sort()
+        self._ids_buffer.extend(ids)
+        self._number_of_ids += len(ids)
+        self._number_of_cliques += 1
+        self._offsets_buffer.append(self._number_of_ids)
+        if len(self._ids_buffer) >= _BUFFER_SIZE:
+            _write_array(self._file, self._ids_buffer)
+        if len(self._offsets_buffer) >= _BUFFER_SIZE:
+            _write_array(self._offsets, self._offsets_buffer)
+
+    def close(self):
+        if self._file.closed:
+            return
+        _write_array(self._file, self._ids_buffer)
+        _write_array(self._offsets, self._offsets_buffer)
+        # The offsets are aligned, so that the reader can cast them in place
+        self._file.write(bytes(-self._file.tell() % 8))
+        offsets_position = self._file.tell()
+        self._offsets.seek(0)
+        copyfileobj(self._offsets, self._file)
+        self._offsets.close()
+        names_position = self._file.tell()
+        for name in self._names:
+            encoded = name.encode('utf-8')
+            self._file.write(_LENGTH.pack(len(encoded)))
+            self._file.write(encoded)
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, self._number_of_cliques, len(self._names),
+                                      offsets_position, names_position))
+        self._file.close()
+
+
+class CliqueFile:
+    """
+    Read-only, memory-mapped view of a clique file. Cliques are read from the mapping when they are accessed, so
+    iterating or indexing never loads the whole file. file[i] is the list of node names of clique i and
+    file.get_ids(i) the node ids, indices into file.names.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._number_of_cliques, number_of_nodes, offsets_position, names_position) = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError('{} is not a clique file'.format(path))
+        view = memoryview(self._map)
+        self._offsets = _cast(view[offsets_position:offsets_position + 8 * (self._number_of_cliques + 1)],
+                              _OFFSET_TYPECODE)
+        self._ids = _cast(view[_HEADER.size:_HEADER.size + 4 * self._offsets[self._number_of_cliques]],
+                          _ID_TYPECODE)
+        view.release()
+        self.names = []
+        position = names_position
+        for _ in range(number_of_nodes):
+            (length,) = _LENGTH.unpack_from(self._map, position)
+            position += _LENGTH.size
+            self.names.append(self._map[position:position + length].decode('utf-8'))
+            position += length
+
+    def __len__(self):
+        return self._number_of_cliques
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_ids(self, i: int) -> [int]:
+        if i < 0:
+            i += self._number_of_cliques
+        if not 0 <= i < self._number_of_cliques:
+            raise IndexError('Clique index out of range')
+        return self._ids[self._offsets[i]:self._offsets[i + 1]].tolist()
+
+    def __getitem__(self, i: int) -> [str]:
+        return [self.names[node_id] for node_id in self.get_ids(i)]
+
+    def __iter__(self):
+        for i in range(self._number_of_cliques):
+            yield self[i]
+
+    def close(self):
+        for view in (getattr(self, '_ids', None), getattr(self, '_offsets', None)):
+            if isinstance(view, memoryview):
+                view.release()
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+
+def _write_array(file, values: array):
+    if sys.byteorder == 'big':
+        values.byteswap()
+    values.tofile(file)
+    del values[:]
+
+
+def _cast(view: memoryview, typecode: str):
+    if sys.byteorder == 'big':
+        # The file is little-endian, so big-endian hosts work on a swapped copy
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        view.release()
+        return values
+    return view.cast(typecode)
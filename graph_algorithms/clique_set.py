@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from array import array
+from itertools import accumulate
+from . import Graph
+
+_ID_TYPECODE = 'i'
+_OFFSET_TYPECODE = 'q'
+
+
+class CliqueSet:
+    """
+    Compact in-memory container of cliques. The members of all cliques are stored as int ids in one flat array,
+    in increasing order within every clique, and clique i is ids[offsets[i]:offsets[i + 1]], about 4 bytes per
+    member instead of a set of Node per clique. An inverted index from every id to the cliques containing it is
+    built on the first query that needs it and dropped when cliques are added.
+
+    nodes is the graph the cliques come from. For a Graph the ids are its vertices, for a list of Node or a
+    NodeGraph the positions of the nodes in it, and without nodes every new member gets the next id.
+    set[i] is clique i as a set of members, like the cliques of get_cliques.
+    """
+
+    def __init__(self, nodes=None):
+        self.ids = array(_ID_TYPECODE)
+        self.offsets = array(_OFFSET_TYPECODE, [0])
+        if isinstance(nodes, Graph):
+            self.graph = nodes
+            self.nodes = None
+            self._id_of = None
+        else:
+            self.graph = None
+            self.nodes = [] if nodes is None else list(nodes)
+            self._id_of = {node: i for (i, node) in enumerate(self.nodes)}
+        self._growing = nodes is None
+        self._index_offsets = None
+        self._index = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def number_of_ids(self) -> int:
+        return len(self.graph) if self.graph is not None else len(self.nodes)
+
+    def add(self, clique) -> int:
+        """
+        Add a clique, any iterable of members, and return its index.
+        """
+        self.ids.extend(sorted(self._get_ids(clique)))
+        self.offsets.append(len(self.ids))
+        self._index = self._index_offsets = None
+        return len(self.offsets) - 2
+
+    def extend(self, cliques) -> 'CliqueSet':
+        """
+        Add the cliques of an iterable such as the one get_cliques returns, one at a time as they are produced.
+        """
+        ids = self.ids
+        offsets = self.offsets
+        get_ids = self._get_ids
+        for clique in cliques:
+            ids.extend(sorted(get_ids(clique)))
+            offsets.append(len(ids))
+        self._index = self._index_offsets = None
+        return self
+
+    def _get_ids(self, clique):
+        if self._id_of is None:
+            if len(clique) > 0 and (min(clique) < 0 or max(clique) >= len(self.graph)):
+                raise ValueError('Clique {} out of range for a graph of {} vertices'.format(sorted(clique),
+                                                                                          len(self.graph)))
+            return clique
+        ids = []
+        for node in clique:
+            node_id = self._id_of.get(node)
+            if node_id is None:
+                if not self._growing:
+                    raise ValueError('{} is not a node of the graph of the clique set'.format(node))
+                node_id = self._id_of[node] = len(self.nodes)
+                if node_id >= 1 << 31:
+                    raise OverflowError('A clique set holds at most 2^31 distinct nodes')
+                self.nodes.append(node)
+            ids.append(node_id)
+        return ids
+
+    def get_ids(self, i: int) -> array:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('Clique index out of range')
+        return self.ids[self.offsets[i]:self.offsets[i + 1]]
+
+    def __getitem__(self, i: int) -> set:
+        ids = self.get_ids(i)
+        if self.nodes is None:
+            return set(ids)
+        return {self.nodes[node_id] for node_id in ids}
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def size(self, i: int) -> int:
+        return len(self.get_ids(i))
+
+    def size_histogram(self) -> {int: int}:
+        """
+        The number of cliques of every size, by increasing size.
+        """
+        histogram = {}
+        offsets = self.offsets
+        for i in range(len(self)):
+            size = offsets[i + 1] - offsets[i]
+            histogram[size] = histogram.get(size, 0) + 1
+        return dict(sorted(histogram.items()))
+
+    def _get_index(self) -> (array, array):
+        # Counting sort of (id, clique) by id, so every posting list comes out in increasing clique order
+        if self._index is None:
+            counts = array(_OFFSET_TYPECODE, [0]) * (self.number_of_ids + 1)
+            for node_id in self.ids:
+                counts[node_id + 1] += 1
+            index_offsets = array(_OFFSET_TYPECODE, accumulate(counts))
+            position = index_offsets[:-1]
+            index = array(_ID_TYPECODE if len(self) < 1 << 31 else _OFFSET_TYPECODE, [0]) * len(self.ids)
+            offsets = self.offsets
+            ids = self.ids
+            for i in range(len(self)):
+                for j in range(offsets[i], offsets[i + 1]):
+                    node_id = ids[j]
+                    index[position[node_id]] = i
+                    position[node_id] += 1
+            self._index_offsets = index_offsets
+            self._index = index
+        return self._index_offsets, self._index
+
+    def _get_id(self, node) -> int:
+        if self._id_of is None:
+            return node if 0 <= node < len(self.graph) else None
+        return self._id_of.get(node)
+
+    def _get_posting(self, node_id: int) -> array:
+        index_offsets, index = self._get_index()
+        return index[index_offsets[node_id]:index_offsets[node_id + 1]]
+
+    def count_containing(self, node) -> int:
+        """
+        The number of cliques containing node, in O(1) once the index is built.
+        """
+        node_id = self._get_id(node)
+        if node_id is None:
+            return 0
+        index_offsets, _ = self._get_index()
+        return index_offsets[node_id + 1] - index_offsets[node_id]
+
+    def containing(self, *nodes) -> [int]:
+        """
+        The indices of the cliques that contain all of nodes, in increasing order, by intersecting the index
+        entries of the nodes from the shortest.
+        """
+        if len(nodes) == 0:
+            return list(range(len(self)))
+        node_ids = [self._get_id(node) for node in nodes]
+        if None in node_ids:
+            return []
+        postings = sorted((self._get_posting(node_id) for node_id in node_ids), key=len)
+        if len(postings) == 1:
+            return postings[0].tolist()
+        common = set(postings[0])
+        for posting in postings[1:]:
+            common.intersection_update(posting)
+            if len(common) == 0:
+                return []
+        return sorted(common)
+
+    def intersecting(self, nodes) -> [int]:
+        """
+        The indices of the cliques that contain at least one of nodes, in increasing order.
+        """
+        found = set()
+        for node in nodes:
+            node_id = self._get_id(node)
+            if node_id is not None:
+                found.update(self._get_posting(node_id))
+        return sorted(found)
+
+    def intersection(self, i: int, j: int) -> set:
+        """
+        The members cliques i and j have in common.
+        """
+        common = set(self.get_ids(i)).intersection(self.get_ids(j))
+        if self.nodes is None:
+            return common
+        return {self.nodes[node_id] for node_id in common}
+
+    def __contains__(self, clique) -> bool:
+        """
+        Whether clique, a collection of members, is one of the cliques of the set.
+        """
+        node_ids = []
+        for node in clique:
+            node_id = self._get_id(node)
+            if node_id is None:
+                return False
+            node_ids.append(node_id)
+        if len(node_ids) == 0:
+            return False
+        node_ids = array(_ID_TYPECODE, sorted(node_ids))
+        index_offsets, _ = self._get_index()
+        shortest = min(node_ids, key=lambda node_id: index_offsets[node_id + 1] - index_offsets[node_id])
+        offsets = self.offsets
+        for i in self._get_posting(shortest):
+            if offsets[i + 1] - offsets[i] == len(node_ids) and self.ids[offsets[i]:offsets[i + 1]] == node_ids:
+                return True
+        return False
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import mmap
+import os
+from array import array
+from .graph import Graph
+from .clique_file import _cast, _write_array
+
+_COMMENTS = ('#', '%')
+
+
+def load_edge_list(path: str, binary: bool = False, typecode: str = 'i', numeric: bool = True, cls=Graph) -> Graph:
+    """
+    Load a graph from an edge list file in one pass, symmetrized and without duplicate edges or self loops.
+
+    A text file has one edge per line, two whitespace separated labels followed by anything (a weight, say);
+    empty lines and lines starting with # or % are skipped. With numeric, the labels are the integer vertices;
+    otherwise the vertices are numbered in order of appearance and named by their labels.
+
+    A binary file is a flat sequence of little-endian integers of the array typecode, two per edge. It is
+    memory-mapped, so the edges are never held in memory as Python objects.
+    """
+    if binary:
+        return _load_binary_edge_list(path, typecode, cls)
+    src = array('q')
+    dst = array('q')
+    index = None if numeric else {}
+    with open(path) as file:
+        for line in file:
+            fields = line.split(None, 2)
+            if len(fields) == 0 or line.startswith(_COMMENTS):
+                continue
+            if len(fields) < 2:
+                raise ValueError('Expected an edge in {}, received: {}'.format(path, line.rstrip()))
+            if numeric:
+                src.append(int(fields[0]))
+                dst.append(int(fields[1]))
+            else:
+                src.append(index.setdefault(fields[0], len(index)))
+                dst.append(index.setdefault(fields[1], len(index)))
+    if numeric:
+        return cls.from_edge_arrays(src, dst)
+    return cls.from_edge_arrays(src, dst, len(index), list(index))
+
+
+def _load_binary_edge_list(path: str, typecode: str, cls) -> Graph:
+    item_size = array(typecode).itemsize
+    if os.path.getsize(path) % (2 * item_size) != 0:
+        raise ValueError('The size of {} is not a multiple of an edge of {} bytes'.format(path, 2 * item_size))
+    if os.path.getsize(path) == 0:
+        return cls.from_edge_arrays(array(typecode), array(typecode))
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as edges_map:
+        edges = _cast(memoryview(edges_map), typecode)
+        if not isinstance(edges, memoryview):
+            return cls.from_edge_arrays(edges[0::2], edges[1::2])
+        src = edges[0::2]
+        dst = edges[1::2]
+        try:
+            return cls.from_edge_arrays(src, dst)
+        finally:
+            src.release()
+            dst.release()
+            edges.release()
+
+
+def save_edge_list(path: str, graph: Graph, binary: bool = False, typecode: str = 'i'):
+    """
+    Write every edge of graph once, as a text or binary edge list readable by load_edge_list.
+    """
+    if binary:
+        edges = array(typecode)
+        for v in range(len(graph)):
+            for u in graph.adjacent(v):
+                if u > v:
+                    edges.append(v)
+                    edges.append(u)
+        with open(path, 'wb') as file:
+            _write_array(file, edges)
+        return
+    with open(path, 'w') as file:
+        for v in range(len(graph)):
+            for u in graph.adjacent(v):
+                if u > v:
+                    file.write('{} {}\n'.format(graph.name(v), graph.name(u)))
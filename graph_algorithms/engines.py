@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from .bron_kerbosch import get_cliques_bron_kerbosch
+from .bron_kerbosch_bitset import get_cliques_bron_kerbosch_bitset
+from .kellerman import get_cliques_kellerman
+from .kellerman_bitset import get_cliques_kellerman_bitset
+
+ENGINES = {
+    'bron_kerbosch': get_cliques_bron_kerbosch,
+    'bron_kerbosch_bitset': get_cliques_bron_kerbosch_bitset,
+    'kellerman': get_cliques_kellerman,
+    'kellerman_bitset': get_cliques_kellerman_bitset
+}
+BOUNDED_ENGINES = ('bron_kerbosch', 'bron_kerbosch_bitset')
+INSTRUMENTED_ENGINES = ('bron_kerbosch', 'kellerman')
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+import random
+from . import Node
+
+
+def get_random_graph(size: int, edge_probability: float, seed=None) -> [Node]:
+    """
+    Erdos-Renyi G(n, p) graph. Non-edges are skipped geometrically (Batagelj and Brandes), so sparse graphs are
+    generated in O(n + m).
+    """
+    generator = random.Random(seed)
+    nodes = [Node(str(i)) for i in range(size)]
+    if edge_probability <= 0:
+        return nodes
+    if edge_probability >= 1:
+        for i in range(size):
+            for j in range(i + 1, size):
+                _connect(nodes[i], nodes[j])
+        return nodes
+    log_q = math.log(1 - edge_probability)
+    v = 1
+    w = -1
+    while v < size:
+        w += 1 + int(math.log(1 - generator.random()) / log_q)
+        while w >= v and v < size:
+            w -= v
+            v += 1
+        if v < size:
+            _connect(nodes[v], nodes[w])
+    return nodes
+
+
+def get_power_law_graph(size: int, edges_per_node: int, seed=None) -> [Node]:
+    """
+    Barabasi-Albert preferential attachment graph, with a power-law degree distribution of exponent 3. Every new
+    node is connected to edges_per_node existing nodes chosen proportionally to their degree.
+    """
+    generator = random.Random(seed)
+    nodes = [Node(str(i)) for i in range(size)]
+    # Every node appears in endpoints once per incident edge, so sampling endpoints samples by degree
+    endpoints = []
+    for i in range(min(edges_per_node + 1, size)):
+        for j in range(i):
+            _connect(nodes[i], nodes[j])
+            endpoints.extend((i, j))
+    for i in range(edges_per_node + 1, size):
+        targets = set()
+        while len(targets) < edges_per_node:
+            targets.add(generator.choice(endpoints))
+        for j in targets:
+            _connect(nodes[i], nodes[j])
+            endpoints.extend((i, j))
+    return nodes
+
+
+def get_moon_moser_graph(size: int) -> [Node]:
+    """
+    The Moon-Moser graph: the complete multipartite graph with parts of size 3. It has the largest number of
+    maximal cliques of any graph on size nodes, 3 ^ (size / 3) when size is divisible by 3. Otherwise one part has
+    size 2 or 4.
+    """
+    parts = [3] * (size // 3)
+    if size % 3 == 1 and len(parts) > 0:
+        parts[-1] = 4
+    elif size % 3 == 1:
+        parts = [1]
+    elif size % 3 == 2:
+        parts.append(2)
+    part_of = [i for (i, part) in enumerate(parts) for _ in range(part)]
+    nodes = [Node(str(i)) for i in range(size)]
+    for i in range(size):
+        for j in range(i + 1, size):
+            if part_of[i] != part_of[j]:
+                _connect(nodes[i], nodes[j])
+    return nodes
+
+
+def get_moon_moser_cliques(size: int) -> int:
+    """
+    The number of maximal cliques of get_moon_moser_graph(size).
+    """
+    if size % 3 == 0:
+        return 3 ** (size // 3)
+    if size % 3 == 1:
+        return 4 * 3 ** (size // 3 - 1) if size > 1 else 1
+    return 2 * 3 ** (size // 3)
+
+
+def get_disjoint_union(*graphs: [Node]) -> [Node]:
+    """
+    The disjoint union of lists of Node, for graphs with many components. Nodes keep their names.
+    """
+    return [node for nodes in graphs for node in nodes]
+
+
+def load_dimacs(path: str) -> [Node]:
+    """
+    Load a graph in the DIMACS edge format: 'c' comment lines, a 'p edge <nodes> <edges>' line and one
+    'e <u> <v>' line per edge with 1-based node numbers. The nodes are named by their number.
+    """
+    nodes = []
+    with open(path) as file:
+        for line in file:
+            fields = line.split()
+            if len(fields) == 0 or fields[0] == 'c':
+                continue
+            if fields[0] == 'p':
+                nodes = [Node(str(i + 1)) for i in range(int(fields[2]))]
+            elif fields[0] == 'e':
+                (u, v) = (int(fields[1]) - 1, int(fields[2]) - 1)
+                if u != v:
+                    _connect(nodes[u], nodes[v])
+            else:
+                raise ValueError('Unexpected line in DIMACS file {}: {}'.format(path, line.rstrip()))
+    return nodes
+
+
+def save_dimacs(path: str, nodes: [Node]):
+    index = {node: i for (i, node) in enumerate(nodes)}
+    edges = [(i, index[n]) for (i, node) in enumerate(nodes) for n in node.adjacent if index.get(n, -1) > i]
+    with open(path, 'w') as file:
+        file.write('p edge {} {}\n'.format(len(nodes), len(edges)))
+        for (u, v) in edges:
+            file.write('e {} {}\n'.format(u + 1, v + 1))
+
+
+def _connect(u: Node, v: Node):
+    u.adjacent.add(v)
+    v.adjacent.add(u)
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+
+def index_typecode(size: int) -> str:
+    """
+    The smallest signed array typecode able to hold indices up to size.
+    """
+    return 'i' if size < 2 ** 31 else 'q'
+
+
+class Graph:
+    """
+    Undirected graph with the adjacency stored in compressed sparse row (CSR) layout.
+
+    The vertices are the integers 0..n-1 and the neighbours of vertex i are
+    neighbours[offsets[i]:offsets[i + 1]], sorted in increasing order. offsets and neighbours
+    can be any indexable integer sequences (array.array, NumPy arrays, memoryviews).
+
+    The graph is immutable. The algorithms in graph_algorithms accept a Graph wherever they
+    accept a list of Node, and return vertex indices instead of Node objects.
+    """
+
+    def __init__(self, offsets, neighbours, names=None):
+        self.offsets = offsets
+        self.neighbours = neighbours
+        self.names = names
+        self._core_decomposition = None
+
+    @classmethod
+    def from_nodes(cls, nodes) -> 'Graph':
+        """
+        Build a graph from a list of Node. Vertex i is nodes[i]; adjacent nodes missing from the
+        list are ignored.
+        """
+        index = {node: i for (i, node) in enumerate(nodes)}
+        offsets = array('q', [0])
+        neighbours = array(index_typecode(len(nodes)))
+        for node in nodes:
+            neighbours.extend(sorted(index[n] for n in node.adjacent if n in index))
+            offsets.append(len(neighbours))
+        return cls(offsets, neighbours, [node.name for node in nodes])
+
+    @classmethod
+    def from_edge_arrays(cls, src, dst, size: int = None, names=None) -> 'Graph':
+        """
+        Build a graph from the edges (src[i], dst[i]) in O(n + m log d), without creating any Node. The edges are
+        symmetrized, duplicates and self loops are dropped. size is the number of vertices, by default one more
+        than the largest vertex.
+        """
+        if len(src) != len(dst):
+            raise ValueError('src and dst must have the same length, received {} and {}'.format(len(src), len(dst)))
+        largest = max(max(src, default=-1), max(dst, default=-1))
+        if size is None:
+            size = largest + 1
+        elif largest >= size:
+            raise ValueError('Vertex {} out of range for a graph of {} vertices'.format(largest, size))
+        if min(min(src, default=0), min(dst, default=0)) < 0:
+            raise ValueError('Vertices must not be negative')
+        counts = array('q', [0]) * (size + 1)
+        for (u, v) in zip(src, dst):
+            if u != v:
+                counts[u + 1] += 1
+                counts[v + 1] += 1
+        offsets = array('q', accumulate(counts))
+        typecode = index_typecode(size)
+        neighbours = array(typecode, [0]) * offsets[size]
+        position = offsets[:size]
+        for (u, v) in zip(src, dst):
+            if u != v:
+                neighbours[position[u]] = v
+                position[u] += 1
+                neighbours[position[v]] = u
+                position[v] += 1
+        # Sort every row and drop its duplicates, compacting the rows towards the front
+        end = 0
+        for v in range(size):
+            row = sorted(set(neighbours[offsets[v]:offsets[v + 1]]))
+            offsets[v] = end
+            neighbours[end:end + len(row)] = array(typecode, row)
+            end += len(row)
+        offsets[size] = end
+        del neighbours[end:]
+        return cls(offsets, neighbours, names)
+
+    @classmethod
+    def from_adjacency_dict(cls, adjacency: dict) -> 'Graph':
+        """
+        Build a graph from a dict mapping every node label to an iterable of adjacent labels. The vertices are
+        numbered in the order of the keys, followed by labels that only appear as neighbours, and are named by
+        their labels. The adjacency does not need to be symmetric.
+        """
+        index = {label: i for (i, label) in enumerate(adjacency)}
+        src = array('q')
+        dst = array('q')
+        for (label, adjacent) in adjacency.items():
+            u = index[label]
+            for neighbour in adjacent:
+                v = index.get(neighbour)
+                if v is None:
+                    v = index[neighbour] = len(index)
+                src.append(u)
+                dst.append(v)
+        return cls.from_edge_arrays(src, dst, len(index), [str(label) for label in index])
+
+    @classmethod
+    def from_edge_list(cls, path: str, binary: bool = False, typecode: str = 'i', numeric: bool = True) -> 'Graph':
+        """
+        Build a graph from a text or binary edge list file, see load_edge_list in graph_algorithms.edge_list.
+        """
+        from .edge_list import load_edge_list
+        return load_edge_list(path, binary, typecode, numeric, cls)
+
+    def to_nodes(self) -> []:
+        from .node import Node
+        nodes = [Node(self.name(i)) for i in range(len(self))]
+        for (i, node) in enumerate(nodes):
+            node.adjacent.update(nodes[j] for j in self.adjacent(i))
+        return nodes
+
+    def view(self, vertex: int):
+        """
+        A read-only NodeView of vertex, for code written against Node.
+        """
+        from .node import NodeView
+        return NodeView(self, vertex)
+
+    def subgraph(self, vertices) -> 'Graph':
+        """
+        The subgraph induced by vertices. Vertex i of the subgraph is vertices[i] of this graph.
+        """
+        index = {v: i for (i, v) in enumerate(vertices)}
+        offsets = array('q', [0])
+        neighbours = array(index_typecode(len(vertices)))
+        for v in vertices:
+            neighbours.extend(sorted(index[u] for u in self.adjacent(v) if u in index))
+            offsets.append(len(neighbours))
+        return Graph(offsets, neighbours, [self.name(v) for v in vertices])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def number_of_edges(self) -> int:
+        return len(self.neighbours) // 2
+
+    def name(self, vertex: int) -> str:
+        return str(vertex) if self.names is None else self.names[vertex]
+
+    def degree(self, vertex: int) -> int:
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def adjacent(self, vertex: int):
+        return self.neighbours[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def has_edge(self, u: int, v: int) -> bool:
+        start, end = self.offsets[u], self.offsets[u + 1]
+        i = bisect_left(self.neighbours, v, start, end)
+        return i < end and self.neighbours[i] == v
+
+
+def get_ranks(vertices_ordered) -> array:
+    """
+    rank[v] is the position of vertex v in vertices_ordered.
+    """
+    rank = array(index_typecode(len(vertices_ordered)), [0]) * len(vertices_ordered)
+    for (i, v) in enumerate(vertices_ordered):
+        rank[v] = i
+    return rank
+
+
+def get_core_decomposition(offsets, neighbours) -> (array, array):
+    """
+    Bucket-queue core decomposition (Batagelj and Zaversnik) of the graph in CSR layout in O(n + m).
+
+    Returns the degeneracy ordering and the core number of every vertex. Vertices of equal degree leave the
+    queue in the order they have in the graph, so the result only depends on the input.
+    """
+    n = len(offsets) - 1
+    typecode = index_typecode(n)
+    core = array(typecode, (offsets[i + 1] - offsets[i] for i in range(n)))
+    max_degree = max(core) if n > 0 else 0
+    bucket_start = array(typecode, [0]) * (max_degree + 1)
+    for d in core:
+        bucket_start[d] += 1
+    start = 0
+    for d in range(max_degree + 1):
+        count = bucket_start[d]
+        bucket_start[d] = start
+        start += count
+    position = array(typecode, [0]) * n
+    ordering = array(typecode, [0]) * n
+    for v in range(n):
+        position[v] = bucket_start[core[v]]
+        ordering[position[v]] = v
+        bucket_start[core[v]] += 1
+    for d in range(max_degree, 0, -1):
+        bucket_start[d] = bucket_start[d - 1]
+    bucket_start[0] = 0
+    for i in range(n):
+        v = ordering[i]
+        core_v = core[v]
+        for j in range(offsets[v], offsets[v + 1]):
+            u = neighbours[j]
+            degree_u = core[u]
+            if degree_u > core_v:
+                # Move u to the front of its bucket and shrink the bucket past it
+                first_position = bucket_start[degree_u]
+                w = ordering[first_position]
+                if u != w:
+                    position_u = position[u]
+                    ordering[position_u] = w
+                    position[w] = position_u
+                    ordering[first_position] = u
+                    position[u] = first_position
+                bucket_start[degree_u] += 1
+                core[u] = degree_u - 1
+    return ordering, core
+
+
+def get_graph_core_decomposition(graph: Graph) -> (array, array):
+    if graph._core_decomposition is None:
+        graph._core_decomposition = get_core_decomposition(graph.offsets, graph.neighbours)
+    return graph._core_decomposition
+
+
+def get_graph_degeneracy_ordering(graph: Graph) -> (int, [int]):
+    ordering, core = get_graph_core_decomposition(graph)
+    return max(core, default=0), ordering
+
+
+def get_graph_components(graph: Graph) -> [[int]]:
+    n = len(graph)
+    offsets, neighbours = graph.offsets, graph.neighbours
+    visited = bytearray(n)
+    components = []
+    queue = []
+    for vertex in range(n):
+        if visited[vertex]:
+            continue
+        new_component = []
+        visited[vertex] = 1
+        queue.append(vertex)
+        while len(queue) > 0:
+            next_vertex = queue.pop()
+            new_component.append(next_vertex)
+            for j in range(offsets[next_vertex], offsets[next_vertex + 1]):
+                neighbour = neighbours[j]
+                if not visited[neighbour]:
+                    visited[neighbour] = 1
+                    queue.append(neighbour)
+        components.append(new_component)
+    return components
+
+
+def order_components(components: [list], nodes_ordered) -> [list]:
+    """
+    The components, each in the order of nodes_ordered. A degeneracy ordering of the whole graph restricted to a
+    component is a degeneracy ordering of that component, and vertices of different components are never adjacent,
+    so the components can be searched one after another in these orders.
+    """
+    component_of = {}
+    for (i, component) in enumerate(components):
+        for v in component:
+            component_of[v] = i
+    ordered = [[] for _ in components]
+    for v in nodes_ordered:
+        ordered[component_of[v]].append(v)
+    return ordered
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from . import Node
+from .bron_kerbosch import get_cliques_bron_kerbosch, bron_kerbosch
+
+
+class CliqueIndex:
+    """
+    The maximal cliques of a graph of Node, kept up to date while edges and nodes are added and removed.
+
+    The graph must be changed through the index. Every change returns the pair (created, destroyed) of sets of
+    cliques, and only looks at the cliques containing the changed nodes and at their common neighbours.
+    """
+
+    def __init__(self, nodes: [Node]):
+        self.cliques = set()  # type: {frozenset}
+        self._cliques_of = {node: set() for node in nodes}
+        for clique in get_cliques_bron_kerbosch(nodes):
+            self._add(frozenset(clique))
+
+    def __len__(self):
+        return len(self.cliques)
+
+    def __iter__(self):
+        return iter(self.cliques)
+
+    def __contains__(self, clique):
+        return frozenset(clique) in self.cliques
+
+    def cliques_containing(self, node: Node) -> {frozenset}:
+        return set(self._cliques_of[node])
+
+    def add_node(self, node: Node, adjacent=()) -> ({frozenset}, {frozenset}):
+        if node in self._cliques_of:
+            raise ValueError('Node {} is already in the index'.format(node))
+        if len(node.adjacent) > 0:
+            raise ValueError('Node {} must be added without neighbours, pass them as adjacent instead'.format(node))
+        self._cliques_of[node] = set()
+        singleton = frozenset((node,))
+        self._add(singleton)
+        created = {singleton}
+        destroyed = set()
+        for neighbour in adjacent:
+            (created_by_edge, destroyed_by_edge) = self.add_edge(node, neighbour)
+            for clique in destroyed_by_edge:
+                if clique in created:
+                    created.remove(clique)
+                else:
+                    destroyed.add(clique)
+            created |= created_by_edge
+        return created, destroyed
+
+    def add_edge(self, u: Node, v: Node) -> ({frozenset}, {frozenset}):
+        if u not in self._cliques_of or v not in self._cliques_of:
+            raise ValueError('Both nodes must be in the index')
+        if u is v or v in u.adjacent:
+            return set(), set()
+        # A clique with every member but one adjacent to the other end of the new edge is no longer maximal
+        destroyed = {clique for clique in self._cliques_of[u] if clique - {u} <= v.adjacent}
+        destroyed |= {clique for clique in self._cliques_of[v] if clique - {v} <= u.adjacent}
+        u.add_adjacent(v)
+        v.add_adjacent(u)
+        # The maximal cliques containing the new edge are the only new ones
+        created = {frozenset(clique) for clique in bron_kerbosch({u, v}, u.adjacent & v.adjacent, set())}
+        for clique in destroyed:
+            self._remove(clique)
+        for clique in created:
+            self._add(clique)
+        return created, destroyed
+
+    def remove_edge(self, u: Node, v: Node) -> ({frozenset}, {frozenset}):
+        if u not in self._cliques_of or v not in self._cliques_of:
+            raise ValueError('Both nodes must be in the index')
+        if v not in u.adjacent:
+            return set(), set()
+        destroyed = self._cliques_of[u] & self._cliques_of[v]
+        u.remove_adjacent(v)
+        v.remove_adjacent(u)
+        # The cliques left when either end is dropped from a destroyed clique are maximal unless some node is
+        # adjacent to all of their members
+        created = set()
+        for clique in destroyed:
+            for candidate in (clique - {u}, clique - {v}):
+                if candidate not in created and len(_get_common_neighbours(candidate)) == 0:
+                    created.add(candidate)
+        for clique in destroyed:
+            self._remove(clique)
+        for clique in created:
+            self._add(clique)
+        return created, destroyed
+
+    def _add(self, clique: frozenset):
+        self.cliques.add(clique)
+        for node in clique:
+            self._cliques_of[node].add(clique)
+
+    def _remove(self, clique: frozenset):
+        self.cliques.remove(clique)
+        for node in clique:
+            self._cliques_of[node].remove(clique)
+
+
+def _get_common_neighbours(nodes) -> set:
+    members = sorted(nodes, key=lambda n: len(n.adjacent))
+    common = set(members[0].adjacent)
+    for node in members[1:]:
+        common &= node.adjacent
+        if len(common) == 0:
+            break
+    return common
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from time import monotonic, perf_counter
+
+
+class SearchStats:
+    """
+    Counters filled in by the instrumented algorithms when they are given a SearchStats, for monitoring long
+    clique searches. Without one the algorithms only pay for an 'is None' check.
+
+    calls and max_depth count the recursive calls of Bron-Kerbosch (or the vertices processed by Kellerman),
+    pivot_evaluations the candidates considered for the pivot, set_operations the set unions, intersections and
+    differences, and cliques the cliques emitted. components holds (size, seconds) for every component searched
+    on its own and timings the seconds spent in degeneracy_ordering and components. The time of a component
+    includes the time the consumer of the cliques spends between them.
+
+    progress, if given, is called with the stats at most every interval seconds while a search runs. done and
+    total count the top-level vertices of the search, so that progress can estimate the time left.
+    """
+
+    # The clock is read once every CHECK_EVERY calls, so the progress hook costs nothing measurable
+    CHECK_EVERY = 1024
+
+    def __init__(self, progress=None, interval: float = 1.0):
+        self.progress = progress
+        self.interval = interval
+        self.calls = 0
+        self.max_depth = 0
+        self.pivot_evaluations = 0
+        self.set_operations = 0
+        self.cliques = 0
+        self.done = 0
+        self.total = 0
+        self.components = []
+        self.timings = {}
+        self._start_time = monotonic()
+        self._next_report = self._start_time + interval
+
+    def enter(self, depth: int):
+        """
+        Count a call at the given depth of the search.
+        """
+        self.calls += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+        if self.progress is not None and self.calls % self.CHECK_EVERY == 0:
+            self.report()
+
+    def report(self):
+        """
+        Call progress if interval seconds have passed since the last call.
+        """
+        if self.progress is None:
+            return
+        now = monotonic()
+        if now >= self._next_report:
+            self._next_report = now + self.interval
+            self.progress(self)
+
+    def add_timing(self, step: str, seconds: float):
+        self.timings[step] = self.timings.get(step, 0.0) + seconds
+
+    @property
+    def elapsed(self) -> float:
+        return monotonic() - self._start_time
+
+    @property
+    def estimated_seconds_left(self) -> float:
+        """
+        Time left if the remaining top-level vertices take as long as the ones done so far, or None before the
+        first one is done.
+        """
+        if self.done == 0:
+            return None
+        return self.elapsed * (self.total - self.done) / self.done
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'max_depth': self.max_depth,
+            'pivot_evaluations': self.pivot_evaluations,
+            'set_operations': self.set_operations,
+            'cliques': self.cliques,
+            'done': self.done,
+            'total': self.total,
+            'components': list(self.components),
+            'timings': dict(self.timings),
+            'elapsed': self.elapsed
+        }
+
+    def __str__(self):
+        return '{} calls, depth {}, {} pivot evaluations, {} set operations, {} cliques, {}/{} vertices'.format(
+            self.calls, self.max_depth, self.pivot_evaluations, self.set_operations, self.cliques, self.done,
+            self.total)
+
+
+def timed(stats: SearchStats, step: str, function, *args):
+    """
+    function(*args), with its running time added to the timings of stats.
+    """
+    start = perf_counter()
+    result = function(*args)
+    stats.add_timing(step, perf_counter() - start)
+    return result
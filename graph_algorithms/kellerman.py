@@ -23,27 +23,60 @@
 
 
 from math import pow
-from . import get_components, get_degeneracy_ordering
+from time import perf_counter
+from . import Graph, NodeGraph, get_components, get_degeneracy_ordering
+from .graph import order_components
+from .instrumentation import SearchStats
 
 
-def get_cliques_kellerman(nodes, ordered_nodes=False):
-    for component in get_components(nodes):
-        for clique in _get_cliques_kellerman(component, ordered_nodes):
+def get_cliques_kellerman(nodes, ordered_nodes=False, stats: SearchStats = None):
+    """
+    The maximal cliques of the graph, from an edge clique cover built by Kellerman's algorithm for every component.
+    stats, if given, counts the work of the search and times every component.
+    """
+    if isinstance(nodes, Graph):
+        components = order_components(get_components(nodes, stats), get_degeneracy_ordering(nodes, stats)[1])
+        graph = nodes
+        ordered_nodes = True
+    elif isinstance(nodes, NodeGraph):
+        components = nodes.get_ordered_components()
+        graph = None
+        ordered_nodes = True
+    else:
+        components = get_components(nodes, stats)
+        graph = None
+    if stats is None:
+        for component in components:
+            for clique in _get_cliques_kellerman(component, ordered_nodes, graph):
+                yield clique
+        return
+    stats.total += sum(len(component) for component in components)
+    for component in components:
+        start = perf_counter()
+        for clique in _get_cliques_kellerman(component, ordered_nodes, graph, stats):
             yield clique
+        stats.components.append((len(component), perf_counter() - start))
 
 
-def _get_cliques_kellerman(nodes_list, ordered_nodes):
+def _get_cliques_kellerman(nodes_list, ordered_nodes, graph=None, stats: SearchStats = None):
     cliques = []  # type: [set[int]]
     if ordered_nodes:
         nodes = nodes_list
     else:
-        _, nodes = get_degeneracy_ordering(nodes_list)
+        _, nodes = get_degeneracy_ordering(nodes_list, stats)
+    position = {node: i for (i, node) in enumerate(nodes)}
     neighbours_less_uncovered = []
     neighbours_less = []
     neighbours_greater = []
     can_add_to_clique = []
     in_cliques = []
     intersection = []
+    # final_after[i] holds the cliques that no vertex after i can be added to. A clique is still read after that
+    # while a later vertex has it in intersection, up to release_after[l]; release_at[i] lists the cliques that may
+    # be dropped after i, with stale entries for cliques whose release_after was moved on.
+    final_after = []
+    release_after = []
+    release_at = []
     for i in range(len(nodes)):
         neighbours_less_uncovered.append(set())
         neighbours_less.append(set())
@@ -51,23 +84,41 @@ def _get_cliques_kellerman(nodes_list, ordered_nodes):
         can_add_to_clique.append(set())
         in_cliques.append(set())
         intersection.append({})
-        for j in range(len(nodes)):
-            if nodes[j] in nodes[i].adjacent:
-                if j < i:
-                    neighbours_less_uncovered[i].add(j)
-                    neighbours_less[i].add(j)
-                elif j > i:
-                    neighbours_greater[i].add(j)
+        final_after.append([])
+        release_at.append([])
+        adjacent = nodes[i].adjacent if graph is None else graph.adjacent(nodes[i])
+        for node in adjacent:
+            j = position.get(node)
+            if j is None:
+                continue
+            if j < i:
+                neighbours_less_uncovered[i].add(j)
+                neighbours_less[i].add(j)
+            elif j > i:
+                neighbours_greater[i].add(j)
     
     for i in range(len(nodes)):
+        if stats is not None:
+            stats.done += 1
+            stats.enter(1)
         if len(neighbours_less_uncovered[i]) == 0:
             for j in neighbours_greater[i]:
                 can_add_to_clique[j].add(len(cliques))
                 intersection[j].update({len(cliques): 1})
             in_cliques[i].add(len(cliques))
+            last = max(neighbours_greater[i], default=i)
+            final_after[last].append(len(cliques))
+            release_after.append(last)
+            release_at[last].append(len(cliques))
             cliques.append({i})
+            for clique in _finish_vertex(i, nodes, cliques, final_after, release_after, release_at, in_cliques,
+                                         stats):
+                yield clique
+            _release_vertex(i, neighbours_less_uncovered, neighbours_less, can_add_to_clique, intersection)
             continue
         
+        if stats is not None:
+            stats.set_operations += len(can_add_to_clique[i])
         for l in can_add_to_clique[i]:
             if cliques[l] <= neighbours_less[i] and l in intersection[i] and intersection[i][l] > 0:
                 cliques[l].add(i)
@@ -80,6 +131,9 @@ def _get_cliques_kellerman(nodes_list, ordered_nodes):
                             intersection[j].update({l: 1})
                         else:
                             intersection[j][l] += 1
+                        if j > release_after[l]:
+                            release_after[l] = j
+                            release_at[j].append(l)
                 
                 for j in neighbours_less_uncovered[i]:
                     if j in cliques[l]:
@@ -90,6 +144,8 @@ def _get_cliques_kellerman(nodes_list, ordered_nodes):
                                     del intersection[i][cl]
                     
                 neighbours_less_uncovered[i] -= cliques[l]
+                if stats is not None:
+                    stats.set_operations += 1
                 if len(neighbours_less_uncovered[i]) == 0:
                     break
         
@@ -104,6 +160,8 @@ def _get_cliques_kellerman(nodes_list, ordered_nodes):
                     min_l = l
             
             new_clique = (cliques[min_l] & neighbours_less_uncovered[i])
+            if stats is not None:
+                stats.pivot_evaluations += len(intersection[i])
             for j in new_clique:
                 for l in in_cliques[j]:
                     if l in intersection[i]:
@@ -126,18 +184,57 @@ def _get_cliques_kellerman(nodes_list, ordered_nodes):
             
             for j in intersected_neighbours:
                 can_add_to_clique[j].add(len(cliques))
+            last = max(intersected_neighbours, default=i)
+            final_after[last].append(len(cliques))
             
+            if stats is not None:
+                # The difference, the neighbour set copies and intersections, and one intersection per neighbour
+                stats.set_operations += 3 + len(new_clique) + len(all_neighbours)
             for h in all_neighbours:
                 size = len(new_clique & neighbours_less_uncovered[h])
                 if size > 0:
                     intersection[h].update({len(cliques): size})
+                    if h > last:
+                        last = h
+            release_after.append(last)
+            release_at[last].append(len(cliques))
 
             cliques.append(new_clique)
-    
-    return [{nodes[n]
-             for n in clique}
-            for clique in cliques]
+        
+        for clique in _finish_vertex(i, nodes, cliques, final_after, release_after, release_at, in_cliques, stats):
+            yield clique
+        _release_vertex(i, neighbours_less_uncovered, neighbours_less, can_add_to_clique, intersection)
+
+
+def _finish_vertex(i: int, nodes, cliques: [set], final_after: [list], release_after: [int], release_at: [list],
+                   in_cliques: [set], stats: SearchStats = None):
+    """
+    Yield the cliques complete after vertex i, then drop the cliques no later vertex reads, so the cover is not
+    kept until the end of the component.
+    """
+    if stats is not None:
+        stats.cliques += len(final_after[i])
+    for l in final_after[i]:
+        yield {nodes[n] for n in cliques[l]}
+    final_after[i] = None
+    for l in release_at[i]:
+        if release_after[l] == i and cliques[l] is not None:
+            for j in cliques[l]:
+                in_cliques[j].discard(l)
+            cliques[l] = None
+    release_at[i] = None
+
+
+def _release_vertex(i: int, neighbours_less_uncovered: [set], neighbours_less: [set], can_add_to_clique: [set],
+                    intersection: [dict]):
+    # Only later vertices read these for vertices after i
+    neighbours_less_uncovered[i] = None
+    neighbours_less[i] = None
+    can_add_to_clique[i] = None
+    intersection[i] = None
 
 
 def worst_case_running_time_kellerman(nodes):
+    if isinstance(nodes, Graph):
+        return len(nodes) * pow(nodes.number_of_edges, 2)
     return len(nodes) * pow(sum([len(node.adjacent) for node in nodes]) / 2, 2)
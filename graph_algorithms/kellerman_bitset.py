@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from . import Graph, NodeGraph, get_components, get_degeneracy_ordering
+from .bitset import popcount, iterate_bits, to_bitset
+from .graph import order_components
+
+
+def get_cliques_kellerman_bitset(nodes, ordered_nodes=False):
+    """
+    Kellerman edge clique cover, like get_cliques_kellerman, with the neighbour sets, the cliques and the
+    vertices that can still join each clique stored as int bitsets over the positions of the vertices in their
+    component. The overlap between a clique and the uncovered neighbours of a vertex is a popcount instead of a
+    counter that is kept up to date per element.
+
+    A component of n vertices takes O(n ^ 2 / 8) bytes for the neighbour bitsets, so this engine is meant for
+    dense components.
+    """
+    if isinstance(nodes, Graph):
+        for component in order_components(get_components(nodes), get_degeneracy_ordering(nodes)[1]):
+            for clique in _get_cliques_kellerman_bitset(component, True, nodes):
+                yield clique
+        return
+    if isinstance(nodes, NodeGraph):
+        for component in nodes.get_ordered_components():
+            for clique in _get_cliques_kellerman_bitset(component, True):
+                yield clique
+        return
+    for component in get_components(nodes):
+        for clique in _get_cliques_kellerman_bitset(component, ordered_nodes):
+            yield clique
+
+
+def _get_cliques_kellerman_bitset(nodes_list, ordered_nodes, graph=None):
+    if ordered_nodes:
+        nodes = nodes_list
+    else:
+        _, nodes = get_degeneracy_ordering(nodes_list)
+    size = len(nodes)
+    position = {node: i for (i, node) in enumerate(nodes)}
+    neighbours_less = []
+    neighbours_greater = []
+    for i in range(size):
+        adjacent = nodes[i].adjacent if graph is None else graph.adjacent(nodes[i])
+        positions = [j for j in (position.get(node) for node in adjacent) if j is not None]
+        neighbours_less.append(to_bitset((j for j in positions if j < i), size))
+        neighbours_greater.append(to_bitset((j for j in positions if j > i), size))
+    cliques = []  # type: [int]
+    # can_add_to_clique[l] are the vertices that are adjacent to every member of clique l
+    can_add_to_clique = []  # type: [int]
+    # candidate_cliques[i] are the cliques that had i in can_add_to_clique when they were created
+    candidate_cliques = [[] for _ in range(size)]
+    in_cliques = [[] for _ in range(size)]
+    final_after = [[] for _ in range(size)]
+
+    for i in range(size):
+        bit = 1 << i
+        # No edge to a later vertex is covered before that vertex is processed
+        uncovered = neighbours_less[i]
+        if uncovered == 0:
+            _add_clique(bit, neighbours_greater[i], i, cliques, can_add_to_clique, candidate_cliques, in_cliques,
+                        final_after)
+
+        for l in candidate_cliques[i]:
+            if uncovered == 0:
+                break
+            clique = cliques[l]
+            if can_add_to_clique[l] & bit and clique & ~neighbours_less[i] == 0 and clique & uncovered:
+                cliques[l] = clique | bit
+                can_add_to_clique[l] &= neighbours_greater[i]
+                in_cliques[i].append(l)
+                uncovered &= ~clique
+        candidate_cliques[i] = None
+
+        while uncovered:
+            # The clique covering the most uncovered edges to lower neighbours is extended by i
+            best_clique = 0
+            best_size = 0
+            seen = set()
+            for j in iterate_bits(uncovered):
+                for l in in_cliques[j]:
+                    if l in seen:
+                        continue
+                    seen.add(l)
+                    overlap = cliques[l] & uncovered
+                    overlap_size = popcount(overlap)
+                    if overlap_size > best_size:
+                        best_size = overlap_size
+                        best_clique = overlap
+            uncovered &= ~best_clique
+            new_clique = best_clique | bit
+            addable = neighbours_greater[i]
+            for j in iterate_bits(best_clique):
+                addable &= neighbours_greater[j]
+            _add_clique(new_clique, addable, i, cliques, can_add_to_clique, candidate_cliques, in_cliques,
+                        final_after)
+
+        for l in final_after[i]:
+            yield {nodes[n] for n in iterate_bits(cliques[l])}
+        final_after[i] = None
+
+
+def _add_clique(clique, addable, i, cliques, can_add_to_clique, candidate_cliques, in_cliques, final_after):
+    l = len(cliques)
+    cliques.append(clique)
+    can_add_to_clique.append(addable)
+    for j in iterate_bits(clique):
+        in_cliques[j].append(l)
+    for j in iterate_bits(addable):
+        candidate_cliques[j].append(l)
+    final_after[addable.bit_length() - 1 if addable else i].append(l)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from . import Graph
+from .graph import get_core_decomposition
+from .bron_kerbosch import _bron_kerbosch_iterative, _get_adjacent, _get_pivot_rule
+
+
+def get_cliques_containing_node(node, graph: Graph = None, pivot: str = 'tomita'):
+    """
+    The maximal cliques that contain node, found by Bron-Kerbosch on the neighbourhood of node only, so the work
+    does not depend on the size of the rest of the graph. node is a Node, or with graph a vertex of graph.
+    """
+    return get_cliques_containing_nodes([node], graph, pivot)
+
+
+def get_cliques_containing_edge(u, v, graph: Graph = None, pivot: str = 'tomita'):
+    """
+    The maximal cliques that contain both u and v, found by Bron-Kerbosch on their common neighbourhood. u and v
+    are Nodes, or with graph vertices of graph.
+    """
+    rule = _get_pivot_rule(pivot)
+    adjacent_of = _get_adjacent_of(graph)
+    _check_vertex(u, graph)
+    _check_vertex(v, graph)
+    if not (graph.has_edge(u, v) if graph is not None else v in u.adjacent):
+        raise ValueError('{} and {} are not adjacent'.format(_name(u, graph), _name(v, graph)))
+    p = set(adjacent_of(u)).intersection(adjacent_of(v))
+    return _bron_kerbosch_local([u, v], p, set(), adjacent_of, graph, rule)
+
+
+def get_cliques_containing_nodes(nodes, graph: Graph = None, pivot: str = 'tomita'):
+    """
+    The maximal cliques that contain at least one of nodes, each once. The nodes are searched in a degeneracy
+    ordering of the subgraph they induce, and a clique is only reported by the first of its nodes in that
+    ordering: the nodes before are moved from P to X of the later searches. nodes are Nodes, or with graph
+    vertices of graph.
+    """
+    rule = _get_pivot_rule(pivot)
+    adjacent_of = _get_adjacent_of(graph)
+    nodes = list(dict.fromkeys(nodes))
+    for node in nodes:
+        _check_vertex(node, graph)
+    rank = _get_local_rank(nodes, graph)
+    done = set()
+    for node in sorted(nodes, key=rank.__getitem__):
+        adjacent = adjacent_of(node)
+        p = {u for u in adjacent if u not in done}
+        x = done.intersection(adjacent)
+        for clique in _bron_kerbosch_local([node], p, x, adjacent_of, graph, rule):
+            yield clique
+        done.add(node)
+
+
+def _bron_kerbosch_local(r: list, p: set, x: set, adjacent_of, graph: Graph, rule):
+    local = p | x
+    if graph is not None:
+        # Only the neighbourhood takes part in the search, so that is all that is expanded into sets
+        adjacency = {u: local.intersection(adjacent_of(u)) for u in local}
+        adjacent_of = adjacency.__getitem__
+    rank = _get_local_rank(list(local), graph)
+    return _bron_kerbosch_iterative(r, p, x, adjacent_of, rank, None, None, rule)
+
+
+def _get_local_rank(vertices: list, graph: Graph = None) -> dict:
+    """
+    The position of every vertex in a degeneracy ordering of the subgraph induced by vertices, with ties broken
+    by vertex or name, so the cliques come out in the same order on every run.
+    """
+    vertices.sort(key=None if graph is not None else lambda n: n.name)
+    local = graph.subgraph(vertices) if graph is not None else Graph.from_nodes(vertices)
+    ordering, _ = get_core_decomposition(local.offsets, local.neighbours)
+    return {vertices[i]: position for (position, i) in enumerate(ordering)}
+
+
+def _get_adjacent_of(graph: Graph):
+    return _get_adjacent if graph is None else graph.adjacent
+
+
+def _check_vertex(vertex, graph: Graph):
+    if graph is not None and not 0 <= vertex < len(graph):
+        raise ValueError('Vertex {} out of range for a graph of {} vertices'.format(vertex, len(graph)))
+
+
+def _name(vertex, graph: Graph) -> str:
+    return graph.name(vertex) if graph is not None else vertex.name
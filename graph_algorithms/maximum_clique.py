@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from time import monotonic
+from . import Graph, get_components, get_core_numbers, get_degeneracy_ordering
+from .graph import get_ranks
+from .bitset import get_local_rows
+
+
+class _Budget(Exception):
+    pass
+
+
+def get_maximum_clique(nodes, node_limit: int = None, deadline: float = None) -> (set, bool):
+    """
+    A maximum clique of the graph by branch and bound, and whether it is proven to be maximum.
+
+    Vertices are searched in degeneracy order, each together with its later neighbours only, and every branch is
+    bounded by a greedy colouring of its candidates. The degeneracy number d bounds the clique size by d + 1
+    from the start, and components that are too small or have too low core numbers are skipped.
+
+    The search stops after node_limit branch and bound nodes or deadline seconds; the best clique found so far is
+    returned then, together with False.
+    """
+    if len(nodes) == 0:
+        return set(), True
+    d, nodes_ordered = get_degeneracy_ordering(nodes)
+    if isinstance(nodes, Graph):
+        adjacent_of = nodes.adjacent
+        rank = get_ranks(nodes_ordered)
+    else:
+        rank = {v: i for (i, v) in enumerate(nodes_ordered)}
+
+        def adjacent_of(node):
+            return [n for n in node.adjacent if n in rank]
+    core = get_core_numbers(nodes)
+    search = _MaximumCliqueSearch(node_limit, deadline)
+    search.best = _get_greedy_clique(nodes_ordered, rank, adjacent_of, d + 1)
+    if len(search.best) == d + 1:
+        return set(search.best), True
+    components = sorted(get_components(nodes), key=len, reverse=True)
+    try:
+        for component in components:
+            if len(component) <= len(search.best) or max(core[v] for v in component) + 1 <= len(search.best):
+                continue
+            for v in sorted(component, key=rank.__getitem__):
+                if core[v] + 1 <= len(search.best):
+                    continue
+                search.expand_vertex(v, adjacent_of, rank)
+                if len(search.best) == d + 1:
+                    return set(search.best), True
+    except _Budget:
+        return set(search.best), False
+    return set(search.best), True
+
+
+def _get_greedy_clique(nodes_ordered, rank, adjacent_of, upper_bound: int) -> list:
+    # Vertices late in the degeneracy ordering are in the densest cores, so they are tried first
+    best = [nodes_ordered[-1]]
+    for v in reversed(nodes_ordered):
+        later = sorted((u for u in adjacent_of(v) if rank[u] > rank[v]), key=rank.__getitem__, reverse=True)
+        if len(later) + 1 <= len(best):
+            continue
+        clique = [v]
+        candidates = set(later)
+        for u in later:
+            if u in candidates:
+                clique.append(u)
+                candidates.intersection_update(adjacent_of(u))
+        if len(clique) > len(best):
+            best = clique
+            if len(best) == upper_bound:
+                break
+    return best
+
+
+class _MaximumCliqueSearch:
+    def __init__(self, node_limit: int, deadline: float):
+        self.best = []
+        self.node_limit = node_limit
+        self.end_time = None if deadline is None else monotonic() + deadline
+        self.nodes_searched = 0
+
+    def expand_vertex(self, v, adjacent_of, rank):
+        vertices = [u for u in adjacent_of(v) if rank[u] > rank[v]]
+        if len(vertices) + 1 <= len(self.best):
+            return
+        self.expand([v], (1 << len(vertices)) - 1, get_local_rows(vertices, adjacent_of), vertices)
+
+    def expand(self, clique: list, p: int, rows: [int], vertices: list):
+        self.nodes_searched += 1
+        if self.node_limit is not None and self.nodes_searched > self.node_limit:
+            raise _Budget()
+        if self.end_time is not None and monotonic() >= self.end_time:
+            raise _Budget()
+        (order, colours) = _colour_sort(p, rows)
+        for i in range(len(order) - 1, -1, -1):
+            if len(clique) + colours[i] <= len(self.best):
+                return
+            v = order[i]
+            clique.append(vertices[v])
+            new_p = p & rows[v]
+            if new_p:
+                self.expand(clique, new_p, rows, vertices)
+            elif len(clique) > len(self.best):
+                self.best = list(clique)
+            clique.pop()
+            p &= ~(1 << v)
+
+
+def _colour_sort(p: int, rows: [int]) -> ([int], [int]):
+    """
+    Greedy colouring of the candidates p. Returns the candidates ordered by colour and the colour of each, which
+    bounds the size of a clique among the candidates up to that one.
+    """
+    order = []
+    colours = []
+    colour = 0
+    uncoloured = p
+    while uncoloured:
+        colour += 1
+        q = uncoloured
+        while q:
+            lowest = q & -q
+            v = lowest.bit_length() - 1
+            uncoloured ^= lowest
+            q &= ~rows[v]
+            q ^= lowest
+            order.append(v)
+            colours.append(colour)
+    return order, colours
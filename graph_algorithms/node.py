@@ -22,28 +22,53 @@
 # SOFTWARE.
 
 import math
-from collections import Iterable
-from iterable import first
+import sys
+from array import array
+from collections.abc import Iterable
+from itertools import count
+from .graph import Graph, get_core_decomposition, get_graph_core_decomposition, \
+    get_graph_degeneracy_ordering, get_graph_components, order_components
+from .instrumentation import SearchStats, timed
 
 
 class Node:
+    """
+    A node of a graph, with its name and the set of adjacent nodes. Every node gets a dense integer id on creation.
+    Nodes hash and compare by identity, which is the same as by id and faster, because it needs no Python code.
+    """
+    __slots__ = ('name', 'adjacent', 'id', 'owner')
+
+    _ids = count()
+
     def __init__(self, name: str = ""):
         self.name = name
         self.adjacent = set()
-        self.degeneracy_cell_index = 0
-        self.visited = False
+        self.id = next(Node._ids)
+        # The NodeGraph whose memoized results change with the adjacency of this node
+        self.owner = None
 
     def add_adjacent(self, *args):
         for element in args:
-            if isinstance(element, Iterable):
-                for node in element:
-                    self.add_adjacent(node)
-            elif isinstance(element, Node):
+            if isinstance(element, Node):
                 self.adjacent.add(element)
+            elif isinstance(element, Iterable):
+                for node in element:
+                    if isinstance(node, Node):
+                        self.adjacent.add(node)
+                    else:
+                        self.add_adjacent(node)
             else:
                 raise ValueError(
                     'Input must either be of class node or an iterable of Node. Received {} instead'.format(
                         type(element)))
+        if self.owner is not None:
+            self.owner.invalidate()
+
+    def remove_adjacent(self, *nodes):
+        for node in nodes:
+            self.adjacent.discard(node)
+        if self.owner is not None:
+            self.owner.invalidate()
     
     def __str__(self):
         return self.name
@@ -51,120 +76,258 @@ class Node:
     __repr__ = __str__
 
 
-def print_statistics(nodes: [Node]):
-    print("Graph statistics")
-    edges = math.floor(sum(len(n.adjacent) for n in nodes) / 2)
-    density = edges / len(nodes) / (len(nodes) + 1)
-    print("  Nodes      : {:8}\n  Edges      : {:8}\n  Density    : {:8.2%}".format(len(nodes),edges,density))
-    print("  Expected maximal cliques in random graph = {}".format(
-        expected_maximal_cliques_in_random_graph(len(nodes),density)))
-    queue = []
-    components = []
-    for node in nodes:
-        node.visited = False
-    for node in nodes:
-        if node.visited:
-            continue
-        queue.append(node)
-        new_component = []
-        while len(queue) > 0:
-            next_node = queue.pop()
-            new_component.append(next_node)
-            for neighbour in next_node.adjacent:
-                if not neighbour.visited:
-                    neighbour.visited = True
-                    queue.append(neighbour)
-        components.append(new_component)
-    print("\n  Components : {:8}".format(len(components)))
-    print("    Smallest component: {}".format(min([len(component) for component in components])))
-    print("    Largest component : {}".format(max([len(component) for component in components])))
-    min_expected_cliques = len(nodes) + edges
-    max_expected_cliques = 0
-    total_expected_cliques = 0
-    for (i, component) in enumerate(components):
-        edges = math.floor(sum(len(n.adjacent) for n in component) / 2)
-        density = edges / len(component) / (len(component) + 1)
-        expected_cliques = expected_maximal_cliques_in_random_graph(len(component), density)
-        if expected_cliques < min_expected_cliques:
-            min_expected_cliques = expected_cliques
-        if expected_cliques > max_expected_cliques:
-            max_expected_cliques = expected_cliques
-        total_expected_cliques += expected_cliques
-    avg_expected_cliques = total_expected_cliques / len(components)
-    
-    print("    Expected maximal cliques in random graphs")
-    print("      Min             : {}".format(min_expected_cliques))
-    print("      Avg             : {}".format(avg_expected_cliques))
-    print("      Max             : {}".format(max_expected_cliques))
-    print("      Total           : {}".format(total_expected_cliques))
+class NodeView:
+    """
+    Read-only view of the vertex id of a Graph with the interface of Node, created on demand, so that a large graph
+    needs no Node per vertex. Views of the same vertex of the same graph are equal.
+    """
+    __slots__ = ('graph', 'id')
+
+    def __init__(self, graph: Graph, vertex: int):
+        self.graph = graph
+        self.id = vertex
+
+    @property
+    def name(self) -> str:
+        return self.graph.name(self.id)
+
+    @property
+    def adjacent(self) -> frozenset:
+        return frozenset(NodeView(self.graph, u) for u in self.graph.adjacent(self.id))
+
+    def add_adjacent(self, *args):
+        raise ValueError('{} is a read-only view of a Graph. Use Graph.to_nodes for nodes that can change'.format(
+            self.name))
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __eq__(self, other):
+        return isinstance(other, NodeView) and self.id == other.id and self.graph is other.graph
+
+    def __str__(self):
+        return self.name
+
+    __repr__ = __str__
+
+
+class NodeGraph:
+    """
+    A list of Node that memoizes its degeneracy ordering, core numbers and components, so that repeated analyses
+    of an unchanged graph do not compute them again. The algorithms of graph_algorithms accept a NodeGraph wherever
+    they accept a list of Node and use the memoized results.
+
+    The nodes belong to the NodeGraph: Node.add_adjacent and Node.remove_adjacent invalidate the memoized results.
+    Changing Node.adjacent directly does not, call invalidate afterwards. A node belongs to at most one NodeGraph.
+    """
+
+    def __init__(self, nodes=()):
+        self.nodes = []
+        self._cache = {}
+        for node in nodes:
+            self.add_node(node)
+
+    def add_node(self, node: Node):
+        if node.owner is self:
+            raise ValueError('Node {} already belongs to this NodeGraph'.format(node))
+        if node.owner is not None:
+            raise ValueError('Node {} already belongs to another NodeGraph'.format(node))
+        node.owner = self
+        self.nodes.append(node)
+        self.invalidate()
+
+    def invalidate(self):
+        if len(self._cache) > 0:
+            self._cache.clear()
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __getitem__(self, index):
+        return self.nodes[index]
+
+    def _get(self, key: str, compute):
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = compute()
+        return value
+
+    def get_graph(self) -> (Graph, [Node]):
+        """
+        The Graph of the nodes sorted by name, and the sorted nodes: vertex i of the graph is the i-th node.
+        """
+        def compute():
+            nodes = sorted(self.nodes, key=lambda n: n.name)
+            return Graph.from_nodes(nodes), nodes
+        return self._get('graph', compute)
+
+    def get_degeneracy_ordering(self) -> (int, [Node]):
+        def compute():
+            (graph, nodes) = self.get_graph()
+            d, ordering = get_graph_degeneracy_ordering(graph)
+            return d, [nodes[v] for v in ordering]
+        d, ordering = self._get('degeneracy_ordering', compute)
+        return d, list(ordering)
+
+    def get_core_numbers(self) -> {Node: int}:
+        def compute():
+            (graph, nodes) = self.get_graph()
+            _, core = get_graph_core_decomposition(graph)
+            return {node: core[i] for (i, node) in enumerate(nodes)}
+        return dict(self._get('core_numbers', compute))
+
+    def get_components(self) -> [[Node]]:
+        def compute():
+            (graph, nodes) = self.get_graph()
+            return [[nodes[v] for v in component] for component in get_graph_components(graph)]
+        return [list(component) for component in self._get('components', compute)]
+
+    def get_ordered_components(self) -> [[Node]]:
+        """
+        The components, each in the degeneracy ordering of the whole graph, which is a degeneracy ordering of the
+        component.
+        """
+        def compute():
+            return order_components(self.get_components(), self.get_degeneracy_ordering()[1])
+        return [list(component) for component in self._get('ordered_components', compute)]
+
+
+def print_statistics(nodes):
+    from .summary import graph_statistics
+    print(graph_statistics(nodes))
 
 
 def expected_maximal_cliques_in_random_graph(nodes: int, edge_probability: float) -> float:
-    last_term = nodes * math.pow(1 - edge_probability, nodes - 1)
-    expected_maximal = last_term
-    for d in range(1, nodes):
-        mult = (nodes - d) / (d + 1) * math.pow(edge_probability, d)
-        mult *= math.pow(1 - math.pow(edge_probability, d + 1), nodes - d - 1)
-        mult /= math.pow(1 - math.pow(edge_probability, d), nodes - d)
-        new_term = last_term * mult
-        expected_maximal += new_term
-        last_term = new_term
-    return expected_maximal
-
-
-def get_degeneracy_ordering(nodes) -> (int, [Node]):
-    max_degree = max(len(n.adjacent) for n in nodes)
-    nodes_of_degree = [set() for _ in range(max_degree + 1)]
-    smallest_index = len(nodes)
-    degeneracy_ordering = []
-    for node in nodes:
-        degree = len(node.adjacent)
-        nodes_of_degree[degree].add(node)
-        node.degeneracy_cell_index = degree
-        node.visited = False
-        if degree < smallest_index:
-            smallest_index = degree
-    degeneracy_number = 0
-    for _ in nodes:
-        while len(nodes_of_degree[smallest_index]) == 0:
-            smallest_index += 1
-        if smallest_index > degeneracy_number:
-            degeneracy_number = smallest_index
-        node = first(nodes_of_degree[smallest_index])
-        for n in nodes_of_degree[smallest_index]:
-            if n.name < node.name:
-                node = n
-        nodes_of_degree[smallest_index].remove(node)
-        node.visited = True
-        for n in node.adjacent:
-            if not n.visited:
-                nodes_of_degree[n.degeneracy_cell_index].remove(n)
-                n.degeneracy_cell_index -= 1
-                nodes_of_degree[n.degeneracy_cell_index].add(n)
-                if n.degeneracy_cell_index < smallest_index:
-                    smallest_index = n.degeneracy_cell_index
-    
-        degeneracy_ordering.append(node)
-    return degeneracy_number, degeneracy_ordering
+    """
+    The expected number of maximal cliques of the random graph G(nodes, edge_probability), or inf if it is too
+    large for a float.
+    """
+    log_expected_cliques = log_expected_maximal_cliques_in_random_graph(nodes, edge_probability)
+    return math.exp(log_expected_cliques) if log_expected_cliques < _LOG_LARGEST_FLOAT else math.inf
+
+
+_LOG_LARGEST_FLOAT = math.log(sys.float_info.max)
+
+
+def log_expected_maximal_cliques_in_random_graph(nodes: int, edge_probability: float) -> float:
+    """
+    The natural logarithm of the expected number of maximal cliques of G(nodes, edge_probability). There are
+    C(n, k) p ^ C(k, 2) (1 - p ^ k) ^ (n - k) maximal cliques of size k in expectation; the terms are summed in
+    log-space, so they neither underflow nor overflow, and only up to get_largest_clique_size.
+    """
+    if nodes <= 0:
+        return -math.inf
+    if edge_probability <= 0:
+        return math.log(nodes)
+    if edge_probability >= 1:
+        return 0.0
+    log_p = math.log(edge_probability)
+    log_binomial = 0.0
+    log_terms = []
+    for k in range(1, get_largest_clique_size(nodes, edge_probability) + 1):
+        log_binomial += math.log(nodes - k + 1) - math.log(k)
+        log_terms.append(log_binomial + k * (k - 1) / 2 * log_p + (nodes - k) * math.log1p(-math.exp(k * log_p)))
+    largest = max(log_terms)
+    return largest + math.log(sum(math.exp(term - largest) for term in log_terms))
+
+
+def get_largest_clique_size(nodes: int, edge_probability: float) -> int:
+    """
+    The clique size beyond which the terms of log_expected_maximal_cliques_in_random_graph are negligible, below
+    e ^ -40 of the expected number of maximal cliques, which is at least 1.
+    """
+    if edge_probability >= 1:
+        return nodes
+    if edge_probability <= 0:
+        return min(nodes, 1)
+    # The term of size k is at most exp(k (log n - (k - 1) / 2 log(1 / p))), which is below exp(-k (log n + log(1 / p)
+    # / 2)) from twice the size where it drops below 1
+    log_n = math.log(nodes)
+    log_inverse_p = -math.log(edge_probability)
+    size = max(2 * (1 + 2 * log_n / log_inverse_p), 40 / (log_n + log_inverse_p / 2))
+    return min(nodes, math.ceil(size) + 1)
+
 
+def get_degeneracy_ordering(nodes, stats: SearchStats = None) -> (int, [Node]):
+    if stats is not None:
+        return timed(stats, 'degeneracy_ordering', get_degeneracy_ordering, nodes)
+    if isinstance(nodes, NodeGraph):
+        return nodes.get_degeneracy_ordering()
+    if isinstance(nodes, Graph):
+        return get_graph_degeneracy_ordering(nodes)
+    # Nodes of equal degree leave the bucket queue in name order
+    nodes = sorted(nodes, key=lambda n: n.name)
+    ordering, core = _get_core_decomposition(nodes)
+    return max(core, default=0), [nodes[i] for i in ordering]
 
-def get_components(nodes) -> []:
+
+def get_core_numbers(nodes) -> {Node: int}:
+    """
+    The core number of every node: the largest k such that the node is in the k-core. For a Graph, an array
+    indexed by vertex.
+    """
+    if isinstance(nodes, NodeGraph):
+        return nodes.get_core_numbers()
+    if isinstance(nodes, Graph):
+        _, core = get_graph_core_decomposition(nodes)
+        return core
+    _, core = _get_core_decomposition(nodes)
+    return {node: core[i] for (i, node) in enumerate(nodes)}
+
+
+def get_k_core(nodes, k: int):
+    """
+    The k-core: the largest subgraph in which every node has at least k neighbours. For a list of Node, the
+    nodes of the k-core in input order. For a Graph, the induced subgraph of the k-core.
+    """
+    if isinstance(nodes, Graph):
+        _, core = get_graph_core_decomposition(nodes)
+        return nodes.subgraph([v for v in range(len(nodes)) if core[v] >= k])
+    if isinstance(nodes, NodeGraph):
+        core_numbers = nodes.get_core_numbers()
+        return [node for node in nodes if core_numbers[node] >= k]
+    _, core = _get_core_decomposition(nodes)
+    return [node for (i, node) in enumerate(nodes) if core[i] >= k]
+
+
+def _get_core_decomposition(nodes: [Node]) -> (array, array):
+    # The neighbours of a Graph are sorted, so the ordering does not depend on the iteration order of the adjacency
+    # sets
+    graph = Graph.from_nodes(nodes)
+    return get_core_decomposition(graph.offsets, graph.neighbours)
+
+
+def get_components(nodes, stats: SearchStats = None) -> []:
+    if stats is not None:
+        return timed(stats, 'components', get_components, nodes)
+    if isinstance(nodes, NodeGraph):
+        return nodes.get_components()
+    if isinstance(nodes, Graph):
+        return get_graph_components(nodes)
+    # Only the subgraph induced by nodes is traversed. The traversal state lives in this call, never in the nodes,
+    # so any number of threads can search the same nodes at once
+    index = {node: i for (i, node) in enumerate(nodes)}
+    # A node listed twice is indexed at its last position and seen as visited there
+    visited = bytearray(len(nodes))
     components = []
-    for node in nodes:
-        node.visited = False
     queue = []
     for node in nodes:
-        if node.visited:
+        i = index[node]
+        if visited[i]:
             continue
         new_component = []
-        node.visited = True
+        visited[i] = 1
         queue.append(node)
         while len(queue) > 0:
             next_node = queue.pop()
             new_component.append(next_node)
             for neighbour in next_node.adjacent:
-                if not neighbour.visited:
-                    neighbour.visited = True
+                j = index.get(neighbour)
+                if j is not None and not visited[j]:
+                    visited[j] = 1
                     queue.append(neighbour)
         components.append(new_component)
     return components
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from math import pow
+from multiprocessing import Pool, Queue, cpu_count
+from queue import Empty
+from . import Graph, get_components
+from .bron_kerbosch import _bron_kerbosch_graph_vertex
+from .bron_kerbosch_bitset import _bron_kerbosch_bitset_vertex
+from .kellerman import _get_cliques_kellerman
+from .kellerman_bitset import _get_cliques_kellerman_bitset
+from .shared_graph import SharedGraph
+
+# Components with at most this many vertices are sent to a worker as a whole instead of vertex by vertex
+SMALL_COMPONENT_SIZE = 64
+# Number of tasks per worker the vertices are packed into, so the slowest task does not dominate the run time
+TASKS_PER_WORKER = 16
+# The workers send the cliques back in chunks of CHUNK_SIZE as they find them, and wait while QUEUED_CHUNKS
+# chunks are not taken yet, so neither the workers nor the queue hold more than that
+CHUNK_SIZE = 1024
+QUEUED_CHUNKS = 64
+# While no chunk arrives, the workers are checked every POLL_SECONDS, so a failed or killed worker raises an
+# error instead of the cliques waiting for it forever
+POLL_SECONDS = 1.0
+
+_shared = None  # type: SharedGraph
+_graph = None  # type: Graph
+_rank = None
+_engine = None
+_queue = None  # type: Queue
+
+
+def get_cliques_parallel(nodes, workers: int = None, engine: str = 'bron_kerbosch_bitset'):
+    """
+    Bron-Kerbosch (engine 'bron_kerbosch' or 'bron_kerbosch_bitset') or Kellerman (engine 'kellerman' or
+    'kellerman_bitset') on a process pool with workers processes, cpu_count() by default.
+
+    For Bron-Kerbosch, the subproblem of every top-level vertex of the degeneracy ordering is independent. Small
+    components are solved as a whole, the vertices of the remaining ones are packed into tasks by their
+    estimated cost and handed out largest first. Kellerman covers one component per task.
+
+    The cliques are streamed back in chunks of CHUNK_SIZE while the tasks run, and yielded in no particular
+    order. A worker waits when QUEUED_CHUNKS chunks are queued, so its memory does not grow with the number of
+    cliques of a task.
+
+    The graph is exported into a SharedGraph once, which the workers attach to instead of receiving a copy each.
+    nodes can also be a SharedGraph already exported, which is then used as it is and left open.
+
+    A failed task raises its exception. A worker process that ends while the search runs, killed by a signal or
+    out of memory, raises RuntimeError, since the pool drops the task it was running.
+    """
+    if engine not in ('bron_kerbosch', 'bron_kerbosch_bitset', 'kellerman', 'kellerman_bitset'):
+        raise ValueError('Unknown engine {}'.format(engine))
+    if workers is None:
+        workers = cpu_count()
+    if isinstance(nodes, SharedGraph):
+        shared = nodes
+    else:
+        shared = SharedGraph(nodes if isinstance(nodes, Graph) else Graph.from_nodes(nodes))
+    try:
+        graph = shared.graph
+        if engine in ('kellerman', 'kellerman_bitset'):
+            tasks = _get_component_tasks(graph, shared.rank)
+        else:
+            tasks = _get_vertex_tasks(graph, shared.rank, workers)
+        queue = Queue(QUEUED_CHUNKS)
+        with Pool(workers, _initialize_worker, (shared.name, engine, queue)) as pool:
+            # The pool replaces a worker that ended, so the ones started with it are kept to check them
+            processes = list(pool._pool)
+            result = pool.map_async(_solve, tasks, chunksize=1)
+            # Every task ends its chunks with None, also when it fails
+            running = len(tasks)
+            while running > 0:
+                try:
+                    cliques = queue.get(timeout=POLL_SECONDS)
+                except Empty:
+                    if result.ready():
+                        # Raises the exception of a failed task
+                        result.get()
+                    ended = [process for process in processes if process.exitcode is not None]
+                    if len(ended) > 0:
+                        raise RuntimeError('Worker process {} ended with exit code {} while the search ran'.format(
+                            ended[0].pid, ended[0].exitcode))
+                    continue
+                if cliques is None:
+                    running -= 1
+                    continue
+                for clique in cliques:
+                    if isinstance(nodes, (Graph, SharedGraph)):
+                        yield set(clique)
+                    else:
+                        yield {nodes[v] for v in clique}
+            # Raises the exception of a failed task
+            result.get()
+    finally:
+        if shared is not nodes:
+            shared.close()
+
+
+def _get_subproblem_cost(later_neighbours: int) -> float:
+    # Bron-Kerbosch is O(d * 3 ^ (d / 3)) in the number of later neighbours d
+    return (later_neighbours + 1) * pow(3, min(later_neighbours, 1800) / 3)
+
+
+def _get_vertex_tasks(graph: Graph, rank, workers: int) -> [[int]]:
+    units = []
+    for component in get_components(graph):
+        costs = [_get_subproblem_cost(sum(1 for u in graph.adjacent(v) if rank[u] > rank[v])) for v in component]
+        if len(component) <= SMALL_COMPONENT_SIZE:
+            units.append((sum(costs), component))
+        else:
+            units.extend((cost, [v]) for (cost, v) in zip(costs, component))
+    units.sort(key=lambda unit: unit[0], reverse=True)
+    target = sum(unit[0] for unit in units) / (workers * TASKS_PER_WORKER)
+    tasks = []
+    task = []
+    task_cost = 0
+    for (cost, vertices) in units:
+        task.extend(vertices)
+        task_cost += cost
+        if task_cost >= target:
+            tasks.append(task)
+            task = []
+            task_cost = 0
+    if len(task) > 0:
+        tasks.append(task)
+    return tasks
+
+
+def _get_component_tasks(graph: Graph, rank) -> [[int]]:
+    components = [sorted(component, key=rank.__getitem__) for component in get_components(graph)]
+    components.sort(key=lambda component: len(component), reverse=True)
+    return components
+
+
+def _initialize_worker(name: str, engine: str, queue: Queue):
+    global _shared, _graph, _rank, _engine, _queue
+    # Kept referenced for the life of the worker, since the graph and the ranks are views of its block
+    _shared = SharedGraph.attach(name)
+    _graph = _shared.graph
+    _rank = _shared.rank
+    _engine = engine
+    _queue = queue
+
+
+def _solve(vertices: [int]):
+    try:
+        chunk = []
+        for clique in _get_task_cliques(vertices):
+            chunk.append(tuple(clique))
+            if len(chunk) == CHUNK_SIZE:
+                _queue.put(chunk)
+                chunk = []
+        if len(chunk) > 0:
+            _queue.put(chunk)
+    finally:
+        _queue.put(None)
+
+
+def _get_task_cliques(vertices: [int]):
+    if _engine == 'kellerman':
+        return _get_cliques_kellerman(vertices, True, _graph)
+    if _engine == 'kellerman_bitset':
+        return _get_cliques_kellerman_bitset(vertices, True, _graph)
+    return _get_vertex_cliques(vertices)
+
+
+def _get_vertex_cliques(vertices: [int]):
+    for v in vertices:
+        if _engine == 'bron_kerbosch':
+            subproblem = _bron_kerbosch_graph_vertex(_graph, _rank, v)
+        else:
+            subproblem = _bron_kerbosch_bitset_vertex(v, _graph.adjacent(v), _rank, _graph.adjacent)
+        for clique in subproblem:
+            yield clique
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import math
+import random
+from time import perf_counter
+from . import Graph, expected_maximal_cliques_in_random_graph, get_components, get_core_numbers
+from .engines import ENGINES
+from .generators import get_random_graph
+from .summary import get_density
+
+# Cost model coefficients per engine for the features of _get_model_features, from calibrate() on a reference host
+DEFAULT_COEFFICIENTS = {
+    'bron_kerbosch': [-11.9898, -0.1161, -0.0471, -0.0116, 0.6946, 1.1921],
+    'bron_kerbosch_bitset': [-11.441, -0.3002, 0.1723, -0.0117, -0.3376, 1.0656],
+    'kellerman': [-10.4805, -0.3009, 0.1998, -0.0191, -2.8766, 1.0183],
+    'kellerman_bitset': [-10.6624, -0.2182, 0.1245, -0.0346, -2.9856, 1.0469]
+}
+
+
+class ComponentPlan:
+    def __init__(self, component: list, features: {str: float}, costs: {str: float}):
+        self.component = component
+        self.features = features
+        self.costs = costs
+        self.engine = min(costs, key=costs.__getitem__)
+
+    def __str__(self):
+        return '{} nodes, {} edges, degeneracy {}, density {:.4f}, expected maximal cliques {:.3g}: {}'.format(
+            self.features['nodes'], self.features['edges'], self.features['degeneracy'], self.features['density'],
+            self.features['expected_cliques'],
+            ' < '.join('{} {}'.format(engine, _format_seconds(self.costs[engine]))
+                       for engine in sorted(self.costs, key=self.costs.__getitem__)))
+
+    __repr__ = __str__
+
+
+class CliquePlanner:
+    """
+    Chooses the clique engine separately for every component of the graph.
+
+    Every engine has a cost model, log(seconds) = coefficients . features, over cheap measured features of the
+    component: its size, edge count, degeneracy, density and the expected number of maximal cliques in a random
+    graph with the same size and density. calibrate() fits the models to a benchmark run on this host; by default
+    the models fitted on a reference host are used.
+
+    After get_cliques or plan, explain() reports the engine chosen for each component and the predicted costs.
+    """
+
+    def __init__(self, engines=None, coefficients: {str: [float]} = None):
+        self.engines = tuple(engines) if engines is not None else tuple(ENGINES)
+        for engine in self.engines:
+            if engine not in ENGINES:
+                raise ValueError('Unknown engine {}. Expected one of {}'.format(engine, ', '.join(ENGINES)))
+        self.coefficients = dict(DEFAULT_COEFFICIENTS if coefficients is None else coefficients)
+        self.plans = []  # type: [ComponentPlan]
+
+    def calibrate(self, sizes=(16, 32, 64, 128, 256), densities=(0.02, 0.05, 0.1, 0.2, 0.4),
+                  seed: int = 0) -> {str: [float]}:
+        """
+        Time every engine on random graphs of the given sizes and densities and fit the cost models to the timings.
+        """
+        generator = random.Random(seed)
+        samples = []
+        for size in sizes:
+            for density in densities:
+                nodes = get_random_graph(size, density, generator.getrandbits(32))
+                features = get_component_features(nodes, nodes, get_core_numbers(nodes))
+                timings = {}
+                for engine in self.engines:
+                    start = perf_counter()
+                    for _ in ENGINES[engine](nodes):
+                        pass
+                    timings[engine] = max(perf_counter() - start, 1e-7)
+                samples.append((_get_model_features(features), timings))
+        self.coefficients = {engine: _fit([x for (x, _) in samples], [math.log(t[engine]) for (_, t) in samples])
+                             for engine in self.engines}
+        return self.coefficients
+
+    def save(self, path: str):
+        with open(path, 'w') as file:
+            json.dump(self.coefficients, file, indent=2)
+
+    @classmethod
+    def load(cls, path: str, engines=None) -> 'CliquePlanner':
+        with open(path) as file:
+            return cls(engines, json.load(file))
+
+    def predict(self, features: {str: float}) -> {str: float}:
+        """
+        The predicted running time in seconds of every engine on a component with the given features.
+        """
+        x = _get_model_features(features)
+        costs = {}
+        for engine in self.engines:
+            if engine not in self.coefficients:
+                raise ValueError('The planner has no cost model for engine {}, calibrate it first'.format(engine))
+            if len(self.coefficients[engine]) != len(x):
+                raise ValueError('The cost model for engine {} has {} coefficients instead of {}, calibrate it '
+                                 'again'.format(engine, len(self.coefficients[engine]), len(x)))
+            exponent = sum(c * f for (c, f) in zip(self.coefficients[engine], x))
+            costs[engine] = math.exp(min(exponent, 700))
+        return costs
+
+    def plan(self, nodes) -> [ComponentPlan]:
+        core = get_core_numbers(nodes)
+        self.plans = [ComponentPlan(component, features, self.predict(features))
+                      for (component, features) in ((component, get_component_features(nodes, component, core))
+                                                    for component in get_components(nodes))]
+        return self.plans
+
+    def get_cliques(self, nodes):
+        for plan in self.plan(nodes):
+            engine = ENGINES[plan.engine]
+            if isinstance(nodes, Graph):
+                for clique in engine(nodes.subgraph(plan.component)):
+                    yield {plan.component[v] for v in clique}
+            else:
+                for clique in engine(plan.component):
+                    yield clique
+
+    def explain(self, components: int = 10) -> str:
+        """
+        A report of the engines chosen for the planned components, with the details of the components predicted to
+        be the most expensive.
+        """
+        if len(self.plans) == 0:
+            return 'Nothing has been planned'
+        chosen = {}
+        for plan in self.plans:
+            chosen[plan.engine] = chosen.get(plan.engine, 0) + 1
+        lines = ['Planned {} components: {}'.format(len(self.plans), ', '.join(
+                     '{} {}'.format(engine, count) for (engine, count) in sorted(chosen.items()))),
+                 'Predicted total: {}'.format(_format_seconds(sum(plan.costs[plan.engine] for plan in self.plans)))]
+        most_expensive = sorted(self.plans, key=lambda plan: plan.costs[plan.engine], reverse=True)[:components]
+        lines.append('Most expensive components:')
+        lines.extend('  {}'.format(plan) for plan in most_expensive)
+        return '\n'.join(lines)
+
+
+def get_component_features(nodes, component: list, core) -> {str: float}:
+    if isinstance(nodes, Graph):
+        edges = sum(nodes.degree(v) for v in component) // 2
+    else:
+        members = set(component)
+        edges = sum(1 for node in component for n in node.adjacent if n in members) // 2
+    size = len(component)
+    density = get_density(size, edges)
+    expected_cliques = expected_maximal_cliques_in_random_graph(size, density)
+    return {
+        'nodes': size,
+        'edges': edges,
+        'degeneracy': max(core[v] for v in component),
+        'density': density,
+        'expected_cliques': expected_cliques
+    }
+
+
+def _get_model_features(features: {str: float}) -> [float]:
+    return [
+        1.0,
+        math.log(features['nodes']),
+        math.log1p(features['edges']),
+        float(features['degeneracy']),
+        features['density'],
+        math.log1p(min(features['expected_cliques'], 1e300))
+    ]
+
+
+def _fit(x: [[float]], y: [float], regularization: float = 1e-3) -> [float]:
+    """
+    Ridge regression by the normal equations, (X^T X + r I) w = X^T y, solved by Gaussian elimination.
+    """
+    size = len(x[0])
+    a = [[sum(row[i] * row[j] for row in x) + (regularization if i == j else 0.0) for j in range(size)]
+         for i in range(size)]
+    b = [sum(row[i] * value for (row, value) in zip(x, y)) for i in range(size)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda i: abs(a[i][column]))
+        a[column], a[pivot] = a[pivot], a[column]
+        b[column], b[pivot] = b[pivot], b[column]
+        for i in range(column + 1, size):
+            factor = a[i][column] / a[column][column]
+            for j in range(column, size):
+                a[i][j] -= factor * a[column][j]
+            b[i] -= factor * b[column]
+    w = [0.0] * size
+    for i in range(size - 1, -1, -1):
+        w[i] = (b[i] - sum(a[i][j] * w[j] for j in range(i + 1, size))) / a[i][i]
+    return w
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return '{:.3g} us'.format(seconds * 1e6)
+    if seconds < 1:
+        return '{:.3g} ms'.format(seconds * 1e3)
+    return '{:.3g} s'.format(seconds)
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from time import perf_counter
+from . import Graph, NodeGraph
+from .instrumentation import SearchStats
+
+
+class Reduction:
+    """
+    What the reduction stage of get_cliques removed before the search, filled in while the cliques are found.
+
+    isolated, pendant and simplicial count the vertices peeled off with degree 0, degree 1 and a larger clique as
+    their neighbourhood, at the time they were peeled. twins counts the vertices merged into another vertex with
+    the same closed neighbourhood. direct_cliques counts the cliques emitted by the peeling without a search,
+    kernel_nodes and kernel_edges the size of what was left for the engine and seconds the time of the reduction.
+    """
+
+    def __init__(self):
+        self.nodes = 0
+        self.edges = 0
+        self.twins = 0
+        self.isolated = 0
+        self.pendant = 0
+        self.simplicial = 0
+        self.direct_cliques = 0
+        self.kernel_nodes = 0
+        self.kernel_edges = 0
+        self.seconds = 0.0
+
+    @property
+    def eliminated_nodes(self) -> int:
+        return self.nodes - self.kernel_nodes
+
+    @property
+    def eliminated_edges(self) -> int:
+        return self.edges - self.kernel_edges
+
+    @property
+    def eliminated_fraction(self) -> float:
+        return self.eliminated_nodes / self.nodes if self.nodes > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'nodes': self.nodes,
+            'edges': self.edges,
+            'twins': self.twins,
+            'isolated': self.isolated,
+            'pendant': self.pendant,
+            'simplicial': self.simplicial,
+            'direct_cliques': self.direct_cliques,
+            'kernel_nodes': self.kernel_nodes,
+            'kernel_edges': self.kernel_edges,
+            'seconds': self.seconds
+        }
+
+    def __str__(self):
+        return ('{} of {} vertices and {} of {} edges eliminated ({} twins, {} isolated, {} pendant, {} simplicial), '
+                '{} cliques without a search').format(
+            self.eliminated_nodes, self.nodes, self.eliminated_edges, self.edges, self.twins, self.isolated,
+            self.pendant, self.simplicial, self.direct_cliques)
+
+
+def get_cliques_reduced(nodes, engine: str = None, reduction: Reduction = None, stats: SearchStats = None):
+    """
+    The cliques of get_cliques(nodes, engine), with the graph reduced first. Vertices with the same closed
+    neighbourhood are merged, since every maximal clique contains all of them or none. Simplicial vertices, whose
+    neighbourhood is a clique, are then peeled off one after the other: the only maximal clique containing one is
+    its closed neighbourhood, which is emitted without a search. Isolated and degree-1 vertices are simplicial,
+    and peeling a vertex can make its neighbours simplicial. The engine only searches the kernel left over.
+
+    Strictly dominated vertices are not removed: the maximal cliques containing one are not implied by the
+    cliques of the rest of the graph, so removing them only works for the maximum clique.
+
+    reduction, if given, is filled in with what was eliminated. stats is passed on to the search of the kernel.
+    """
+    if reduction is None:
+        reduction = Reduction()
+    if isinstance(nodes, Graph):
+        graph = nodes
+        node_list = None
+    elif isinstance(nodes, NodeGraph):
+        graph, node_list = nodes.get_graph()
+    else:
+        node_list = list(nodes)
+        graph = Graph.from_nodes(node_list)
+    for clique in _get_cliques_reduced(graph, engine, reduction, stats):
+        yield clique if node_list is None else {node_list[v] for v in clique}
+
+
+def get_twins(graph: Graph) -> ([int], {int: [int]}):
+    """
+    representative[v] is the first vertex with the same closed neighbourhood as v, and twins maps every
+    representative with twins to the list of its twins.
+    """
+    representative = list(range(len(graph)))
+    twins = {}
+    first = {}
+    for v in range(len(graph)):
+        if graph.degree(v) == 0:
+            continue
+        closed_neighbourhood = list(graph.adjacent(v))
+        closed_neighbourhood.append(v)
+        closed_neighbourhood.sort()
+        u = first.setdefault(tuple(closed_neighbourhood), v)
+        if u != v:
+            representative[v] = u
+            twins.setdefault(u, []).append(v)
+    return representative, twins
+
+
+def _get_cliques_reduced(graph: Graph, engine: str, reduction: Reduction, stats: SearchStats):
+    from . import get_cliques
+    start = perf_counter()
+    n = len(graph)
+    reduction.nodes = n
+    reduction.edges = graph.number_of_edges
+    representative, twins = get_twins(graph)
+    reduction.twins = n - len(set(representative))
+    adjacency = [None] * n  # type: [set[int]]
+    for v in range(n):
+        if representative[v] == v:
+            adjacency[v] = {u for u in graph.adjacent(v) if representative[u] == u}
+    peeled = bytearray(n)
+    next_to_peeled = bytearray(n)
+    queue = [v for v in range(n - 1, -1, -1) if adjacency[v] is not None]
+    queued = bytearray(n)
+    for v in queue:
+        queued[v] = 1
+    while len(queue) > 0:
+        v = queue.pop()
+        queued[v] = 0
+        neighbours = adjacency[v]
+        if not _is_simplicial(neighbours, adjacency):
+            continue
+        if len(neighbours) == 0:
+            reduction.isolated += 1
+        elif len(neighbours) == 1:
+            reduction.pendant += 1
+        else:
+            reduction.simplicial += 1
+        clique = set(neighbours)
+        clique.add(v)
+        # A vertex still in the graph adjacent to all of the clique would be a neighbour of v, so only a vertex
+        # peeled before v can extend it, and then the clique is part of the one emitted for that vertex
+        if not _is_extended_by_peeled(clique, v, graph, peeled):
+            reduction.direct_cliques += 1
+            yield _add_twins(clique, twins)
+        peeled[v] = 1
+        adjacency[v] = None
+        for u in neighbours:
+            next_to_peeled[u] = 1
+            adjacency[u].discard(v)
+            if not queued[u]:
+                queued[u] = 1
+                queue.append(u)
+    kernel_vertices = [v for v in range(n) if adjacency[v] is not None]
+    adjacency = None
+    if len(kernel_vertices) == n:
+        # Nothing to map back, and the graph keeps its cached degeneracy ordering
+        kernel = graph
+    else:
+        kernel = graph.subgraph(kernel_vertices)
+    reduction.kernel_nodes = len(kernel)
+    reduction.kernel_edges = kernel.number_of_edges
+    reduction.seconds = perf_counter() - start
+    if len(kernel) == 0:
+        return
+    if kernel is graph:
+        for clique in get_cliques(kernel, engine, stats=stats):
+            yield clique
+        return
+    for kernel_clique in get_cliques(kernel, engine, stats=stats):
+        clique = {kernel_vertices[i] for i in kernel_clique}
+        # A peeled vertex extending the clique is adjacent to all of it
+        if all(next_to_peeled[v] for v in clique) and \
+                _is_extended_by_peeled(clique, min(clique, key=graph.degree), graph, peeled):
+            continue
+        yield _add_twins(clique, twins)
+
+
+def _is_simplicial(neighbours: set, adjacency: [set]) -> bool:
+    k = len(neighbours) - 1
+    for u in neighbours:
+        adjacent = adjacency[u]
+        if len(adjacent) < k:
+            return False
+        for w in neighbours:
+            if w != u and w not in adjacent:
+                return False
+    return True
+
+
+def _is_extended_by_peeled(clique: set, v: int, graph: Graph, peeled: bytearray) -> bool:
+    """
+    Whether a vertex peeled off is adjacent to all of clique, which contains v.
+    """
+    for w in graph.adjacent(v):
+        if peeled[w] and all(u == v or graph.has_edge(w, u) for u in clique):
+            return True
+    return False
+
+
+def _add_twins(clique: set, twins: {int: [int]}) -> set:
+    if len(twins) > 0:
+        for v in list(clique):
+            clique.update(twins.get(v, ()))
+    return clique
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from math import inf
+from time import monotonic
+
+
+class CliqueSearch:
+    """
+    Iterator over the cliques of a search, with bounds on the size of the cliques and a budget for the search.
+
+    Only cliques with min_size <= size <= max_size are found; the bounds prune the search itself. The search stops
+    after max_cliques cliques or once it has run for deadline seconds. Afterwards, truncated tells whether the
+    budget ran out before the search was complete.
+
+    cancel stops the search at its next check from any thread. A deadline of inf never runs out, but makes the
+    search check for cancel without reading the clock.
+    """
+
+    def __init__(self, min_size: int = 1, max_size: int = None, max_cliques: int = None, deadline: float = None):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_cliques = max_cliques
+        self.deadline = deadline
+        self.truncated = False
+        self.number_of_cliques = 0
+        self._end_time = None if deadline is None or deadline == inf else monotonic() + deadline
+        self._cliques = iter(())
+
+    @property
+    def is_pruning(self) -> bool:
+        """
+        Whether the search has to check the bounds while it runs. max_cliques is checked as cliques are taken.
+        """
+        return self.min_size > 1 or self.max_size is not None or self.deadline is not None
+
+    def run(self, cliques) -> 'CliqueSearch':
+        self._cliques = iter(cliques)
+        return self
+
+    def prune(self, size_of_clique: int, size_of_candidates: int) -> bool:
+        """
+        Whether a branch with size_of_clique members and size_of_candidates candidates can be cut.
+        """
+        if size_of_clique + size_of_candidates < self.min_size:
+            return True
+        if self.max_size is not None and size_of_clique >= self.max_size and size_of_candidates > 0:
+            return True
+        return self.is_expired()
+
+    def is_expired(self) -> bool:
+        if not self.truncated and self._end_time is not None and monotonic() >= self._end_time:
+            self.truncated = True
+        return self.truncated
+
+    def cancel(self):
+        """
+        Stop the search: the engine returns at its next check and the iterator ends. truncated becomes True.
+        """
+        self.truncated = True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.max_cliques is not None and self.number_of_cliques >= self.max_cliques:
+            if not self.truncated:
+                # Finding one more clique means that the enumeration was cut short
+                self.truncated = next(self._cliques, None) is not None
+                self._close()
+            raise StopIteration
+        try:
+            clique = next(self._cliques)
+        except StopIteration:
+            self._close()
+            raise
+        self.number_of_cliques += 1
+        return clique
+
+    def _close(self):
+        close = getattr(self._cliques, 'close', None)
+        if close is not None:
+            close()
+        self._cliques = iter(())
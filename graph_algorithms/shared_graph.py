@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import struct
+from array import array
+from multiprocessing import shared_memory
+from . import Graph
+from .graph import index_typecode, get_ranks, get_graph_core_decomposition
+
+# Layout, in the byte order of the host since the block never leaves it:
+#   header      magic, version, number of vertices, number of neighbour entries, typecode of the index arrays
+#   offsets     int64, n + 1 indices into neighbours
+#   neighbours  the CSR neighbour rows
+#   ordering    the degeneracy ordering
+#   core        the core number of every vertex
+#   rank        the position of every vertex in the degeneracy ordering
+# The index arrays use the typecode of the header, so every array starts aligned to its item size.
+_MAGIC = b'GRPH'
+_VERSION = 1
+_HEADER = struct.Struct('=4sIQQ8s')
+_OFFSET_TYPECODE = 'q'
+
+
+class SharedGraph:
+    """
+    A Graph in a block of multiprocessing.shared_memory, with its degeneracy ordering computed once, so that
+    worker processes attach to it by name instead of receiving a copy.
+
+    SharedGraph(graph) exports graph into a new block; SharedGraph.attach(name) maps an existing one read-only in
+    another process. graph is a Graph whose arrays are memoryviews of the block, which get_components,
+    get_degeneracy_ordering and the engines use without copying; rank is the rank array of its degeneracy
+    ordering. The names of the vertices are not exported, so the graph of the block has none.
+
+    The process that exported the block unlinks it on close; the others only unmap it. The graph must not be used
+    after close.
+    """
+
+    def __init__(self, graph: Graph = None, _memory: shared_memory.SharedMemory = None):
+        if _memory is None:
+            _memory = _export(graph)
+            self.is_owner = True
+        else:
+            self.is_owner = False
+        self._memory = _memory
+        view = _memory.buf
+        (magic, version, n, number_of_neighbours, typecode) = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC or version != _VERSION:
+            _memory.close()
+            raise ValueError('{} is not a shared graph'.format(_memory.name))
+        typecode = typecode.rstrip(b'\0').decode('ascii')
+        self._views = []
+        position = _HEADER.size
+        (offsets, position) = self._cast(position, n + 1, _OFFSET_TYPECODE)
+        (neighbours, position) = self._cast(position, number_of_neighbours, typecode)
+        (ordering, position) = self._cast(position, n, typecode)
+        (core, position) = self._cast(position, n, typecode)
+        (self.rank, position) = self._cast(position, n, typecode)
+        self.graph = Graph(offsets, neighbours)
+        self.graph._core_decomposition = (ordering, core)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedGraph':
+        return cls(_memory=_open(name))
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def size(self) -> int:
+        return self._memory.size
+
+    def _cast(self, position: int, length: int, typecode: str) -> (memoryview, int):
+        item_size = struct.calcsize(typecode)
+        view = self._memory.buf[position:position + length * item_size].cast(typecode)
+        self._views.append(view)
+        if not self.is_owner:
+            view = view.toreadonly()
+            self._views.append(view)
+        return view, position + length * item_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self._memory is None:
+            return
+        self.graph = self.rank = None
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._memory.close()
+        if self.is_owner:
+            self._memory.unlink()
+        self._memory = None
+
+
+def _export(graph: Graph) -> shared_memory.SharedMemory:
+    n = len(graph)
+    typecode = index_typecode(n)
+    item_size = struct.calcsize(typecode)
+    offset_size = struct.calcsize(_OFFSET_TYPECODE)
+    ordering, core = get_graph_core_decomposition(graph)
+    rank = get_ranks(ordering)
+    size = _HEADER.size + (n + 1) * offset_size + (len(graph.neighbours) + 3 * n) * item_size
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        _HEADER.pack_into(memory.buf, 0, _MAGIC, _VERSION, n, len(graph.neighbours), typecode.encode('ascii'))
+        position = _HEADER.size
+        for (values, code) in ((graph.offsets, _OFFSET_TYPECODE), (graph.neighbours, typecode),
+                               (ordering, typecode), (core, typecode), (rank, typecode)):
+            length = len(values) * struct.calcsize(code)
+            view = memory.buf[position:position + length].cast(code)
+            try:
+                view[:] = _as_buffer(values, code)
+            finally:
+                view.release()
+            position += length
+    except BaseException:
+        memory.close()
+        memory.unlink()
+        raise
+    return memory
+
+
+def _as_buffer(values, typecode: str):
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    if isinstance(values, memoryview) and values.format == typecode:
+        return values
+    return array(typecode, values)
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the block with the resource tracker. Processes started by
+        # multiprocessing share the tracker of their parent, where the block is already registered, but a tracker
+        # of an unrelated process would unlink the block when that process exits
+        return shared_memory.SharedMemory(name)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+from . import Graph, get_components, get_degeneracy_ordering
+from .node import log_expected_maximal_cliques_in_random_graph
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class GraphStatistics:
+    """
+    Summary of a graph: its size, degrees, density, degeneracy and components, with the expected number of maximal
+    cliques of a random graph of the same size and density, for the graph and for every component.
+
+    The expected numbers of cliques are kept as natural logarithms, since they overflow a float on large dense
+    graphs; the expected_* properties return them as floats, inf on overflow.
+    """
+
+    def __init__(self, nodes: int, edges: int, min_degree: int, max_degree: int, degeneracy: int,
+                 component_sizes: [int], component_edges: [int], log_expected_cliques: float,
+                 component_log_expected_cliques: [float]):
+        self.nodes = nodes
+        self.edges = edges
+        self.min_degree = min_degree
+        self.max_degree = max_degree
+        self.degeneracy = degeneracy
+        self.component_sizes = component_sizes
+        self.component_edges = component_edges
+        self.log_expected_cliques = log_expected_cliques
+        self.component_log_expected_cliques = component_log_expected_cliques
+
+    @property
+    def density(self) -> float:
+        return get_density(self.nodes, self.edges)
+
+    @property
+    def average_degree(self) -> float:
+        return 2 * self.edges / self.nodes if self.nodes > 0 else 0.0
+
+    @property
+    def number_of_components(self) -> int:
+        return len(self.component_sizes)
+
+    @property
+    def expected_cliques(self) -> float:
+        return _exp(self.log_expected_cliques)
+
+    @property
+    def component_expected_cliques(self) -> [float]:
+        return [_exp(log_expected_cliques) for log_expected_cliques in self.component_log_expected_cliques]
+
+    @property
+    def total_component_expected_cliques(self) -> float:
+        return _exp(_log_sum_exp(self.component_log_expected_cliques))
+
+    def __str__(self):
+        lines = [
+            'Graph statistics',
+            '  Nodes      : {:8}'.format(self.nodes),
+            '  Edges      : {:8}'.format(self.edges),
+            '  Density    : {:8.2%}'.format(self.density),
+            '  Degrees    : {:8} min, {:.2f} avg, {} max'.format(self.min_degree, self.average_degree,
+                                                               self.max_degree),
+            '  Degeneracy : {:8}'.format(self.degeneracy),
+            '  Expected maximal cliques in random graph = {:.6g}'.format(self.expected_cliques)
+        ]
+        if self.number_of_components > 0:
+            expected_cliques = self.component_expected_cliques
+            lines.extend([
+                '',
+                '  Components : {:8}'.format(self.number_of_components),
+                '    Smallest component: {}'.format(min(self.component_sizes)),
+                '    Largest component : {}'.format(max(self.component_sizes)),
+                '    Expected maximal cliques in random graphs',
+                '      Min             : {:.6g}'.format(min(expected_cliques)),
+                '      Avg             : {:.6g}'.format(self.total_component_expected_cliques / len(expected_cliques)),
+                '      Max             : {:.6g}'.format(max(expected_cliques)),
+                '      Total           : {:.6g}'.format(self.total_component_expected_cliques)
+            ])
+        return '\n'.join(lines)
+
+
+def graph_statistics(nodes) -> GraphStatistics:
+    """
+    The statistics of a list of Node or a Graph. A list of Node is converted to a Graph first, and everything is
+    computed on its arrays: the degrees in one pass, the components and the degeneracy in O(n + m) each, and the
+    expected numbers of cliques of all components at once, vectorized with NumPy when it is installed.
+    """
+    graph = nodes if isinstance(nodes, Graph) else Graph.from_nodes(nodes)
+    size = len(graph)
+    offsets = graph.offsets
+    degrees = [offsets[v + 1] - offsets[v] for v in range(size)]
+    components = get_components(graph)
+    component_sizes = [len(component) for component in components]
+    component_edges = [sum(degrees[v] for v in component) // 2 for component in components]
+    degeneracy, _ = get_degeneracy_ordering(graph)
+    edges = graph.number_of_edges
+    sizes = [size] + component_sizes
+    probabilities = [get_density(n, m) for (n, m) in zip(sizes, [edges] + component_edges)]
+    log_expected_cliques = log_expected_maximal_cliques(sizes, probabilities)
+    return GraphStatistics(size, edges, min(degrees, default=0), max(degrees, default=0), degeneracy,
+                           component_sizes, component_edges, log_expected_cliques[0], log_expected_cliques[1:])
+
+
+def get_density(nodes: int, edges: int) -> float:
+    return 2 * edges / nodes / (nodes - 1) if nodes > 1 else 0.0
+
+
+def log_expected_maximal_cliques(sizes: [int], edge_probabilities: [float]) -> [float]:
+    """
+    log_expected_maximal_cliques_in_random_graph for every pair of sizes and edge_probabilities.
+    """
+    if numpy is not None:
+        return _log_expected_maximal_cliques_numpy(sizes, edge_probabilities).tolist()
+    # Components often share their size and number of edges, the smallest ones above all
+    known = {}
+    log_expected_cliques = []
+    for pair in zip(sizes, edge_probabilities):
+        value = known.get(pair)
+        if value is None:
+            value = known[pair] = log_expected_maximal_cliques_in_random_graph(*pair)
+        log_expected_cliques.append(value)
+    return log_expected_cliques
+
+
+def _log_expected_maximal_cliques_numpy(sizes, edge_probabilities):
+    n = numpy.asarray(sizes, dtype=numpy.float64)
+    p = numpy.asarray(edge_probabilities, dtype=numpy.float64)
+    result = numpy.full(len(n), -numpy.inf)
+    no_edges = (n > 0) & (p <= 0)
+    result[no_edges] = numpy.log(n[no_edges])
+    result[(n > 0) & (p >= 1)] = 0.0
+    general = numpy.flatnonzero((n > 0) & (p > 0) & (p < 1))
+    if len(general) == 0:
+        return result
+    n = n[general]
+    log_p = numpy.log(p[general])
+    # get_largest_clique_size for every graph
+    log_n = numpy.log(n)
+    log_inverse_p = -log_p
+    counts = numpy.ceil(numpy.maximum(2 * (1 + 2 * log_n / log_inverse_p), 40 / (log_n + log_inverse_p / 2))) + 1
+    counts = numpy.minimum(n, counts).astype(numpy.int64)
+    # One row for every clique size k = 1..counts[i] of every graph i, the rows of a graph are contiguous
+    starts = numpy.cumsum(counts) - counts
+    graph_of = numpy.repeat(numpy.arange(len(n)), counts)
+    k = (numpy.arange(counts.sum()) - starts[graph_of] + 1).astype(numpy.float64)
+    n_k = n[graph_of]
+    log_p_k = log_p[graph_of]
+    # log C(n, k) as the running sum of log((n - k + 1) / k) within every graph
+    increments = numpy.log(n_k - k + 1) - numpy.log(k)
+    cumulative = numpy.cumsum(increments)
+    log_binomial = cumulative - (cumulative[starts] - increments[starts])[graph_of]
+    log_terms = log_binomial + k * (k - 1) / 2 * log_p_k + (n_k - k) * numpy.log1p(-numpy.exp(k * log_p_k))
+    largest = numpy.maximum.reduceat(log_terms, starts)
+    result[general] = largest + numpy.log(numpy.add.reduceat(numpy.exp(log_terms - largest[graph_of]), starts))
+    return result
+
+
+def _log_sum_exp(values: [float]) -> float:
+    if len(values) == 0:
+        return -math.inf
+    largest = max(values)
+    if largest == -math.inf:
+        return largest
+    return largest + math.log(sum(math.exp(value - largest) for value in values))
+
+
+def _exp(value: float) -> float:
+    try:
+        return math.exp(value)
+    except OverflowError:
+        return math.inf
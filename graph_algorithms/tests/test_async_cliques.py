@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import contextlib
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .. import Graph, CliquePlanner, SearchStats, aget_cliques, get_cliques, get_cliques_bron_kerbosch, \
+    get_default_engine
+from ..generators import get_random_graph
+
+
+def _frozen(cliques) -> set:
+    return {frozenset(clique) for clique in cliques}
+
+
+async def _collect(cliques) -> list:
+    return [clique async for clique in cliques]
+
+
+class TestAsyncCliques(unittest.TestCase):
+    def setUp(self):
+        self.nodes = get_random_graph(60, 0.3, seed=2)
+        self.graph = Graph.from_nodes(self.nodes)
+
+    def test_same_cliques(self):
+        for engine in (None, 'bron_kerbosch', 'bron_kerbosch_bitset', 'kellerman'):
+            with self.subTest(engine=engine):
+                cliques = asyncio.run(_collect(aget_cliques(self.graph, engine, max_queued=4)))
+                self.assertEqual(_frozen(cliques), _frozen(get_cliques(self.graph, engine)))
+        cliques = asyncio.run(_collect(aget_cliques(self.nodes, min_size=4)))
+        self.assertEqual(_frozen(cliques), {c for c in _frozen(get_cliques_bron_kerbosch(self.nodes)) if len(c) >= 4})
+
+    def test_default_engine_as_get_cliques(self):
+        # Dense enough that the default engine is Kellerman, whose cover differs from the maximal cliques
+        nodes = get_random_graph(80, 0.5, seed=5)
+        self.assertEqual(get_default_engine(nodes), 'kellerman')
+        cliques = asyncio.run(_collect(aget_cliques(nodes)))
+        self.assertEqual(_frozen(cliques), _frozen(get_cliques(nodes)))
+        planner = CliquePlanner()
+        cliques = asyncio.run(_collect(aget_cliques(self.nodes, planner=planner)))
+        self.assertEqual(_frozen(cliques), _frozen(get_cliques(self.nodes, planner=CliquePlanner())))
+        self.assertGreater(len(planner.plans), 0)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(_collect(aget_cliques(self.graph, 'unknown')))
+        with self.assertRaises(ValueError):
+            asyncio.run(_collect(aget_cliques(self.graph, max_queued=0)))
+
+    def test_executors(self):
+        with ThreadPoolExecutor(1) as executor:
+            cliques = asyncio.run(_collect(aget_cliques(self.graph, executor=executor)))
+        self.assertEqual(_frozen(cliques), _frozen(get_cliques(self.graph)))
+        with ProcessPoolExecutor(1) as executor:
+            with self.assertRaises(ValueError):
+                asyncio.run(_collect(aget_cliques(self.graph, executor=executor)))
+
+    def test_back_pressure(self):
+        stats = SearchStats()
+
+        async def consume():
+            async with contextlib.aclosing(aget_cliques(self.graph, 'bron_kerbosch', stats=stats,
+                                                        max_queued=2)) as cliques:
+                async for _ in cliques:
+                    await asyncio.sleep(0.05)
+                    # A batch of two taken, one queued and one waiting for a slot
+                    self.assertLessEqual(stats.cliques, 7)
+                    break
+        asyncio.run(consume())
+
+    def test_loop_not_blocked(self):
+        nodes = get_random_graph(150, 0.3, seed=1)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.005)
+
+        async def main():
+            ticker = asyncio.ensure_future(tick())
+            count = 0
+            async for _ in aget_cliques(nodes, 'bron_kerbosch', max_queued=64):
+                count += 1
+            ticker.cancel()
+            return count
+        count = asyncio.run(main())
+        self.assertEqual(count, len(list(get_cliques_bron_kerbosch(nodes))))
+        self.assertGreater(len(ticks), 2)
+
+    def test_cancel_stops_search(self):
+        nodes = get_random_graph(400, 0.4, seed=3)
+        for (engine, max_queued) in (('bron_kerbosch', 1), ('bron_kerbosch_bitset', 1000000)):
+            with self.subTest(engine=engine):
+                stats = SearchStats() if engine == 'bron_kerbosch' else None
+                taken = []
+
+                async def consume():
+                    async for clique in aget_cliques(nodes, engine, stats=stats, max_queued=max_queued):
+                        taken.append(clique)
+
+                async def main():
+                    task = asyncio.ensure_future(consume())
+                    while len(taken) < 3:
+                        await asyncio.sleep(0.001)
+                    task.cancel()
+                    start = time.monotonic()
+                    with self.assertRaises(asyncio.CancelledError):
+                        await task
+                    return time.monotonic() - start
+                self.assertLess(asyncio.run(main()), 1.0)
+                if stats is not None:
+                    self.assertLessEqual(stats.cliques, len(taken) + 2)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import tempfile
+import unittest
+
+from ..benchmark import SMALL_SUITE, run_benchmarks, save_results, load_results, compare_results, \
+    format_results, format_comparison
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_small_suite(self):
+        results = run_benchmarks(SMALL_SUITE, ('bron_kerbosch', 'kellerman_bitset'))
+        self.assertEqual(set(results['graphs']), set(SMALL_SUITE))
+        moon_moser = results['graphs']['moon-moser-9']
+        self.assertEqual(moon_moser['steps']['bron_kerbosch/graph']['cliques'], 27)
+        self.assertEqual(moon_moser['steps']['get_cliques/nodes']['cliques'], 27)
+        for graph in results['graphs'].values():
+            for measurement in graph['steps'].values():
+                self.assertGreaterEqual(measurement['seconds'], 0)
+                self.assertIn('peak_bytes', measurement)
+        self.assertIn('moon-moser-9', format_results(results))
+
+    def test_compare(self):
+        results = run_benchmarks(SMALL_SUITE, ('bron_kerbosch',), memory=False)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.json')
+            save_results(results, path)
+            baseline = load_results(path)
+        self.assertEqual(baseline['graphs'].keys(), results['graphs'].keys())
+        comparison = compare_results(baseline, results)
+        self.assertEqual(len(comparison), sum(len(graph['steps']) for graph in results['graphs'].values()))
+        for (_, _, before, after) in comparison:
+            self.assertEqual(before, after)
+        self.assertEqual(len(format_comparison(comparison).split('\n')), len(comparison))
+
+
+if __name__ == '__main__':
+    unittest.main()
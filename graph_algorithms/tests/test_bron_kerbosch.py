@@ -21,9 +21,12 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import sys
 import unittest
 
-from .. import Node, get_cliques_bron_kerbosch, get_degeneracy_ordering, worst_case_running_time_bron_kerbosch
+from .. import Node, Graph, get_cliques_bron_kerbosch, get_degeneracy_ordering, worst_case_running_time_bron_kerbosch
+from ..bron_kerbosch import bron_kerbosch, PIVOT_RULES
+from ..generators import get_random_graph, get_moon_moser_graph, get_disjoint_union
 
 
 class TestBasicBronKerboschFunctionality(unittest.TestCase):
@@ -85,5 +88,58 @@ class TestBasicBronKerboschFunctionality(unittest.TestCase):
                 self.assertTrue(clique_found, "Clique ({}) could not be found".format(clique))
 
 
+class TestIterativeBronKerbosch(unittest.TestCase):
+    def test_deeper_than_recursion_limit(self):
+        nodes = get_random_graph(150, 1, seed=0)
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(100)
+        try:
+            cliques = list(get_cliques_bron_kerbosch(nodes))
+            graph_cliques = list(get_cliques_bron_kerbosch(Graph.from_nodes(nodes)))
+        finally:
+            sys.setrecursionlimit(limit)
+        self.assertEqual(cliques, [set(nodes)])
+        self.assertEqual(graph_cliques, [set(range(150))])
+
+    def test_deterministic_order(self):
+        runs = []
+        for _ in range(3):
+            nodes = get_random_graph(60, 0.3, seed=1)
+            runs.append([sorted(n.name for n in clique) for clique in get_cliques_bron_kerbosch(nodes)])
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(runs[0], runs[2])
+
+    def test_bron_kerbosch(self):
+        nodes = get_random_graph(40, 0.3, seed=2)
+        (u, v) = next((node, next(iter(node.adjacent))) for node in nodes if len(node.adjacent) > 0)
+        p = u.adjacent & v.adjacent
+        expected = {frozenset(clique) for clique in get_cliques_bron_kerbosch(nodes) if {u, v} <= clique}
+        self.assertEqual({frozenset(clique) for clique in bron_kerbosch({u, v}, p, set())}, expected)
+        self.assertEqual(p, u.adjacent & v.adjacent)
+
+
+class TestPivotRules(unittest.TestCase):
+    def test_same_cliques(self):
+        graphs = [get_random_graph(70, 0.3, seed=3), get_random_graph(40, 0.7, seed=4), get_moon_moser_graph(14),
+                  get_disjoint_union(*(get_random_graph(9, 0.6, seed=i) for i in range(6)))]
+        for nodes in graphs:
+            graph = Graph.from_nodes(nodes)
+            expected = {frozenset(clique) for clique in get_cliques_bron_kerbosch(nodes)}
+            expected_graph = {frozenset(clique) for clique in get_cliques_bron_kerbosch(graph)}
+            for pivot in PIVOT_RULES:
+                with self.subTest(pivot=pivot):
+                    cliques = list(get_cliques_bron_kerbosch(nodes, pivot=pivot))
+                    self.assertEqual(len(cliques), len(expected))
+                    self.assertEqual({frozenset(clique) for clique in cliques}, expected)
+                    self.assertEqual({frozenset(clique) for clique in get_cliques_bron_kerbosch(graph, pivot=pivot)},
+                                     expected_graph)
+                    bounded = get_cliques_bron_kerbosch(nodes, min_size=4, pivot=pivot)
+                    self.assertEqual({frozenset(clique) for clique in bounded},
+                                     {clique for clique in expected if len(clique) >= 4})
+
+    def test_unknown_pivot(self):
+        self.assertRaises(ValueError, get_cliques_bron_kerbosch, get_random_graph(5, 0.5), pivot='random')
+
+
 if __name__ == '__main__':
     unittest.main()
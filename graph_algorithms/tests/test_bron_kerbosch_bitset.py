@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from .. import Node, Graph, get_cliques, get_cliques_bron_kerbosch, get_cliques_bron_kerbosch_bitset
+from ..generators import get_random_graph
+
+
+class TestBitsetBronKerbosch(unittest.TestCase):
+    def test_same_cliques_as_bron_kerbosch(self):
+        for seed in range(5):
+            nodes = get_random_graph(50, 0.1 + 0.1 * seed, seed)
+            nodes.append(Node('isolated'))
+            expected = {frozenset(clique) for clique in get_cliques_bron_kerbosch(nodes)}
+            with self.subTest("Nodes", seed=seed):
+                cliques = [frozenset(clique) for clique in get_cliques_bron_kerbosch_bitset(nodes)]
+                self.assertEqual(len(cliques), len(expected))
+                self.assertEqual(set(cliques), expected)
+            with self.subTest("get_cliques", seed=seed):
+                self.assertEqual({frozenset(clique) for clique in get_cliques(nodes, 'bron_kerbosch_bitset')},
+                                 expected)
+            with self.subTest("Graph", seed=seed):
+                graph = Graph.from_nodes(nodes)
+                self.assertEqual({frozenset(nodes[v] for v in clique)
+                                  for clique in get_cliques_bron_kerbosch_bitset(graph)}, expected)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            get_cliques([Node('0')], 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import tempfile
+import unittest
+
+from .. import Node, Graph, CliqueFile, get_cliques, get_cliques_bron_kerbosch, write_cliques
+from ..generators import get_random_graph
+
+
+class TestCliqueFile(unittest.TestCase):
+    def setUp(self):
+        (handle, self.path) = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        nodes = get_random_graph(40, 0.3, seed=1)
+        cliques = [clique for clique in get_cliques_bron_kerbosch(nodes)]
+        self.assertEqual(write_cliques(self.path, cliques), len(cliques))
+        with CliqueFile(self.path) as clique_file:
+            self.assertEqual(len(clique_file), len(cliques))
+            for (i, clique) in enumerate(cliques):
+                self.assertEqual(set(clique_file[i]), {node.name for node in clique})
+            self.assertEqual(set(clique_file[-1]), {node.name for node in cliques[-1]})
+            self.assertEqual([set(names) for names in clique_file], [{n.name for n in c} for c in cliques])
+            self.assertEqual(sorted(clique_file.get_ids(0)), clique_file.get_ids(0))
+            with self.assertRaises(IndexError):
+                clique_file.get_ids(len(cliques))
+
+    def test_graph_and_empty(self):
+        graph = Graph.from_nodes([Node('a'), Node('b')])
+        write_cliques(self.path, get_cliques(graph))
+        with CliqueFile(self.path) as clique_file:
+            self.assertEqual(sorted(clique_file), [['0'], ['1']])
+        write_cliques(self.path, [])
+        with CliqueFile(self.path) as clique_file:
+            self.assertEqual(len(clique_file), 0)
+            self.assertEqual(list(clique_file), [])
+
+    def test_not_a_clique_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(bytes(64))
+        with self.assertRaises(ValueError):
+            CliqueFile(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
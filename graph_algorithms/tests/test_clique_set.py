@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from .. import Graph, NodeGraph, CliqueSet, get_cliques, get_cliques_bron_kerbosch
+from ..generators import get_random_graph
+
+
+class TestCliqueSet(unittest.TestCase):
+    def setUp(self):
+        self.nodes = get_random_graph(60, 0.3, seed=4)
+        self.cliques = list(get_cliques_bron_kerbosch(self.nodes))
+
+    def test_nodes(self):
+        clique_set = CliqueSet(self.nodes).extend(self.cliques)
+        self.assertEqual(len(clique_set), len(self.cliques))
+        self.assertEqual(list(clique_set), self.cliques)
+        self.assertEqual(clique_set[-1], self.cliques[-1])
+        self.assertEqual(len(clique_set.ids), sum(len(clique) for clique in self.cliques))
+        self.assertEqual(clique_set.size(3), len(self.cliques[3]))
+        with self.assertRaises(IndexError):
+            clique_set.get_ids(len(self.cliques))
+        with self.assertRaises(ValueError):
+            clique_set.add([get_random_graph(1, 0.0)[0]])
+
+    def test_containing(self):
+        clique_set = CliqueSet(self.nodes).extend(self.cliques)
+        for node in self.nodes[::5]:
+            expected = [i for (i, clique) in enumerate(self.cliques) if node in clique]
+            self.assertEqual(clique_set.containing(node), expected)
+            self.assertEqual(clique_set.count_containing(node), len(expected))
+            for other in list(node.adjacent)[:3]:
+                self.assertEqual(clique_set.containing(node, other),
+                                 [i for i in expected if other in self.cliques[i]])
+        self.assertEqual(clique_set.containing(), list(range(len(self.cliques))))
+        queried = self.nodes[:4]
+        self.assertEqual(clique_set.intersecting(queried),
+                         [i for (i, clique) in enumerate(self.cliques) if any(node in clique for node in queried)])
+
+    def test_membership(self):
+        clique_set = CliqueSet(self.nodes).extend(self.cliques)
+        for clique in self.cliques[::7]:
+            self.assertIn(clique, clique_set)
+            self.assertIn(list(clique), clique_set)
+            if len(clique) > 1:
+                self.assertNotIn(set(list(clique)[1:]), clique_set)
+        self.assertNotIn(set(), clique_set)
+
+    def test_membership_scans_shortest_posting(self):
+        clique_set = CliqueSet(self.nodes).extend(self.cliques)
+        get_posting = clique_set._get_posting
+        scanned = []
+
+        def record(node_id):
+            posting = get_posting(node_id)
+            scanned.append(len(posting))
+            return posting
+
+        clique_set._get_posting = record
+        for clique in self.cliques:
+            if len({clique_set.count_containing(node) for node in clique}) > 1:
+                scanned.clear()
+                self.assertIn(clique, clique_set)
+                self.assertEqual(scanned, [min(clique_set.count_containing(node) for node in clique)])
+
+    def test_histogram_and_intersection(self):
+        clique_set = CliqueSet(self.nodes).extend(self.cliques)
+        histogram = {}
+        for clique in self.cliques:
+            histogram[len(clique)] = histogram.get(len(clique), 0) + 1
+        self.assertEqual(clique_set.size_histogram(), dict(sorted(histogram.items())))
+        self.assertEqual(clique_set.intersection(0, 1), self.cliques[0] & self.cliques[1])
+
+    def test_add_invalidates_index(self):
+        clique_set = CliqueSet()
+        self.assertEqual(clique_set.add(['a', 'b']), 0)
+        self.assertEqual(clique_set.containing('a'), [0])
+        clique_set.add(['a', 'c'])
+        self.assertEqual(clique_set.containing('a'), [0, 1])
+        self.assertEqual(clique_set.containing('b', 'c'), [])
+        self.assertEqual(clique_set.containing('d'), [])
+        self.assertEqual(clique_set[1], {'a', 'c'})
+        self.assertEqual(clique_set.nodes, ['a', 'b', 'c'])
+
+    def test_get_cliques_into(self):
+        graph = Graph.from_nodes(self.nodes)
+        clique_set = get_cliques(graph, 'bron_kerbosch', into=CliqueSet(graph))
+        expected = [frozenset(clique) for clique in get_cliques_bron_kerbosch(graph)]
+        self.assertEqual([frozenset(clique) for clique in clique_set], expected)
+        self.assertEqual(clique_set.containing(0), [i for (i, clique) in enumerate(expected) if 0 in clique])
+        with self.assertRaises(ValueError):
+            clique_set.add([len(graph)])
+        node_graph = NodeGraph(self.nodes)
+        clique_set = get_cliques(node_graph, 'bron_kerbosch', into=CliqueSet(node_graph))
+        self.assertEqual({frozenset(clique) for clique in clique_set}, {frozenset(c) for c in self.cliques})
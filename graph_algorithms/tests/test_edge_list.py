@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import tempfile
+import unittest
+
+from .. import Graph, load_edge_list, save_edge_list
+from ..generators import get_random_graph
+
+
+class TestEdgeList(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.graph = Graph.from_nodes(get_random_graph(50, 0.2, seed=1))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def assertSameGraph(self, graph, expected):
+        self.assertEqual(list(graph.offsets), list(expected.offsets))
+        self.assertEqual(list(graph.neighbours), list(expected.neighbours))
+
+    def test_text(self):
+        path = self._path('graph.txt')
+        save_edge_list(path, self.graph)
+        self.assertSameGraph(load_edge_list(path), self.graph)
+        self.assertSameGraph(Graph.from_edge_list(path), self.graph)
+
+    def test_text_with_comments_and_duplicates(self):
+        path = self._path('graph.txt')
+        with open(path, 'w') as file:
+            file.write('# A comment\n% Another one\n\nb a 1.5\na b\nc b\nc c\nb c 2\n')
+        graph = load_edge_list(path, numeric=False)
+        self.assertEqual(graph.names, ['b', 'a', 'c'])
+        self.assertEqual(graph.number_of_edges, 2)
+        self.assertEqual([list(graph.adjacent(v)) for v in range(3)], [[1, 2], [0], [0]])
+        self.assertRaises(ValueError, load_edge_list, path)
+        with open(path, 'a') as file:
+            file.write('d\n')
+        self.assertRaises(ValueError, load_edge_list, path, numeric=False)
+
+    def test_binary(self):
+        for typecode in ('i', 'q'):
+            path = self._path('graph.{}.bin'.format(typecode))
+            save_edge_list(path, self.graph, binary=True, typecode=typecode)
+            self.assertEqual(os.path.getsize(path), self.graph.number_of_edges * 2 * (4 if typecode == 'i' else 8))
+            self.assertSameGraph(load_edge_list(path, binary=True, typecode=typecode), self.graph)
+        path = self._path('empty.bin')
+        open(path, 'wb').close()
+        self.assertEqual(len(load_edge_list(path, binary=True)), 0)
+        with open(path, 'wb') as file:
+            file.write(bytes(12))
+        self.assertRaises(ValueError, load_edge_list, path, binary=True)
+
+    def test_nodes(self):
+        path = self._path('graph.txt')
+        save_edge_list(path, self.graph)
+        nodes = Graph.from_edge_list(path).to_nodes()
+        self.assertSameGraph(Graph.from_nodes(nodes), self.graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import tempfile
+import unittest
+
+from .. import Graph, get_cliques
+from ..generators import get_random_graph, get_power_law_graph, get_moon_moser_graph, get_moon_moser_cliques, \
+    get_disjoint_union, load_dimacs, save_dimacs
+
+
+def _edges(nodes):
+    return sum(len(node.adjacent) for node in nodes) // 2
+
+
+class TestGenerators(unittest.TestCase):
+    def test_random_graph(self):
+        nodes = get_random_graph(200, 0.1, seed=1)
+        self.assertEqual(len(nodes), 200)
+        self.assertTrue(1700 < _edges(nodes) < 2300)
+        for node in nodes:
+            self.assertNotIn(node, node.adjacent)
+            for neighbour in node.adjacent:
+                self.assertIn(node, neighbour.adjacent)
+        again = get_random_graph(200, 0.1, seed=1)
+        self.assertEqual([sorted(n.name for n in node.adjacent) for node in nodes],
+                         [sorted(n.name for n in node.adjacent) for node in again])
+
+    def test_random_graph_extremes(self):
+        self.assertEqual(_edges(get_random_graph(10, 0)), 0)
+        self.assertEqual(_edges(get_random_graph(10, 1)), 45)
+
+    def test_power_law_graph(self):
+        nodes = get_power_law_graph(500, 3, seed=2)
+        self.assertEqual(_edges(nodes), 6 + (500 - 4) * 3)
+        self.assertGreater(max(len(node.adjacent) for node in nodes), 30)
+
+    def test_moon_moser(self):
+        for size in range(1, 14):
+            nodes = get_moon_moser_graph(size)
+            self.assertEqual(len(list(get_cliques(nodes))), get_moon_moser_cliques(size))
+
+    def test_disjoint_union(self):
+        nodes = get_disjoint_union(get_moon_moser_graph(6), get_moon_moser_graph(6))
+        self.assertEqual(len(nodes), 12)
+        self.assertEqual(len(list(get_cliques(nodes))), 2 * get_moon_moser_cliques(6))
+
+    def test_dimacs(self):
+        nodes = get_random_graph(50, 0.2, seed=3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.col')
+            save_dimacs(path, nodes)
+            loaded = load_dimacs(path)
+            with open(path, 'a') as file:
+                file.write('x 1 2\n')
+            self.assertRaises(ValueError, load_dimacs, path)
+        graph = Graph.from_nodes(nodes)
+        loaded_graph = Graph.from_nodes(loaded)
+        self.assertEqual(list(graph.offsets), list(loaded_graph.offsets))
+        self.assertEqual(list(graph.neighbours), list(loaded_graph.neighbours))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from .. import Node, Graph, get_cliques, get_cliques_bron_kerbosch, get_cliques_kellerman, get_components, \
+    get_degeneracy_ordering
+from ..generators import get_random_graph
+
+
+def _small_graph():
+    """
+    The graph:
+
+         5
+          \
+           3 -- 4
+           |    | \
+           |    |  0
+           |    | /
+           2 -- 1
+    """
+    nodes = [Node(str(i)) for i in range(6)]
+    nodes[0].add_adjacent(nodes[1], nodes[4])
+    nodes[1].add_adjacent(nodes[0], nodes[2], nodes[4])
+    nodes[2].add_adjacent(nodes[1], nodes[3])
+    nodes[3].add_adjacent(nodes[2], nodes[4], nodes[5])
+    nodes[4].add_adjacent(nodes[0], nodes[1], nodes[3])
+    nodes[5].add_adjacent(nodes[3])
+    return nodes
+
+
+class TestGraph(unittest.TestCase):
+    def test_round_trip(self):
+        nodes = _small_graph()
+        graph = Graph.from_nodes(nodes)
+        self.assertEqual(len(graph), 6)
+        self.assertEqual(graph.number_of_edges, 7)
+        self.assertEqual(list(graph.adjacent(3)), [2, 4, 5])
+        self.assertTrue(graph.has_edge(0, 4))
+        self.assertFalse(graph.has_edge(0, 3))
+        copy = graph.to_nodes()
+        for (node, other) in zip(nodes, copy):
+            self.assertEqual(node.name, other.name)
+            self.assertEqual({n.name for n in node.adjacent}, {n.name for n in other.adjacent})
+
+    def test_degeneracy_ordering(self):
+        nodes = get_random_graph(60, 0.2, 1)
+        graph = Graph.from_nodes(nodes)
+        d, ordering = get_degeneracy_ordering(graph)
+        self.assertEqual(d, get_degeneracy_ordering(nodes)[0])
+        self.assertEqual(sorted(ordering), list(range(len(graph))))
+        # Every vertex has at most d neighbours later in the ordering
+        rank = {v: i for (i, v) in enumerate(ordering)}
+        for v in range(len(graph)):
+            self.assertLessEqual(sum(1 for u in graph.adjacent(v) if rank[u] > rank[v]), d)
+
+    def test_components(self):
+        nodes = _small_graph() + _small_graph() + [Node('isolated')]
+        components = get_components(Graph.from_nodes(nodes))
+        self.assertEqual(sorted(len(component) for component in components), [1, 6, 6])
+
+    def test_cliques_match_nodes(self):
+        nodes = get_random_graph(40, 0.3, 2)
+        graph = Graph.from_nodes(nodes)
+        expected = {frozenset(int(n.name) for n in clique) for clique in get_cliques_bron_kerbosch(nodes)}
+        self.assertEqual({frozenset(clique) for clique in get_cliques_bron_kerbosch(graph)}, expected)
+        self.assertEqual({frozenset(clique) for clique in get_cliques(graph)}, expected)
+
+    def test_kellerman_covers_edges(self):
+        nodes = get_random_graph(40, 0.3, 3)
+        graph = Graph.from_nodes(nodes)
+        cliques = list(get_cliques_kellerman(graph))
+        for clique in cliques:
+            for u in clique:
+                for v in clique:
+                    self.assertTrue(u == v or graph.has_edge(u, v))
+        for u in range(len(graph)):
+            for v in graph.adjacent(u):
+                self.assertTrue(any(u in clique and v in clique for clique in cliques),
+                                "Edge ({},{}) could not be found".format(u, v))
+
+    def test_from_edge_arrays(self):
+        nodes = _small_graph()
+        expected = Graph.from_nodes(nodes)
+        src = [0, 1, 4, 1, 2, 3, 3, 3, 0, 2]
+        dst = [1, 0, 0, 4, 1, 2, 4, 5, 4, 2]
+        graph = Graph.from_edge_arrays(src, dst)
+        self.assertEqual(list(graph.offsets), list(expected.offsets))
+        self.assertEqual(list(graph.neighbours), list(expected.neighbours))
+        self.assertEqual(len(Graph.from_edge_arrays(src, dst, 8)), 8)
+        self.assertRaises(ValueError, Graph.from_edge_arrays, src, dst, 5)
+        self.assertRaises(ValueError, Graph.from_edge_arrays, [0, -1], [1, 0])
+        self.assertRaises(ValueError, Graph.from_edge_arrays, [0], [1, 2])
+        self.assertEqual(len(Graph.from_edge_arrays([], [])), 0)
+
+    def test_from_adjacency_dict(self):
+        graph = Graph.from_adjacency_dict({'a': ['b', 'c'], 'b': ['a'], 'd': {'e', 'd'}})
+        self.assertEqual(graph.names, ['a', 'b', 'd', 'c', 'e'])
+        self.assertEqual([sorted(graph.name(u) for u in graph.adjacent(v)) for v in range(len(graph))],
+                         [['b', 'c'], ['a'], ['e'], ['a'], ['d']])
+        nodes = get_random_graph(30, 0.3, 4)
+        graph = Graph.from_adjacency_dict({node.name: [n.name for n in node.adjacent] for node in nodes})
+        expected = Graph.from_nodes(nodes)
+        self.assertEqual(list(graph.neighbours), list(expected.neighbours))
+
+
+if __name__ == '__main__':
+    unittest.main()
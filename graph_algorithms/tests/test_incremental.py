@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import random
+import unittest
+
+from .. import Node, CliqueIndex, get_cliques_bron_kerbosch
+from ..generators import get_random_graph
+
+
+class TestCliqueIndex(unittest.TestCase):
+    def test_random_changes(self):
+        generator = random.Random(1)
+        nodes = get_random_graph(25, 0.3, seed=1)
+        index = CliqueIndex(nodes)
+        for step in range(300):
+            previous = set(index.cliques)
+            if step % 50 == 49:
+                node = Node(str(len(nodes)))
+                (created, destroyed) = index.add_node(node, generator.sample(nodes, 3))
+                nodes.append(node)
+            else:
+                (u, v) = generator.sample(nodes, 2)
+                if v in u.adjacent:
+                    (created, destroyed) = index.remove_edge(u, v)
+                else:
+                    (created, destroyed) = index.add_edge(u, v)
+            expected = {frozenset(clique) for clique in get_cliques_bron_kerbosch(nodes)}
+            with self.subTest(step=step):
+                self.assertEqual(index.cliques, expected)
+                self.assertEqual(created, expected - previous)
+                self.assertEqual(destroyed, previous - expected)
+        for node in nodes:
+            self.assertEqual(index.cliques_containing(node), {clique for clique in expected if node in clique})
+
+    def test_isolated_nodes(self):
+        (u, v) = (Node('u'), Node('v'))
+        index = CliqueIndex([u, v])
+        self.assertEqual(index.add_edge(u, v), ({frozenset((u, v))}, {frozenset((u,)), frozenset((v,))}))
+        self.assertEqual(index.remove_edge(u, v), ({frozenset((u,)), frozenset((v,))}, {frozenset((u, v))}))
+        with self.assertRaises(ValueError):
+            index.add_node(u)
+
+
+if __name__ == '__main__':
+    unittest.main()
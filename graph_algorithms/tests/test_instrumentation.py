@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from .. import Graph, SearchStats, get_cliques, get_cliques_bron_kerbosch, get_cliques_kellerman, get_components, \
+    get_degeneracy_ordering
+from ..generators import get_random_graph, get_moon_moser_graph, get_disjoint_union
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_bron_kerbosch(self):
+        nodes = get_random_graph(80, 0.2, seed=1)
+        for target in (nodes, Graph.from_nodes(nodes)):
+            stats = SearchStats()
+            cliques = list(get_cliques_bron_kerbosch(target, stats=stats))
+            self.assertEqual(stats.cliques, len(cliques))
+            self.assertEqual(stats.max_depth, max(len(clique) for clique in cliques))
+            self.assertGreaterEqual(stats.calls, len(cliques))
+            self.assertGreater(stats.pivot_evaluations, 0)
+            self.assertGreater(stats.set_operations, 0)
+            self.assertEqual(stats.done, 80)
+            self.assertEqual(stats.total, 80)
+            self.assertIn('degeneracy_ordering', stats.timings)
+            self.assertEqual(stats.estimated_seconds_left, 0)
+
+    def test_kellerman(self):
+        nodes = get_disjoint_union(*(get_random_graph(8, 0.5, seed=i) for i in range(5)))
+        components = get_components(nodes)
+        for target in (nodes, Graph.from_nodes(nodes)):
+            stats = SearchStats()
+            cliques = list(get_cliques_kellerman(target, stats=stats))
+            self.assertEqual(stats.cliques, len(cliques))
+            self.assertEqual(sorted(size for (size, _) in stats.components),
+                             sorted(len(component) for component in components))
+            self.assertEqual(stats.done, len(nodes))
+            self.assertIn('components', stats.timings)
+
+    def test_bron_kerbosch_components(self):
+        nodes = get_disjoint_union(*(get_random_graph(8, 0.5, seed=i) for i in range(5)))
+        components = get_components(nodes)
+        expected = sorted(sorted(n.name for n in clique) for clique in get_cliques_bron_kerbosch(nodes))
+        for target in (nodes, Graph.from_nodes(nodes)):
+            stats = SearchStats()
+            cliques = list(get_cliques_bron_kerbosch(target, stats=stats))
+            self.assertEqual(stats.cliques, len(cliques))
+            self.assertEqual(sorted(size for (size, _) in stats.components),
+                             sorted(len(component) for component in components))
+            self.assertEqual(stats.done, len(nodes))
+            self.assertIn('components', stats.timings)
+        stats = SearchStats()
+        found = sorted(sorted(n.name for n in clique) for clique in get_cliques_bron_kerbosch(nodes, stats=stats))
+        self.assertEqual(found, expected)
+
+    def test_unchanged_results(self):
+        nodes = get_random_graph(60, 0.3, seed=2)
+        for engine in ('bron_kerbosch', 'kellerman'):
+            expected = sorted(sorted(n.name for n in clique) for clique in get_cliques(nodes, engine))
+            found = sorted(sorted(n.name for n in clique) for clique in get_cliques(nodes, engine, stats=SearchStats()))
+            self.assertEqual(found, expected)
+        self.assertRaises(ValueError, get_cliques, nodes, 'kellerman_bitset', stats=SearchStats())
+
+    def test_progress(self):
+        reports = []
+        stats = SearchStats(lambda s: reports.append(s.calls), interval=0)
+        stats.CHECK_EVERY = 1
+        list(get_cliques_bron_kerbosch(get_moon_moser_graph(15), stats=stats))
+        self.assertEqual(len(reports), stats.calls + stats.done)
+        self.assertEqual(reports, sorted(reports))
+
+    def test_timings(self):
+        stats = SearchStats()
+        nodes = get_random_graph(30, 0.2, seed=3)
+        get_degeneracy_ordering(nodes, stats)
+        get_components(nodes, stats)
+        self.assertEqual(set(stats.timings), {'degeneracy_ordering', 'components'})
+        self.assertEqual(stats.as_dict()['timings'], stats.timings)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,9 +21,12 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import random
 import unittest
 
 from .. import Node, get_cliques_kellerman, worst_case_running_time_kellerman
+from .. import kellerman
+from ..generators import get_random_graph
 
 
 class TestKellermanFunctionality(unittest.TestCase):
@@ -72,6 +75,52 @@ class TestKellermanFunctionality(unittest.TestCase):
                                 break
                         self.assertTrue(edge_found, "Edge ({},{}) could not be found".format(n1, n2))
 
+    def test_covering_random_graphs(self):
+        for seed in range(20):
+            generator = random.Random(seed)
+            nodes = get_random_graph(generator.randint(2, 40), generator.random(), seed)
+            cliques = [clique for clique in get_cliques_kellerman(nodes)]
+            with self.subTest("Is a clique", seed=seed):
+                for clique in cliques:
+                    for node in clique:
+                        self.assertEqual(clique - node.adjacent, {node})
+            with self.subTest("Is covering all edges", seed=seed):
+                for node in nodes:
+                    for neighbour in node.adjacent:
+                        self.assertTrue(any(node in clique and neighbour in clique for clique in cliques),
+                                        "Edge ({},{}) could not be found".format(node, neighbour))
+
+    def test_streaming(self):
+        # A long path: the first edge is final long before the last vertex is reached
+        nodes = [Node(str(i)) for i in range(1000)]
+        for i in range(len(nodes) - 1):
+            nodes[i].add_adjacent(nodes[i + 1])
+            nodes[i + 1].add_adjacent(nodes[i])
+        cliques = get_cliques_kellerman(nodes)
+        self.assertEqual(len(next(cliques)), 2)
+        self.assertEqual(sum(1 for _ in cliques), len(nodes) - 2)
+
+    def test_releasing_finished_cliques(self):
+        # On a long path only the cliques around the current vertex are needed
+        nodes = [Node(str(i)) for i in range(1000)]
+        for i in range(len(nodes) - 1):
+            nodes[i].add_adjacent(nodes[i + 1])
+            nodes[i + 1].add_adjacent(nodes[i])
+        live = []
+        finish_vertex = kellerman._finish_vertex
+
+        def count_live(i, nodes, cliques, *args):
+            yield from finish_vertex(i, nodes, cliques, *args)
+            live.append(sum(1 for clique in cliques if clique is not None))
+
+        kellerman._finish_vertex = count_live
+        try:
+            cliques = list(get_cliques_kellerman(nodes))
+        finally:
+            kellerman._finish_vertex = finish_vertex
+        self.assertEqual(len(cliques), len(nodes) - 1)
+        self.assertLessEqual(max(live), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import random
+import unittest
+
+from .. import Graph, get_cliques, get_cliques_kellerman_bitset
+from ..generators import get_random_graph
+
+
+class TestKellermanBitsetFunctionality(unittest.TestCase):
+    def test_covering_random_graphs(self):
+        for seed in range(20):
+            generator = random.Random(seed)
+            nodes = get_random_graph(generator.randint(2, 40), generator.random(), seed)
+            for (name, cliques) in (("Nodes", list(get_cliques_kellerman_bitset(nodes))),
+                                    ("get_cliques", list(get_cliques(nodes, 'kellerman_bitset'))),
+                                    ("Graph", [{nodes[v] for v in clique}
+                                               for clique in get_cliques_kellerman_bitset(Graph.from_nodes(nodes))])):
+                with self.subTest("Is a clique", engine=name, seed=seed):
+                    for clique in cliques:
+                        for node in clique:
+                            self.assertEqual(clique - node.adjacent, {node})
+                with self.subTest("Is covering all edges", engine=name, seed=seed):
+                    for node in nodes:
+                        for neighbour in node.adjacent:
+                            self.assertTrue(any(node in clique and neighbour in clique for clique in cliques),
+                                            "Edge ({},{}) could not be found".format(node, neighbour))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from .. import Graph, get_cliques_bron_kerbosch, get_cliques_containing_node, get_cliques_containing_edge, \
+    get_cliques_containing_nodes
+from ..generators import get_random_graph, get_power_law_graph
+
+
+def _named(cliques) -> list:
+    return sorted(sorted(node.name for node in clique) for clique in cliques)
+
+
+class TestLocalCliques(unittest.TestCase):
+    def setUp(self):
+        self.graphs = [get_random_graph(40, p, seed=i) for (i, p) in enumerate((0.1, 0.3, 0.6))]
+        self.graphs.append(get_power_law_graph(100, 3, seed=2))
+
+    def test_node(self):
+        for (i, nodes) in enumerate(self.graphs):
+            cliques = list(get_cliques_bron_kerbosch(nodes))
+            for node in nodes[::7]:
+                with self.subTest(graph=i, node=node.name):
+                    expected = [clique for clique in cliques if node in clique]
+                    self.assertEqual(_named(get_cliques_containing_node(node)), _named(expected))
+
+    def test_edge(self):
+        for (i, nodes) in enumerate(self.graphs):
+            cliques = list(get_cliques_bron_kerbosch(nodes))
+            for u in nodes[::9]:
+                for v in sorted(u.adjacent, key=lambda n: n.name)[:3]:
+                    with self.subTest(graph=i, edge=(u.name, v.name)):
+                        expected = [clique for clique in cliques if u in clique and v in clique]
+                        self.assertEqual(_named(get_cliques_containing_edge(u, v)), _named(expected))
+
+    def test_nodes_without_duplicates(self):
+        for (i, nodes) in enumerate(self.graphs):
+            cliques = list(get_cliques_bron_kerbosch(nodes))
+            queried = set(nodes[::3] + nodes[:6])
+            with self.subTest(graph=i):
+                expected = [clique for clique in cliques if clique & queried]
+                found = list(get_cliques_containing_nodes(nodes[::3] + nodes[:6]))
+                self.assertEqual(_named(found), _named(expected))
+                self.assertEqual(_named(get_cliques_containing_nodes(nodes)), _named(cliques))
+
+    def test_graph(self):
+        nodes = self.graphs[1]
+        graph = Graph.from_nodes(nodes)
+        cliques = [frozenset(clique) for clique in get_cliques_bron_kerbosch(graph)]
+        for v in range(0, len(graph), 5):
+            expected = {clique for clique in cliques if v in clique}
+            self.assertEqual({frozenset(c) for c in get_cliques_containing_node(v, graph)}, expected)
+            for u in graph.adjacent(v)[:2]:
+                expected_edge = {clique for clique in expected if u in clique}
+                self.assertEqual({frozenset(c) for c in get_cliques_containing_edge(v, u, graph)}, expected_edge)
+        found = [frozenset(c) for c in get_cliques_containing_nodes(range(len(graph)), graph)]
+        self.assertEqual(len(found), len(cliques))
+        self.assertEqual(set(found), set(cliques))
+
+    def test_deterministic(self):
+        nodes = self.graphs[2]
+        first = [sorted(n.name for n in clique) for clique in get_cliques_containing_node(nodes[0])]
+        second = [sorted(n.name for n in clique) for clique in get_cliques_containing_node(nodes[0])]
+        self.assertEqual(first, second)
+
+    def test_invalid(self):
+        graph = Graph.from_adjacency_dict({0: [1], 1: [2]})
+        with self.assertRaises(ValueError):
+            list(get_cliques_containing_edge(0, 2, graph))
+        with self.assertRaises(ValueError):
+            list(get_cliques_containing_node(5, graph))
+        with self.assertRaises(ValueError):
+            list(get_cliques_containing_node(0, graph, pivot='unknown'))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import random
+import unittest
+
+from .. import Graph, get_cliques_bron_kerbosch, get_maximum_clique
+from ..generators import get_random_graph
+
+
+class TestMaximumClique(unittest.TestCase):
+    def test_random_graphs(self):
+        for seed in range(20):
+            generator = random.Random(seed)
+            nodes = get_random_graph(generator.randint(1, 50), generator.random(), seed)
+            size = max(len(clique) for clique in get_cliques_bron_kerbosch(nodes))
+            with self.subTest("Nodes", seed=seed):
+                (clique, optimal) = get_maximum_clique(nodes)
+                self.assertTrue(optimal)
+                self.assertEqual(len(clique), size)
+                for node in clique:
+                    self.assertEqual(clique - node.adjacent, {node})
+            with self.subTest("Graph", seed=seed):
+                (clique, optimal) = get_maximum_clique(Graph.from_nodes(nodes))
+                self.assertTrue(optimal)
+                self.assertEqual(len(clique), size)
+
+    def test_node_limit(self):
+        nodes = get_random_graph(150, 0.5, seed=1)
+        (clique, optimal) = get_maximum_clique(nodes, node_limit=5)
+        self.assertFalse(optimal)
+        self.assertGreater(len(clique), 1)
+        for node in clique:
+            self.assertEqual(clique - node.adjacent, {node})
+
+    def test_empty_graph(self):
+        self.assertEqual(get_maximum_clique([]), (set(), True))
+
+
+if __name__ == '__main__':
+    unittest.main()
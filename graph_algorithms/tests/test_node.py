@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from .. import Node, NodeView, NodeGraph, Graph, ENGINES, get_cliques, get_components, get_degeneracy_ordering, \
+    get_core_numbers, get_k_core
+from ..generators import get_random_graph
+
+
+def _naive_core_numbers(nodes):
+    remaining = set(nodes)
+    core = {}
+    k = 0
+    while len(remaining) > 0:
+        node = min(remaining, key=lambda n: len(n.adjacent & remaining))
+        k = max(k, len(node.adjacent & remaining))
+        core[node] = k
+        remaining.remove(node)
+    return core
+
+
+class TestDegeneracy(unittest.TestCase):
+    def test_core_numbers(self):
+        for seed in range(3):
+            nodes = get_random_graph(80, 0.05 * (seed + 1), seed)
+            expected = _naive_core_numbers(nodes)
+            with self.subTest("Nodes", seed=seed):
+                self.assertEqual(get_core_numbers(nodes), expected)
+            with self.subTest("Graph", seed=seed):
+                self.assertEqual(list(get_core_numbers(Graph.from_nodes(nodes))), [expected[n] for n in nodes])
+
+    def test_degeneracy_ordering(self):
+        nodes = get_random_graph(80, 0.1, 4)
+        d, ordering = get_degeneracy_ordering(nodes)
+        self.assertEqual(d, max(_naive_core_numbers(nodes).values()))
+        self.assertEqual(set(ordering), set(nodes))
+        later = set(nodes)
+        for node in ordering:
+            later.remove(node)
+            self.assertLessEqual(len(node.adjacent & later), d)
+        with self.subTest("Deterministic"):
+            self.assertEqual(get_degeneracy_ordering(list(reversed(nodes)))[1], ordering)
+
+    def test_k_core(self):
+        nodes = get_random_graph(80, 0.1, 5)
+        core = _naive_core_numbers(nodes)
+        for k in range(1, max(core.values()) + 1):
+            k_core = get_k_core(nodes, k)
+            self.assertEqual(set(k_core), {n for n in nodes if core[n] >= k})
+            members = set(k_core)
+            for node in k_core:
+                self.assertGreaterEqual(len(node.adjacent & members), k)
+            graph_core = get_k_core(Graph.from_nodes(nodes), k)
+            self.assertEqual({graph_core.name(v) for v in range(len(graph_core))}, {n.name for n in k_core})
+
+
+class TestNode(unittest.TestCase):
+    def test_ids(self):
+        nodes = [Node(str(i)) for i in range(10)]
+        self.assertEqual([node.id - nodes[0].id for node in nodes], list(range(10)))
+        self.assertFalse(hasattr(nodes[0], '__dict__'))
+        self.assertEqual(len({nodes[0], nodes[0], nodes[1]}), 2)
+        self.assertNotEqual(nodes[0], Node('0'))
+
+    def test_add_adjacent(self):
+        nodes = [Node(str(i)) for i in range(4)]
+        nodes[0].add_adjacent(nodes[1], [nodes[2], (nodes[3],)])
+        self.assertEqual(nodes[0].adjacent, set(nodes[1:]))
+        self.assertRaises(ValueError, nodes[0].add_adjacent, 3)
+
+    def test_components_of_repeated_nodes(self):
+        (a, b, c) = (Node('a'), Node('b'), Node('c'))
+        a.add_adjacent(b)
+        b.add_adjacent(a)
+        self.assertEqual(sorted(sorted(n.name for n in component) for component in get_components([a, b, a, c, c])),
+                         [['a', 'b'], ['c']])
+
+
+class TestNodeView(unittest.TestCase):
+    def test_view(self):
+        nodes = get_random_graph(30, 0.3, 5)
+        graph = Graph.from_nodes(nodes)
+        views = [graph.view(v) for v in range(len(graph))]
+        self.assertEqual(graph.view(3), views[3])
+        self.assertNotEqual(Graph.from_nodes(nodes).view(3), views[3])
+        self.assertIsInstance(views[3], NodeView)
+        for (node, view) in zip(nodes, views):
+            self.assertEqual(view.name, node.name)
+            self.assertEqual({n.name for n in view.adjacent}, {n.name for n in node.adjacent})
+        self.assertRaises(ValueError, views[0].add_adjacent, views[1])
+        expected = {frozenset(clique) for clique in get_cliques(graph)}
+        self.assertEqual({frozenset(view.id for view in clique) for clique in get_cliques(views)}, expected)
+
+
+class TestNodeGraph(unittest.TestCase):
+    def test_memoized(self):
+        nodes = get_random_graph(50, 0.15, 6)
+        graph = NodeGraph(nodes)
+        self.assertEqual(get_degeneracy_ordering(graph), get_degeneracy_ordering(nodes))
+        self.assertEqual(get_core_numbers(graph), get_core_numbers(nodes))
+        self.assertEqual(get_k_core(graph, 3), get_k_core(nodes, 3))
+        self.assertEqual(sorted(sorted(n.name for n in component) for component in get_components(graph)),
+                         sorted(sorted(n.name for n in component) for component in get_components(nodes)))
+        cached = graph.get_graph()
+        self.assertIs(graph.get_graph(), cached)
+        # The results handed out are copies, so changing them does not change the memoized ones
+        get_components(graph)[0].clear()
+        get_degeneracy_ordering(graph)[1].clear()
+        self.assertEqual(sum(len(component) for component in get_components(graph)), 50)
+        self.assertEqual(len(get_degeneracy_ordering(graph)[1]), 50)
+
+    def test_invalidation(self):
+        nodes = [Node(str(i)) for i in range(4)]
+        graph = NodeGraph(nodes)
+        self.assertEqual(len(get_components(graph)), 4)
+        self.assertEqual(get_degeneracy_ordering(graph)[0], 0)
+        nodes[0].add_adjacent(nodes[1])
+        nodes[1].add_adjacent(nodes[0])
+        self.assertEqual(len(get_components(graph)), 3)
+        self.assertEqual(get_degeneracy_ordering(graph)[0], 1)
+        nodes[0].remove_adjacent(nodes[1])
+        nodes[1].remove_adjacent(nodes[0])
+        self.assertEqual(len(get_components(graph)), 4)
+        graph.add_node(Node('4'))
+        self.assertEqual(len(get_components(graph)), 5)
+        self.assertRaises(ValueError, NodeGraph, nodes)
+
+    def test_adding_a_node_again(self):
+        nodes = get_random_graph(10, 0.5, 1)
+        graph = NodeGraph(nodes)
+        self.assertRaises(ValueError, graph.add_node, nodes[0])
+        self.assertEqual(len(graph), 10)
+        self.assertEqual(sorted(sorted(n.name for n in clique) for clique in get_cliques(graph)),
+                         sorted(sorted(n.name for n in clique) for clique in get_cliques(list(nodes))))
+        node = Node('node')
+        self.assertRaises(ValueError, NodeGraph, [node, node])
+
+    def test_engines(self):
+        nodes = get_random_graph(40, 0.3, 7)
+        graph = NodeGraph(nodes)
+        # Vertex i of the Graph is the i-th node by name, like in the Graph that NodeGraph keeps
+        compact = Graph.from_nodes(sorted(nodes, key=lambda n: n.name))
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                expected = {frozenset(compact.name(v) for v in clique) for clique in ENGINES[engine](compact)}
+                self.assertEqual({frozenset(n.name for n in clique) for clique in get_cliques(graph, engine)},
+                                 expected)
+                self.assertEqual({frozenset(n.name for n in clique) for clique in ENGINES[engine](graph)},
+                                 expected)
+
+if __name__ == '__main__':
+    unittest.main()
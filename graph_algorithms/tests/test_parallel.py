@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import unittest
+
+from .. import Graph, get_cliques, get_cliques_bron_kerbosch, get_cliques_parallel
+from .. import parallel
+from ..generators import get_random_graph
+
+
+def _fail(task):
+    raise ValueError('Task {} failed'.format(task))
+
+
+def _end_worker(task):
+    # Like a worker killed by a signal or out of memory: no result and no end of chunks for its task
+    os._exit(1)
+
+
+class TestParallelCliques(unittest.TestCase):
+    def test_same_cliques_as_bron_kerbosch(self):
+        # One large component and several small ones
+        nodes = get_random_graph(120, 0.2, 1) + get_random_graph(10, 0.4, 2) + get_random_graph(10, 0.4, 3)
+        expected = {frozenset(clique) for clique in get_cliques_bron_kerbosch(nodes)}
+        for engine in ('bron_kerbosch', 'bron_kerbosch_bitset'):
+            with self.subTest(engine=engine):
+                cliques = [frozenset(clique) for clique in get_cliques_parallel(nodes, 3, engine)]
+                self.assertEqual(len(cliques), len(expected))
+                self.assertEqual(set(cliques), expected)
+        with self.subTest("get_cliques"):
+            self.assertEqual({frozenset(clique) for clique in get_cliques(nodes, 'bron_kerbosch', workers=2)},
+                             expected)
+        with self.subTest("Graph"):
+            graph = Graph.from_nodes(nodes)
+            self.assertEqual({frozenset(nodes[v] for v in clique) for clique in get_cliques_parallel(graph, 2)},
+                             expected)
+
+    def test_kellerman_covers_edges(self):
+        nodes = get_random_graph(60, 0.2, 4) + get_random_graph(10, 0.4, 5)
+        cliques = list(get_cliques_parallel(nodes, 2, 'kellerman'))
+        for node in nodes:
+            for neighbour in node.adjacent:
+                self.assertTrue(any(node in clique and neighbour in clique for clique in cliques))
+
+    def test_cliques_streamed_in_chunks(self):
+        nodes = get_random_graph(60, 0.3, 6)
+        expected = {frozenset(clique) for clique in get_cliques_bron_kerbosch(nodes)}
+        (chunk_size, queued_chunks) = (parallel.CHUNK_SIZE, parallel.QUEUED_CHUNKS)
+        # The workers are forked with the small chunks, and a single Kellerman task streams many of them
+        parallel.CHUNK_SIZE = 3
+        parallel.QUEUED_CHUNKS = 2
+        try:
+            for engine in ('bron_kerbosch', 'kellerman'):
+                with self.subTest(engine=engine):
+                    cliques = [frozenset(clique) for clique in get_cliques_parallel(nodes, 2, engine)]
+                    if engine == 'bron_kerbosch':
+                        self.assertEqual(len(cliques), len(expected))
+                        self.assertEqual(set(cliques), expected)
+                    else:
+                        self.assertGreater(len(cliques), 2 * parallel.CHUNK_SIZE)
+            # Stopping early does not wait for the workers blocked on the full queue
+            cliques = get_cliques_parallel(nodes, 2, 'bron_kerbosch')
+            next(cliques)
+            cliques.close()
+        finally:
+            (parallel.CHUNK_SIZE, parallel.QUEUED_CHUNKS) = (chunk_size, queued_chunks)
+
+    def test_lost_tasks_raise(self):
+        nodes = get_random_graph(30, 0.3, 7)
+        (solve, poll_seconds) = (parallel._solve, parallel.POLL_SECONDS)
+        parallel.POLL_SECONDS = 0.05
+        try:
+            for (task, error) in ((_fail, ValueError), (_end_worker, RuntimeError)):
+                with self.subTest(task=task.__name__):
+                    parallel._solve = task
+                    with self.assertRaises(error):
+                        list(get_cliques_parallel(nodes, 2, 'bron_kerbosch'))
+        finally:
+            (parallel._solve, parallel.POLL_SECONDS) = (solve, poll_seconds)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+import os
+import tempfile
+import unittest
+
+from .. import Graph, CliquePlanner, get_cliques
+from ..generators import get_random_graph
+
+
+class TestCliquePlanner(unittest.TestCase):
+    def setUp(self):
+        # A sparse and a dense component
+        self.nodes = get_random_graph(60, 0.05, 1) + get_random_graph(30, 0.7, 2)
+
+    def _assert_cover(self, nodes, cliques):
+        for clique in cliques:
+            for node in clique:
+                self.assertEqual(clique - node.adjacent, {node})
+        for node in nodes:
+            for neighbour in node.adjacent:
+                self.assertTrue(any(node in clique and neighbour in clique for clique in cliques))
+
+    def test_plan_per_component(self):
+        planner = CliquePlanner()
+        cliques = list(get_cliques(self.nodes, planner=planner))
+        self._assert_cover(self.nodes, cliques)
+        self.assertEqual(sum(len(plan.component) for plan in planner.plans), len(self.nodes))
+        for plan in planner.plans:
+            self.assertEqual(plan.engine, min(plan.costs, key=plan.costs.get))
+        explanation = planner.explain()
+        self.assertIn('Planned {} components'.format(len(planner.plans)), explanation)
+        for plan in planner.plans:
+            self.assertIn(plan.engine, explanation)
+
+    def test_graph(self):
+        planner = CliquePlanner(('bron_kerbosch', 'bron_kerbosch_bitset'))
+        graph = Graph.from_nodes(self.nodes)
+        cliques = [{self.nodes[v] for v in clique} for clique in planner.get_cliques(graph)]
+        expected = {frozenset(clique) for clique in get_cliques(self.nodes, 'bron_kerbosch')}
+        self.assertEqual({frozenset(clique) for clique in cliques}, expected)
+
+    def test_calibrate(self):
+        planner = CliquePlanner(('bron_kerbosch', 'kellerman'), coefficients={})
+        with self.assertRaises(ValueError):
+            planner.plan(self.nodes)
+        coefficients = planner.calibrate(sizes=(8, 16, 24), densities=(0.1, 0.3, 0.6))
+        self.assertEqual(set(coefficients), {'bron_kerbosch', 'kellerman'})
+        (handle, path) = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            planner.save(path)
+            self.assertEqual(CliquePlanner.load(path).coefficients, coefficients)
+        finally:
+            os.remove(path)
+        self._assert_cover(self.nodes, list(planner.get_cliques(self.nodes)))
+
+    def test_density_is_a_feature(self):
+        features = {'nodes': 50, 'edges': 300, 'degeneracy': 10, 'density': 0.25, 'expected_cliques': 1000.0}
+        planner = CliquePlanner(('bron_kerbosch',), coefficients={'bron_kerbosch': [0.0, 0.0, 0.0, 0.0, 1.0, 0.0]})
+        self.assertAlmostEqual(planner.predict(features)['bron_kerbosch'], math.exp(0.25))
+        # A model from before density was a feature has to be calibrated again
+        planner = CliquePlanner(('bron_kerbosch',), coefficients={'bron_kerbosch': [0.0] * 5})
+        with self.assertRaises(ValueError):
+            planner.predict(features)
+
+
+if __name__ == '__main__':
+    unittest.main()
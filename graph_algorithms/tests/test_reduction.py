@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from .. import Node, Graph, NodeGraph, Reduction, get_cliques, get_cliques_bron_kerbosch, get_cliques_reduced
+from ..generators import get_random_graph, get_power_law_graph, get_disjoint_union, _connect
+from ..reduction import get_twins
+
+
+def _frozen(cliques) -> set:
+    return {frozenset(clique) for clique in cliques}
+
+
+def _named(cliques) -> set:
+    return {frozenset(node.name for node in clique) for clique in cliques}
+
+
+def _get_tree_with_core(size: int) -> [Node]:
+    # A dense core with pendant paths, triangles and an isolated vertex hanging off it
+    core = get_random_graph(size, 0.6, seed=3)
+    nodes = list(core)
+    for (i, node) in enumerate(core):
+        previous = node
+        for j in range(i % 3):
+            leaf = Node('p{}_{}'.format(i, j))
+            _connect(leaf, previous)
+            nodes.append(leaf)
+            previous = leaf
+        if i % 4 == 0:
+            corner = Node('t{}'.format(i))
+            _connect(corner, node)
+            _connect(corner, core[(i + 1) % size])
+            nodes.append(corner)
+    nodes.append(Node('isolated'))
+    return nodes
+
+
+class TestReduction(unittest.TestCase):
+    def test_same_cliques(self):
+        graphs = [get_random_graph(60, p, seed=i) for (i, p) in enumerate((0.02, 0.05, 0.1, 0.3, 0.7))]
+        graphs.append(get_power_law_graph(150, 2, seed=1))
+        graphs.append(_get_tree_with_core(12))
+        graphs.append(get_disjoint_union(get_random_graph(8, 1.0), get_random_graph(5, 0.0)))
+        for (i, nodes) in enumerate(graphs):
+            expected = _named(get_cliques_bron_kerbosch(nodes))
+            for engine in ('bron_kerbosch', 'bron_kerbosch_bitset'):
+                with self.subTest(graph=i, engine=engine):
+                    cliques = list(get_cliques_reduced(nodes, engine))
+                    self.assertEqual(len(cliques), len(expected))
+                    self.assertEqual(_named(cliques), expected)
+
+    def test_graph(self):
+        nodes = _get_tree_with_core(10)
+        graph = Graph.from_nodes(nodes)
+        expected = _frozen(get_cliques_bron_kerbosch(graph))
+        cliques = list(get_cliques_reduced(graph, 'bron_kerbosch'))
+        self.assertEqual(len(cliques), len(expected))
+        self.assertEqual(_frozen(cliques), expected)
+        self.assertEqual(_named(get_cliques_reduced(NodeGraph(nodes))), _named(get_cliques_bron_kerbosch(nodes)))
+
+    def test_twins(self):
+        # 0 and 1 have the same closed neighbourhood, 2 and 3 only the same open one
+        graph = Graph.from_adjacency_dict({0: [1, 2, 3, 4], 1: [2, 3, 4], 2: [4], 3: [4], 4: [5]})
+        representative, twins = get_twins(graph)
+        self.assertEqual(list(representative), [0, 0, 2, 3, 4, 5])
+        self.assertEqual(twins, {0: [1]})
+        reduction = Reduction()
+        cliques = list(get_cliques_reduced(graph, reduction=reduction))
+        self.assertEqual(_frozen(cliques), _frozen(get_cliques_bron_kerbosch(graph)))
+        self.assertEqual(reduction.twins, 1)
+
+    def test_kellerman_cover(self):
+        nodes = _get_tree_with_core(10)
+        edges = {frozenset((u, v)) for u in nodes for v in u.adjacent}
+        for engine in ('kellerman', 'kellerman_bitset'):
+            with self.subTest(engine=engine):
+                covered = set()
+                for clique in get_cliques_reduced(nodes, engine):
+                    covered.update(frozenset((u, v)) for u in clique for v in clique if u != v)
+                self.assertEqual(covered, edges)
+
+    def test_report(self):
+        size = 12
+        nodes = _get_tree_with_core(size)
+        reduction = Reduction()
+        cliques = list(get_cliques(nodes, 'bron_kerbosch', reduction=reduction))
+        self.assertEqual(_named(cliques), _named(get_cliques_bron_kerbosch(nodes)))
+        self.assertEqual(reduction.nodes, len(nodes))
+        self.assertEqual(reduction.edges, Graph.from_nodes(nodes).number_of_edges)
+        self.assertEqual(reduction.isolated, 1)
+        self.assertGreater(reduction.pendant, 0)
+        self.assertGreater(reduction.simplicial, 0)
+        self.assertEqual(reduction.eliminated_nodes, len(nodes) - reduction.kernel_nodes)
+        self.assertEqual(reduction.twins + reduction.isolated + reduction.pendant + reduction.simplicial,
+                         reduction.eliminated_nodes)
+        self.assertLessEqual(reduction.direct_cliques, len(cliques))
+        self.assertGreater(reduction.eliminated_fraction, 0.5)
+        self.assertIn('eliminated', str(reduction))
+        self.assertEqual(reduction.as_dict()['kernel_nodes'], reduction.kernel_nodes)
+
+    def test_forest_has_no_kernel(self):
+        nodes = [Node(str(i)) for i in range(200)]
+        for i in range(1, len(nodes)):
+            if i % 7 != 0:
+                _connect(nodes[i], nodes[(i * 31) % i])
+        reduction = Reduction()
+        cliques = list(get_cliques(nodes, 'bron_kerbosch', reduction=reduction))
+        self.assertEqual(_named(cliques), _named(get_cliques_bron_kerbosch(nodes)))
+        self.assertEqual(reduction.kernel_nodes, 0)
+        self.assertEqual(reduction.direct_cliques, len(cliques))
+
+    def test_invalid(self):
+        nodes = get_random_graph(10, 0.5, seed=1)
+        with self.assertRaises(ValueError):
+            get_cliques(nodes, reduction=Reduction(), min_size=3)
+        with self.assertRaises(ValueError):
+            get_cliques(nodes, reduction=Reduction(), workers=2)
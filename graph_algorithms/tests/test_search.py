@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+import unittest
+
+from .. import Graph, CliqueSearch, get_cliques, get_cliques_bron_kerbosch, get_cliques_bron_kerbosch_bitset
+from ..generators import get_random_graph
+
+
+class TestBoundedSearch(unittest.TestCase):
+    def setUp(self):
+        self.nodes = get_random_graph(60, 0.3, 1)
+        self.graph = Graph.from_nodes(self.nodes)
+        self.cliques = {frozenset(clique) for clique in get_cliques_bron_kerbosch(self.nodes)}
+
+    def _engines(self):
+        for engine in (get_cliques_bron_kerbosch, get_cliques_bron_kerbosch_bitset):
+            yield engine.__name__, self.nodes, engine
+            yield engine.__name__ + " on Graph", self.graph, engine
+
+    def _as_nodes(self, graph, cliques):
+        if graph is self.graph:
+            return {frozenset(self.nodes[v] for v in clique) for clique in cliques}
+        return {frozenset(clique) for clique in cliques}
+
+    def test_size_bounds(self):
+        for (name, graph, engine) in self._engines():
+            for (min_size, max_size) in ((3, None), (4, None), (1, 2), (3, 3)):
+                with self.subTest(engine=name, min_size=min_size, max_size=max_size):
+                    search = engine(graph, min_size=min_size, max_size=max_size)
+                    expected = {clique for clique in self.cliques
+                                if len(clique) >= min_size and (max_size is None or len(clique) <= max_size)}
+                    self.assertEqual(self._as_nodes(graph, search), expected)
+                    self.assertFalse(search.truncated)
+
+    def test_max_cliques(self):
+        for (name, graph, engine) in self._engines():
+            with self.subTest(engine=name):
+                search = engine(graph, max_cliques=10)
+                cliques = self._as_nodes(graph, search)
+                self.assertEqual(len(cliques), 10)
+                self.assertTrue(cliques <= self.cliques)
+                self.assertTrue(search.truncated)
+                search = engine(graph, max_cliques=len(self.cliques))
+                self.assertEqual(self._as_nodes(graph, search), self.cliques)
+                self.assertFalse(search.truncated)
+
+    def test_deadline(self):
+        for (name, graph, engine) in self._engines():
+            with self.subTest(engine=name):
+                search = engine(graph, deadline=0)
+                self.assertEqual(list(search), [])
+                self.assertTrue(search.truncated)
+
+    def test_cancel(self):
+        for (name, graph, engine) in self._engines():
+            with self.subTest(engine=name):
+                search = engine(graph, deadline=math.inf)
+                self.assertTrue(search.is_pruning)
+                next(search)
+                search.cancel()
+                self.assertEqual(list(search), [])
+                self.assertTrue(search.truncated)
+                complete = engine(graph, deadline=math.inf)
+                self.assertEqual(self._as_nodes(graph, complete), self.cliques)
+                self.assertFalse(complete.truncated)
+
+    def test_get_cliques(self):
+        search = get_cliques(self.nodes, min_size=4)
+        self.assertIsInstance(search, CliqueSearch)
+        self.assertEqual({frozenset(clique) for clique in search}, {c for c in self.cliques if len(c) >= 4})
+        with self.assertRaises(ValueError):
+            get_cliques(self.nodes, 'kellerman', min_size=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+from multiprocessing import Pool, shared_memory
+
+from .. import Graph, SharedGraph, get_cliques, get_cliques_parallel, get_components, get_degeneracy_ordering
+from ..engines import ENGINES
+from ..generators import get_random_graph, get_disjoint_union
+
+
+def _frozen(cliques) -> set:
+    return {frozenset(clique) for clique in cliques}
+
+
+def _count_cliques(name: str) -> (int, int):
+    with SharedGraph.attach(name) as shared:
+        return len(list(get_cliques(shared.graph, 'bron_kerbosch'))), len(get_components(shared.graph))
+
+
+class TestSharedGraph(unittest.TestCase):
+    def setUp(self):
+        nodes = get_disjoint_union(get_random_graph(80, 0.2, seed=1), get_random_graph(10, 0.5, seed=2))
+        self.graph = Graph.from_nodes(nodes)
+
+    def test_export_and_attach(self):
+        with SharedGraph(self.graph) as shared:
+            self.assertTrue(shared.is_owner)
+            with SharedGraph.attach(shared.name) as attached:
+                self.assertFalse(attached.is_owner)
+                graph = attached.graph
+                self.assertEqual(list(graph.offsets), list(self.graph.offsets))
+                self.assertEqual(list(graph.neighbours), list(self.graph.neighbours))
+                (d, ordering) = get_degeneracy_ordering(self.graph)
+                self.assertEqual(get_degeneracy_ordering(graph)[0], d)
+                self.assertEqual(list(get_degeneracy_ordering(graph)[1]), list(ordering))
+                self.assertEqual(get_components(graph), get_components(self.graph))
+                self.assertEqual([attached.rank[v] for v in ordering], list(range(len(graph))))
+                for engine in ENGINES:
+                    with self.subTest(engine=engine):
+                        self.assertEqual(_frozen(ENGINES[engine](graph)), _frozen(ENGINES[engine](self.graph)))
+            name = shared.name
+        with self.assertRaises(FileNotFoundError):
+            SharedGraph.attach(name)
+
+    def test_attached_is_read_only(self):
+        with SharedGraph(self.graph) as shared:
+            with SharedGraph.attach(shared.name) as attached:
+                for values in (attached.graph.offsets, attached.graph.neighbours, attached.rank):
+                    with self.assertRaises(TypeError):
+                        values[0] = 1
+            self.assertEqual(list(shared.graph.neighbours), list(self.graph.neighbours))
+
+    def test_workers(self):
+        expected = len(list(get_cliques(self.graph, 'bron_kerbosch')))
+        with SharedGraph(self.graph) as shared:
+            with Pool(2) as pool:
+                self.assertEqual(pool.map(_count_cliques, [shared.name] * 3), [(expected, 2)] * 3)
+            cliques = _frozen(get_cliques_parallel(shared, 2))
+            self.assertEqual(cliques, _frozen(get_cliques(self.graph, 'bron_kerbosch')))
+            self.assertEqual(_frozen(get_cliques(shared, 'bron_kerbosch', workers=2)), cliques)
+            self.assertEqual(_frozen(get_cliques(shared, 'bron_kerbosch')), cliques)
+            # Still open after the workers are done
+            with SharedGraph.attach(shared.name) as attached:
+                self.assertEqual(len(attached.graph), len(self.graph))
+
+    def test_empty(self):
+        with SharedGraph(Graph.from_nodes([])) as shared:
+            self.assertEqual(len(shared.graph), 0)
+            self.assertEqual(list(get_cliques(shared.graph)), [])
+
+    def test_not_a_shared_graph(self):
+        memory = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            with self.assertRaises(ValueError):
+                SharedGraph.attach(memory.name)
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import contextlib
+import io
+import math
+import unittest
+
+from .. import Graph, expected_maximal_cliques_in_random_graph, get_components, get_degeneracy_ordering, \
+    print_statistics
+from ..generators import get_random_graph, get_disjoint_union
+from ..node import log_expected_maximal_cliques_in_random_graph
+from ..summary import graph_statistics, log_expected_maximal_cliques, numpy
+
+
+def _product_formula(nodes, p):
+    return sum(math.comb(nodes, k) * p ** (k * (k - 1) // 2) * (1 - p ** k) ** (nodes - k) for k in range(1, nodes + 1))
+
+
+class TestGraphStatistics(unittest.TestCase):
+    def test_statistics(self):
+        nodes = get_disjoint_union(get_random_graph(100, 0.1, seed=1), *(get_random_graph(6, 0.5, seed=i)
+                                                                          for i in range(10)))
+        statistics = graph_statistics(nodes)
+        graph = Graph.from_nodes(nodes)
+        self.assertEqual(statistics.nodes, 160)
+        self.assertEqual(statistics.edges, graph.number_of_edges)
+        self.assertEqual(statistics.max_degree, max(len(node.adjacent) for node in nodes))
+        self.assertEqual(statistics.min_degree, min(len(node.adjacent) for node in nodes))
+        self.assertAlmostEqual(statistics.density, 2 * graph.number_of_edges / 160 / 159)
+        self.assertEqual(statistics.degeneracy, get_degeneracy_ordering(nodes)[0])
+        components = get_components(graph)
+        self.assertEqual(statistics.component_sizes, [len(component) for component in components])
+        self.assertEqual(sum(statistics.component_edges), statistics.edges)
+        for (size, edges, expected) in zip(statistics.component_sizes, statistics.component_edges,
+                                           statistics.component_expected_cliques):
+            density = 2 * edges / size / (size - 1) if size > 1 else 0
+            self.assertAlmostEqual(expected, expected_maximal_cliques_in_random_graph(size, density))
+        self.assertAlmostEqual(statistics.total_component_expected_cliques,
+                               sum(statistics.component_expected_cliques))
+        self.assertEqual(str(graph_statistics(graph)), str(statistics))
+
+    def test_print_statistics(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            print_statistics(get_random_graph(30, 0.2, seed=2))
+        self.assertIn('Components', output.getvalue())
+        self.assertIn('Degeneracy', output.getvalue())
+
+    def test_empty_graph(self):
+        statistics = graph_statistics([])
+        self.assertEqual(statistics.nodes, 0)
+        self.assertEqual(statistics.number_of_components, 0)
+        self.assertEqual(statistics.expected_cliques, 0)
+        str(statistics)
+
+
+class TestExpectedCliques(unittest.TestCase):
+    def test_product_formula(self):
+        for nodes in (1, 2, 5, 20, 60):
+            for p in (0.0, 0.05, 0.3, 0.7, 0.95, 1.0):
+                expected = _product_formula(nodes, p)
+                self.assertAlmostEqual(expected_maximal_cliques_in_random_graph(nodes, p) / expected, 1, places=9)
+
+    def test_large_graphs(self):
+        # Isolated nodes and edges: n (1 - p) ^ (n - 1) + C(n, 2) p (1 - p ^ 2) ^ (n - 2), about n / e + n / 2
+        self.assertAlmostEqual(expected_maximal_cliques_in_random_graph(10 ** 6, 10 ** -6) / 10 ** 6,
+                               math.exp(-1) + 0.5, places=5)
+        self.assertTrue(math.isfinite(log_expected_maximal_cliques_in_random_graph(10 ** 6, 0.99)))
+        self.assertEqual(expected_maximal_cliques_in_random_graph(10 ** 6, 0.99), math.inf)
+        self.assertEqual(expected_maximal_cliques_in_random_graph(0, 0.5), 0)
+
+    def test_batch(self):
+        sizes = [0, 1, 2, 10, 100, 1000, 10 ** 6, 10 ** 6]
+        probabilities = [0.5, 0.0, 1.0, 0.3, 0.05, 0.5, 10 ** -5, 0.99]
+        expected = [log_expected_maximal_cliques_in_random_graph(n, p) for (n, p) in zip(sizes, probabilities)]
+        for (found, value) in zip(log_expected_maximal_cliques(sizes, probabilities), expected):
+            if math.isinf(value):
+                self.assertEqual(found, value)
+            else:
+                self.assertAlmostEqual(found, value, delta=1e-9 * max(1.0, abs(value)))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy(self):
+        from ..summary import _log_expected_maximal_cliques_numpy
+        sizes = [3, 17, 250, 4000, 4000]
+        probabilities = [0.4, 0.9, 0.02, 0.001, 0.6]
+        found = _log_expected_maximal_cliques_numpy(sizes, probabilities)
+        for (value, n, p) in zip(found.tolist(), sizes, probabilities):
+            self.assertAlmostEqual(value, log_expected_maximal_cliques_in_random_graph(n, p), delta=1e-8 * abs(value))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# MIT LICENSE
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys
+import threading
+import unittest
+
+from .. import Graph, get_cliques, get_components, get_core_numbers, get_degeneracy_ordering, get_k_core, \
+    graph_statistics
+from ..generators import get_random_graph, get_disjoint_union
+
+THREADS = 16
+ROUNDS = 10
+
+
+def _queries(nodes):
+    """
+    The results of the read-only queries, in a form that can be compared between threads.
+    """
+    return (
+        sorted(sorted(node.name for node in component) for component in get_components(nodes)),
+        [node.name for node in get_degeneracy_ordering(nodes)[1]],
+        sorted((node.name, core) for (node, core) in get_core_numbers(nodes).items()),
+        sorted(node.name for node in get_k_core(nodes, 3)),
+        str(graph_statistics(nodes)),
+        sorted(sorted(node.name for node in clique) for clique in get_cliques(nodes))
+    )
+
+
+def _graph_queries(graph):
+    return (
+        sorted(sorted(component) for component in get_components(graph)),
+        list(get_degeneracy_ordering(graph)[1]),
+        list(get_core_numbers(graph)),
+        str(graph_statistics(graph)),
+        sorted(sorted(clique) for clique in get_cliques(graph))
+    )
+
+
+class TestThreads(unittest.TestCase):
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        # Switch threads as often as possible, so that the queries interleave
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def _run(self, queries, target):
+        expected = queries(target)
+        results = []
+        errors = []
+        start = threading.Barrier(THREADS)
+
+        def work():
+            try:
+                start.wait()
+                for _ in range(ROUNDS):
+                    results.append(queries(target))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=work) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), THREADS * ROUNDS)
+        for result in results:
+            self.assertEqual(result, expected)
+
+    def test_shared_nodes(self):
+        nodes = get_disjoint_union(get_random_graph(60, 0.15, seed=1), *(get_random_graph(8, 0.5, seed=i)
+                                                                         for i in range(5)))
+        self._run(_queries, nodes)
+
+    def test_shared_graph(self):
+        nodes = get_random_graph(80, 0.1, seed=2)
+        self._run(_graph_queries, Graph.from_nodes(nodes))
+
+
+if __name__ == '__main__':
+    unittest.main()